@@ -1,9 +1,28 @@
 # app.py - SIMPLE WORKING VERSION
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, g, request, jsonify, render_template, send_file, send_from_directory
+import json
 import logging
-from datetime import datetime
+import mimetypes
+import re
+import time
+from datetime import datetime, timezone
 import os
 
+from assets import asset_manifest
+from broadcaster import TooManySubscribers, broadcaster
+from compression import choose_encoding, compress_response, mark_compressed
+from config import config
+from database import db
+from ingest import InvalidUpdate, QueueFull, enqueue_post, ingest_queue, parse_update, recent_updates
+from log_sink import install_log_sink
+from media_cache import MediaNotFound, media_cache, sniff_mimetype
+from metrics import metrics
+from pagination import InvalidCursor, decode_cursor, paginate
+from post_store import extract_hashtags, post_store
+from read_cache import post_cache
+from response_cache import response_cache
+from search_index import search_index
+
 # ===== LOGGING SETUP =====
 logging.basicConfig(
     level=logging.INFO,
@@ -11,13 +30,298 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Database ရှိရင် logs table ထဲကို batch လိုက် ရေးမယ့် handler တပ်မယ်
+log_sink = install_log_sink() if config.DATABASE_URL and config.LOG_SINK_ENABLED else None
+
 # ===== FLASK APP INITIALIZATION =====
+# /static ကို serve_static ကပဲ serve လုပ်မယ် (built-in static route က hashed assets ကို မသိဘူး)
 app = Flask(__name__, 
-           static_folder='static',
+           static_folder=None,
            template_folder='templates')
 
-# ===== SIMPLE STORAGE =====
-channel_posts_storage = []
+# Hashed + pre-compressed static assets (templates ထဲမှာ asset_url() နဲ့ ညွှန်းမယ်)
+try:
+    asset_manifest.build()
+except OSError as e:
+    logger.error(f"❌ Static asset build error: {e}")
+app.add_template_global(asset_manifest.url, 'asset_url')
+
+MAX_PAGE_SIZE = 100
+MAX_TAGS = 200
+MEDIA_FILE_ID_RE = re.compile(r'[A-Za-z0-9_-]{1,256}')
+POST_KEY_RE = re.compile(r'(?:(-?\d+):)?(\d+)')
+MEDIA_MAX_AGE = 365 * 24 * 3600
+STATIC_MAX_AGE = 365 * 24 * 3600
+
+# ===== HELPERS =====
+
+def post_key(post):
+    """Post store / Postgres နှစ်ခုလုံးမှာ တူတဲ့ post identifier (row id တွေက backend အလိုက် ကွဲတယ်)"""
+    return f"{post.get('channel_id')}:{post.get('post_id')}"
+
+def parse_post_key(value):
+    """/api/posts/<post_key> → (channel_id, post_id) - "<channel_id>:<message_id>" (format_post id)
+    သို့မဟုတ် message_id တစ်ခုတည်း (CHANNEL_ID ထဲက) - ပုံစံမမှန်ရင် None"""
+    match = POST_KEY_RE.fullmatch(value)
+    if not match:
+        return None
+    channel_id = match.group(1) or config.CHANNEL_ID
+    return int(channel_id), int(match.group(2))
+
+def format_post(post):
+    """Store row (သို့) Postgres row ကို frontend format အဖြစ် ပြောင်းမယ်"""
+    content = post.get('content') or ''
+    title = content[:100] + '...' if len(content) > 100 else content or 'No title'
+    
+    return {
+        'id': post_key(post),
+        'telegram_message_id': post.get('post_id'),
+        'post_title': title,
+        'post_description': content or 'No description available',
+        'tags': ','.join(extract_hashtags(content, post.get('caption'))),
+        'file_url': post.get('media_url'),
+        'thumbnail_url': (f"{post['media_url']}?thumb=1" if post.get('media_url') and post.get('message_type') == 'photo'
+                          and media_cache.supports_thumbnails else None),
+        'media_type': post.get('message_type'),
+        'date': post.get('date'),
+        'created_at': post.get('created_at') or datetime.now().isoformat()
+    }
+
+def parse_since(value):
+    """since= ကို (version, timestamp) အဖြစ် ခွဲမယ် - integer ဆို version, ISO 8601 ဆို timestamp"""
+    if value.isdigit():
+        return int(value), None
+    
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        # Store ထဲမှာ local naive time နဲ့ သိမ်းထားတယ်
+        moment = moment.astimezone().replace(tzinfo=None)
+    return 0, moment.isoformat()
+
+def iso_row(row):
+    """Postgres row ရဲ့ timestamps တွေကို store rows တွေလို ISO strings အဖြစ်"""
+    return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in row.items()}
+
+def search(query, limit, offset):
+    """DATABASE_URL ရှိရင် Postgres GIN index (ts_rank)၊ မရှိရင် in-memory inverted index - (rows, total)"""
+    if not config.DATABASE_URL:
+        return search_index.search(query, limit, offset)
+    rows, total = db.search_channel_posts(query, limit, offset)
+    return [iso_row(row) for row in rows], total
+
+def arg_int(args, name, default):
+    """request.args.get(name, default, type=int) လို - integer မဟုတ်ရင် default (WSGI / ASGI နှစ်ခုလုံး)"""
+    try:
+        return int(args[name])
+    except (KeyError, TypeError, ValueError):
+        return default
+
+def search_page(args):
+    """/api/search response body (q မပါရင် ValueError)"""
+    query = (args.get('q') or '').strip()
+    if not query:
+        raise ValueError("Missing search query (q)")
+    limit = min(max(arg_int(args, 'limit', 20), 1), MAX_PAGE_SIZE)
+    offset = max(arg_int(args, 'offset', 0), 0)
+    rows, total = search(query, limit, offset)
+    return build_search_page(rows, total, limit, offset)
+
+def build_search_page(rows, total, limit, offset):
+    """/api/search response body"""
+    return {
+        "posts": [format_post(post) for post in rows],
+        "total": total,
+        "next_offset": offset + limit if offset + limit < total else None
+    }
+
+def parse_tag(value):
+    """tag= ကို store ထဲက tag name အဖြစ် ပြောင်းမယ် (#news / News → news)"""
+    tag = value.strip().lstrip('#').lower()
+    if not tag:
+        raise ValueError("Empty tag")
+    return tag
+
+def not_modified(etag, last_modified):
+    """Client cache က store version နဲ့ ကိုက်နေရင် 304 response ပြန်ပေးမယ်"""
+    if request.if_none_match:
+        # Compressed responses တွေက weak ETag (W/"...") နဲ့ ပြန်လာမယ်
+        fresh = request.if_none_match.contains_weak(etag)
+    elif request.if_modified_since and last_modified:
+        fresh = last_modified <= request.if_modified_since.timestamp()
+    else:
+        fresh = False
+    
+    if not fresh:
+        return None
+    return add_validators(Response(status=304), etag, last_modified)
+
+def posts_query(args):
+    """/api/posts query params → (response cache key, build(version)) - မမှန်ရင် InvalidCursor / ValueError"""
+    limit = min(max(arg_int(args, 'limit', 50), 1), MAX_PAGE_SIZE)
+    cursor = args.get('cursor')
+    since = args.get('since')
+    tag = args.get('tag')
+    
+    position = decode_cursor(cursor) if cursor else None
+    since_version, since_timestamp = parse_since(since) if since else (None, None)
+    tag = parse_tag(tag) if tag is not None else None
+    if tag and since:
+        raise ValueError("tag cannot be combined with since")
+    
+    def build(version):
+        return build_posts_page(limit, position, since, since_version, since_timestamp, version, tag)
+    return ('posts', limit, cursor, since, tag), build
+
+def build_posts_page(limit, position, since, since_version, since_timestamp, version, tag=None):
+    """/api/posts response body (cursor page သို့မဟုတ် since= delta၊ tag ပေးရင် tag index ကနေ)"""
+    if since:
+        # Delta sync: since နောက်ပိုင်း အသစ်/ပြင်ထားတဲ့ posts တွေပဲ
+        rows = post_store.get_posts_since(since_version, since_timestamp, limit + 1)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "posts": [format_post(post) for post in rows],
+            "version": rows[-1]['version'] if has_more else version,
+            "has_more": has_more
+        }
+    
+    # Next page ရှိမရှိ သိအောင် row တစ်ခု ပိုယူမယ်
+    rows, next_cursor = paginate(post_store.get_posts(limit + 1, position, tag), limit)
+    return {
+        "posts": [format_post(post) for post in rows],
+        "next_cursor": next_cursor,
+        "version": version
+    }
+
+def dispatch_bot_update(data):
+    """Commands / messages တွေကို bot ရဲ့ event loop ဆီ ပို့မယ် (response ကို မစောင့်ဘူး)"""
+    # Bot module (telegram + database) ကို token ရှိမှ load လုပ်မယ်
+    from telegram_bot import submit_update
+    submit_update(data)
+
+def handle_webhook(data):
+    """Webhook update တစ်ခုကို validate/dedup ပြီး queue (သို့) bot ဆီ ပို့မယ် - (body, status)
+
+    WSGI route နဲ့ ASGI mode (asgi.py) နှစ်ခုလုံး သုံးတယ်။
+    """
+    try:
+        logger.info(f"📩 Webhook received")
+        
+        # Validate ပြီး queue ထဲထည့်မယ် - save ကို background writer က batch လိုက် လုပ်မယ်
+        try:
+            post_data = parse_update(data)
+        except InvalidUpdate as e:
+            return {"status": "error", "message": str(e)}, 400
+        
+        if not post_data and not config.TOKEN:
+            return {"status": "ok"}, 200
+        
+        # Telegram retries (update_id တူ) တွေကို ဘာမှမလုပ်ဘဲ 200 ပြန်မယ်
+        update_id = data.get('update_id')
+        if isinstance(update_id, int) and not recent_updates.claim(update_id):
+            logger.info(f"🔁 Duplicate update ignored: {update_id}")
+            return {"status": "ok", "duplicate": True}, 200
+        
+        try:
+            if post_data:
+                enqueue_post(post_data)
+                logger.info(f"📥 Channel post queued: {post_data['message_id']}")
+            else:
+                dispatch_bot_update(data)
+                if isinstance(update_id, int):
+                    post_store.mark_updates([update_id])
+        except QueueFull as e:
+            # Telegram က နောက်မှ ပြန်ပို့ပါလိမ့်မယ် (backpressure)
+            if isinstance(update_id, int):
+                recent_updates.release(update_id)
+            logger.warning(f"⚠️ Queue full: {e}")
+            return {"status": "busy", "message": str(e)}, 503
+        
+        return {"status": "ok"}, 200
+    except Exception as e:
+        logger.error(f"❌ Webhook error: {e}")
+        return {"status": "error", "message": str(e)}, 500
+
+def health_status():
+    """/health response body"""
+    return {
+        "status": "healthy",
+        "posts_count": post_store.count(),
+        "ingest": ingest_queue.get_stats(),
+        "dedup": recent_updates.get_stats(),
+        "response_cache": response_cache.get_stats(),
+        "post_cache": post_cache.get_stats(),
+        "log_sink": log_sink.get_stats() if log_sink else None,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def read_stats():
+    """Post counters - DATABASE_URL ရှိရင် Postgres summary tables (post အားလုံး)၊ မရှိရင် post store
+
+    Post store က retention cap (POST_STORE_MAX_POSTS) ကျော်ရင် ဖျက်ပြီး counters နုတ်တာမို့
+    Postgres ရှိရင် lifetime totals အတွက် Postgres ကိုပဲ ဖတ်မယ်။ /api/stats နဲ့ bot /stats နှစ်ခုလုံး သုံးတယ်။
+    """
+    if not config.DATABASE_URL:
+        return post_store.get_stats()
+    return iso_row(db.get_stats())
+
+def build_stats(version):
+    """/api/stats response body"""
+    stats = read_stats()
+    return {
+        "total_posts": stats['total_posts'],
+        "total_tags": post_store.count_tags(),
+        "today_posts": stats['today_posts'],
+        "type_counts": stats['type_counts'],
+        "latest_post": stats['latest_post'],
+        "version": version
+    }
+
+def build_tags(limit, version):
+    """/api/tags response body"""
+    return {
+        "tags": post_store.get_tags(limit),
+        "total": post_store.count_tags(),
+        "version": version
+    }
+
+def sse_event(post):
+    """Post row ကို SSE event (id = store version) အဖြစ် format လုပ်မယ်"""
+    data = json.dumps(format_post(post), ensure_ascii=False)
+    return f"id: {post['version']}\ndata: {data}\n\n"
+
+def add_validators(response, etag, last_modified):
+    """ETag / Last-Modified headers ထည့်မယ် (browser က အမြဲ revalidate လုပ်ရမယ်)"""
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = datetime.fromtimestamp(last_modified, timezone.utc)
+    response.cache_control.no_cache = True
+    return response
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+# compress_json အပြီးမှ run မယ် (after_request hooks တွေက ပြောင်းပြန် order နဲ့ run တယ်)
+@app.after_request
+def record_request_metrics(response):
+    """Route တစ်ခုချင်းရဲ့ latency histogram နဲ့ status counts"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe('http_request_duration_seconds', time.perf_counter() - started,
+                        route=route, method=request.method)
+        metrics.inc('http_requests_total', route=route, method=request.method,
+                    status=response.status_code)
+    return response
+
+@app.after_request
+def compress_json(response):
+    """JSON responses (threshold ကျော်ရင်) gzip/brotli နဲ့ compress လုပ်မယ်"""
+    return compress_response(
+        response, request.headers.get('Accept-Encoding'),
+        config.COMPRESSION_MIN_SIZE, config.COMPRESSION_LEVEL
+    )
 
 # ===== ROUTES =====
 
@@ -28,96 +332,217 @@ def index():
 
 @app.route('/static/<path:path>')
 def serve_static(path):
-    """Serve static files"""
-    return send_from_directory('static', path)
+    """Serve static files (hashed assets ဆို pre-compressed variant + immutable caching)"""
+    if not asset_manifest.is_hashed(path):
+        return send_from_directory('static', path)
+    
+    encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+    filename = path
+    if encoding:
+        filename = f"{path}{asset_manifest.suffix(encoding)}"
+    
+    response = send_from_directory(
+        'static', filename,
+        mimetype=mimetypes.guess_type(path)[0],
+        conditional=True,
+        max_age=STATIC_MAX_AGE
+    )
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = f"public, max-age={STATIC_MAX_AGE}, immutable"
+    return response
 
 @app.route('/health')
 def health():
     """Health check"""
-    return jsonify({
-        "status": "healthy",
-        "posts_count": len(channel_posts_storage),
-        "timestamp": datetime.now().isoformat()
-    })
+    return jsonify(health_status())
+
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus metrics (gunicorn workers အားလုံး ပေါင်းထားတယ်)"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/api/posts', methods=['GET'])
 def get_posts():
-    """Get all posts"""
+    """Get posts (cursor pagination, or since= delta sync)"""
     try:
-        limit = request.args.get('limit', 50, type=int)
+        # Store မပြောင်းသေးရင် query မလုပ်ဘဲ 304 ပြန်မယ်
+        version, last_modified = post_store.get_version()
+        etag = f"posts-{version}"
+        cached = not_modified(etag, last_modified)
+        if cached:
+            return cached
         
-        # Format posts for frontend
-        formatted_posts = []
-        for i, post in enumerate(channel_posts_storage[:limit]):
-            content = post.get('content', '')
-            title = content[:100] + '...' if len(content) > 100 else content or 'No title'
-            
-            formatted_posts.append({
-                'id': i + 1,
-                'telegram_message_id': post.get('post_id', i + 1),
-                'post_title': title,
-                'post_description': content or 'No description available',
-                'tags': 'telegram',
-                'file_url': post.get('media_url'),
-                'created_at': post.get('created_at', datetime.now().isoformat())
-            })
+        try:
+            key, build = posts_query(request.args)
+        except (InvalidCursor, ValueError) as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
         
-        return jsonify({
-            "posts": formatted_posts
-        }), 200
+        # Store version တူနေသရွေ့ encode/compress ပြီးသား body ကို ပြန်သုံးမယ်
+        body, encoding = response_cache.get_or_build_encoded(
+            key, version, lambda: build(version),
+            choose_encoding(request.headers.get('Accept-Encoding'))
+        )
+        
+        response = add_validators(Response(body, mimetype='application/json'), etag, last_modified)
+        if encoding:
+            mark_compressed(response, encoding)
+        return response, 200
     except Exception as e:
         logger.error(f"Get posts error: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
-@app.route('/api/stats', methods=['GET'])
-def get_stats():
-    """Get statistics"""
-    return jsonify({
-        "total_posts": len(channel_posts_storage),
-        "total_tags": 1,
-        "today_posts": len(channel_posts_storage)
-    }), 200
+@app.route('/api/posts/<post_key>', methods=['GET'])
+def get_post(post_key):
+    """Single post (shared links) - read-through cache ကနေ (list အကုန် မလိုဘူး)"""
+    key = parse_post_key(post_key)
+    if key is None:
+        return jsonify({"status": "error", "message": "Post not found"}), 404
+    try:
+        post = post_cache.get(key)
+    except Exception as e:
+        logger.error(f"Get post error: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+    if post is None:
+        return jsonify({"status": "error", "message": "Post not found"}), 404
+    
+    # Post ပြင်ရင် row version ပြောင်းမယ်
+    etag = f"post-{post['id']}-{post['version']}"
+    cached = not_modified(etag, None)
+    if cached:
+        return cached
+    return add_validators(jsonify(format_post(post)), etag, None), 200
 
-@app.route('/tg-hook-85379794', methods=['POST'])
-def telegram_webhook():
-    """Telegram webhook endpoint"""
+@app.route('/api/posts/stream', methods=['GET'])
+def stream_posts():
+    """Server-Sent Events stream - save လုပ်တဲ့ post အသစ်တိုင်းကို push လုပ်မယ်"""
+    # Browser က reconnect လုပ်ရင် Last-Event-ID header ပို့တယ်၊ ပထမဆုံး connect မှာ query param သုံးမယ်
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id', '')
+    
+    # Replay မလုပ်ခင် subscribe လုပ်ထားမှ ကြားထဲက posts တွေ မလွတ်မှာ
+    # Stream တစ်ခုက worker thread တစ်ခု ကိုင်ထားတာမို့ cap ကျော်ရင် 503 - client က polling နဲ့ ဆက်သွားမယ်
     try:
-        data = request.get_json()
-        logger.info(f"📩 Webhook received")
-        
-        # Process channel posts
-        if 'channel_post' in data:
-            channel_post = data['channel_post']
-            
-            # Extract post data
-            post_id = channel_post.get('message_id')
+        subscriber = broadcaster.subscribe(limit=config.SSE_MAX_STREAMS)
+    except TooManySubscribers as e:
+        logger.warning(f"⚠️ SSE stream rejected: {e}")
+        response = jsonify({"status": "busy", "message": str(e)})
+        response.headers['Retry-After'] = str(int(config.SSE_HEARTBEAT_INTERVAL))
+        return response, 503
+    
+    def generate():
+        try:
+            yield f"retry: {int(config.SSE_HEARTBEAT_INTERVAL * 1000)}\n\n"
             
-            # Get content
-            content = ''
-            if 'text' in channel_post:
-                content = channel_post['text']
-            elif 'caption' in channel_post:
-                content = channel_post['caption']
+            if last_event_id.isdigit():
+                sent_version = int(last_event_id)
+                rows = post_store.get_posts_since(sent_version, limit=config.SSE_REPLAY_LIMIT + 1)
+                if len(rows) > config.SSE_REPLAY_LIMIT:
+                    # အရမ်းနောက်ကျနေရင် client ကို full reload လုပ်ခိုင်းမယ်
+                    sent_version, _ = post_store.get_version()
+                    yield f"id: {sent_version}\nevent: reset\ndata: {{}}\n\n"
+                else:
+                    for post in rows:
+                        sent_version = post['version']
+                        yield sse_event(post)
+            else:
+                sent_version, _ = post_store.get_version()
             
-            # Save to storage
-            post_data = {
-                'post_id': post_id,
-                'message_type': 'telegram',
-                'content': content,
-                'created_at': datetime.now().isoformat()
-            }
+            while not subscriber.overflowed:
+                rows = subscriber.get(timeout=config.SSE_HEARTBEAT_INTERVAL)
+                if not rows:
+                    # Heartbeat - proxies တွေ connection မပိတ်အောင်၊ disconnect ဖြစ်ရင်လည်း သိအောင်
+                    yield ": ping\n\n"
+                    continue
+                for post in rows:
+                    if post['version'] > sent_version:
+                        sent_version = post['version']
+                        yield sse_event(post)
             
-            channel_posts_storage.append(post_data)
-            logger.info(f"✅ Channel post saved: {post_id}")
-        
-        return jsonify({"status": "ok"}), 200
+            # Buffer overflow - connection ပိတ်ပြီး client က Last-Event-ID နဲ့ ပြန်ချိတ်ပါလိမ့်မယ်
+            logger.warning("⚠️ SSE client too slow, closing stream")
+        finally:
+            broadcaster.unsubscribe(subscriber)
+    
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+    # Generator မစခင် client ထွက်သွားရင်လည်း unsubscribe ဖြစ်အောင်
+    response.call_on_close(lambda: broadcaster.unsubscribe(subscriber))
+    return response
+
+@app.route('/api/search', methods=['GET'])
+def search_posts():
+    """Server-side search (Postgres full-text သို့မဟုတ် in-memory inverted index, ranked + paginated)"""
+    try:
+        return jsonify(search_page(request.args)), 200
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     except Exception as e:
-        logger.error(f"❌ Webhook error: {e}")
+        logger.error(f"Search error: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    """Get statistics"""
+    version, last_modified = post_store.get_version()
+    etag = f"stats-{version}"
+    cached = not_modified(etag, last_modified)
+    if cached:
+        return cached
+    
+    response = jsonify(build_stats(version))
+    return add_validators(response, etag, last_modified), 200
+
+@app.route('/api/tags', methods=['GET'])
+def get_tags():
+    """Post အများဆုံးပါတဲ့ hashtags (tag index ကနေ - posts တွေကို client မှာ scan စရာမလိုဘူး)"""
+    limit = min(max(arg_int(request.args, 'limit', 50), 1), MAX_TAGS)
+    version, last_modified = post_store.get_version()
+    etag = f"tags-{version}-{limit}"
+    cached = not_modified(etag, last_modified)
+    if cached:
+        return cached
+    
+    response = jsonify(build_tags(limit, version))
+    return add_validators(response, etag, last_modified), 200
+
+@app.route('/media/<file_id>', methods=['GET'])
+def get_media(file_id):
+    """Post media (on-disk cache ကနေ - Range / conditional requests ရတယ်)"""
+    if not MEDIA_FILE_ID_RE.fullmatch(file_id):
+        return jsonify({"status": "error", "message": "Invalid file id"}), 404
+    thumb = request.args.get('thumb') == '1'
+    
+    try:
+        path = media_cache.thumbnail(file_id) if thumb else media_cache.get(file_id)
+    except MediaNotFound:
+        return jsonify({"status": "error", "message": "Media not found"}), 404
+    except Exception as e:
+        logger.error(f"Media fetch error ({file_id}): {e}")
+        return jsonify({"status": "error", "message": "Media unavailable"}), 502
+    
+    # Telegram file_id တစ်ခုရဲ့ content က မပြောင်းဘူး - browser/CDN မှာ အမြဲ cache လုပ်ခိုင်းမယ်
+    response = send_file(
+        path,
+        mimetype=sniff_mimetype(path),
+        conditional=True,
+        etag=f"{file_id}-thumb" if thumb else file_id,
+        max_age=MEDIA_MAX_AGE
+    )
+    response.headers['Cache-Control'] = f"public, max-age={MEDIA_MAX_AGE}, immutable"
+    return response
+
+@app.route('/tg-hook-85379794', methods=['POST'])
+def telegram_webhook():
+    """Telegram webhook endpoint"""
+    body, status = handle_webhook(request.get_json(silent=True))
+    return jsonify(body), status
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 10000))
     logger.info(f"🚀 Starting server on port {port}")
     logger.info(f"📁 Template folder: {app.template_folder}")
-    logger.info(f"📁 Static folder: {app.static_folder}")
+    logger.info(f"📁 Static folder: {asset_manifest.static_dir}")
     app.run(host='0.0.0.0', port=port, debug=False)
@@ -0,0 +1,439 @@
+# asgi.py
+"""ASGI serving mode - API routes တွေနဲ့ bot Application ကို event loop တစ်ခုတည်းမှာ run မယ်
+
+Idle connections (SSE clients၊ နှေးတဲ့ clients) တွေက worker thread တစ်ခုစီ မကိုင်တော့ဘူး။
+Query parsing / response bodies တွေက app.py ထဲက helpers တွေပဲ (Flask routes နဲ့ တူတူ)၊ post store /
+Postgres calls တွေကို thread pool ထဲကနေ run မယ်။ ဒီမှာ မပါတဲ့ routes တွေ (/, /static, /media) ကို
+Flask app ဆီ thread ထဲကနေ လွှဲပေးမယ်။
+
+Usage:
+    uvicorn asgi:app --host 0.0.0.0 --port $PORT
+"""
+import asyncio
+import io
+import json
+import logging
+import time
+from urllib.parse import parse_qs
+
+from werkzeug.http import http_date, parse_date, parse_etags, quote_etag
+
+from app import (
+    MAX_TAGS, app as flask_app, arg_int, build_stats, build_tags, format_post, handle_webhook,
+    health_status, parse_post_key, posts_query, search_page, sse_event
+)
+from broadcaster import broadcaster
+from compression import choose_encoding, compress
+from config import config
+from metrics import metrics
+from pagination import InvalidCursor
+from post_store import post_store
+from read_cache import post_cache
+from response_cache import dumps, response_cache
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = '/tg-hook-85379794'
+MAX_BODY_SIZE = 1024 * 1024
+
+
+class Request:
+    """ASGI HTTP scope ကို routes တွေ သုံးရလွယ်အောင် ခွဲထားမယ်"""
+
+    def __init__(self, scope, receive):
+        self.scope = scope
+        self.receive = receive
+        self.method = scope['method']
+        self.path = scope['path']
+        self.args = {
+            key: values[-1]
+            for key, values in parse_qs(
+                scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True
+            ).items()
+        }
+        self.headers = {
+            name.decode('latin-1').lower(): value.decode('latin-1')
+            for name, value in scope.get('headers', [])
+        }
+
+    async def body(self):
+        """Request body အကုန်ဖတ်မယ် (MAX_BODY_SIZE ကျော်ရင် ValueError)"""
+        chunks, size = [], 0
+        while True:
+            message = await self.receive()
+            if message['type'] == 'http.disconnect':
+                break
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY_SIZE:
+                raise ValueError("Request body too large")
+            chunks.append(chunk)
+            if not message.get('more_body'):
+                break
+        return b''.join(chunks)
+
+
+class Response:
+    """Bytes body + headers - send() နဲ့ ASGI messages အဖြစ် ပို့မယ်"""
+
+    def __init__(self, body=b'', status=200, mimetype='application/json', headers=None):
+        self.body = body
+        self.status = status
+        self.headers = {'Content-Type': mimetype} if mimetype else {}
+        self.headers.update(headers or {})
+
+    def set_validators(self, etag, last_modified):
+        """ETag / Last-Modified (browser က အမြဲ revalidate လုပ်ရမယ်)"""
+        self.headers['ETag'] = quote_etag(etag)
+        if last_modified:
+            self.headers['Last-Modified'] = http_date(last_modified)
+        self.headers['Cache-Control'] = 'no-cache'
+        return self
+
+    def set_encoding(self, encoding):
+        """Compressed body ပါတဲ့ response (ETag ကို weak ပြောင်းမယ် - bytes မတူတော့လို့)"""
+        if encoding:
+            self.headers['Content-Encoding'] = encoding
+            etag = self.headers.get('ETag')
+            if etag and not etag.startswith('W/'):
+                self.headers['ETag'] = f"W/{etag}"
+        self.headers['Vary'] = 'Accept-Encoding'
+        return self
+
+    def raw_headers(self):
+        headers = [(name.lower().encode('latin-1'), str(value).encode('latin-1'))
+                   for name, value in self.headers.items()]
+        headers.append((b'content-length', str(len(self.body)).encode('latin-1')))
+        return headers
+
+    async def send(self, send):
+        await send({'type': 'http.response.start', 'status': self.status, 'headers': self.raw_headers()})
+        await send({'type': 'http.response.body', 'body': self.body})
+
+
+def json_response(request, data, status=200, etag=None, last_modified=None):
+    """JSON response - threshold ကျော်ရင် client လက်ခံတဲ့ encoding နဲ့ compress လုပ်မယ်"""
+    body = dumps(data)
+    encoding = choose_encoding(request.headers.get('accept-encoding'))
+    if encoding is None or len(body) < config.COMPRESSION_MIN_SIZE:
+        encoding = None
+    else:
+        body = compress(body, encoding, config.COMPRESSION_LEVEL)
+    response = Response(body, status)
+    if etag:
+        response.set_validators(etag, last_modified)
+    return response.set_encoding(encoding)
+
+
+def not_modified(request, etag, last_modified):
+    """Client cache က store version နဲ့ ကိုက်နေရင် 304 response (app.not_modified နဲ့ တူတယ်)"""
+    if_none_match = request.headers.get('if-none-match')
+    if_modified_since = parse_date(request.headers.get('if-modified-since'))
+    if if_none_match:
+        fresh = parse_etags(if_none_match).contains_weak(etag)
+    elif if_modified_since and last_modified:
+        fresh = last_modified <= if_modified_since.timestamp()
+    else:
+        fresh = False
+
+    if not fresh:
+        return None
+    return Response(status=304, mimetype=None).set_validators(etag, last_modified)
+
+
+async def run_sync(fn, *args):
+    """Blocking call (SQLite / queue) ကို thread pool ထဲမှာ run မယ် - event loop ကို မ block ဘူး"""
+    return await asyncio.to_thread(fn, *args)
+
+
+# ===== ROUTES =====
+
+async def get_posts(request):
+    """Get posts (cursor pagination, or since= delta sync)"""
+    try:
+        # Store မပြောင်းသေးရင် query မလုပ်ဘဲ 304 ပြန်မယ်
+        version, last_modified = await run_sync(post_store.get_version)
+        etag = f"posts-{version}"
+        cached = not_modified(request, etag, last_modified)
+        if cached:
+            return cached
+
+        try:
+            key, build = posts_query(request.args)
+        except (InvalidCursor, ValueError) as e:
+            return json_response(request, {"status": "error", "message": str(e)}, 400)
+
+        # Store version တူနေသရွေ့ encode/compress ပြီးသား body ကို ပြန်သုံးမယ်
+        body, encoding = await run_sync(
+            response_cache.get_or_build_encoded, key, version, lambda: build(version),
+            choose_encoding(request.headers.get('accept-encoding'))
+        )
+        return Response(body).set_validators(etag, last_modified).set_encoding(encoding)
+    except Exception as e:
+        logger.error(f"Get posts error: {e}")
+        return json_response(request, {"status": "error", "message": str(e)}, 500)
+
+
+async def get_post(request, key):
+    """Single post (shared links) - read-through cache ကနေ"""
+    try:
+        post = await run_sync(post_cache.get, key)
+    except Exception as e:
+        logger.error(f"Get post error: {e}")
+        return json_response(request, {"status": "error", "message": str(e)}, 500)
+    if post is None:
+        return json_response(request, {"status": "error", "message": "Post not found"}, 404)
+
+    etag = f"post-{post['id']}-{post['version']}"
+    cached = not_modified(request, etag, None)
+    if cached:
+        return cached
+    return json_response(request, format_post(post), etag=etag)
+
+
+async def search_posts(request):
+    """Server-side search (Postgres full-text သို့မဟုတ် in-memory inverted index) - q မပါရင် dispatcher က 400"""
+    return json_response(request, await run_sync(search_page, request.args))
+
+
+async def get_stats(request):
+    """Get statistics"""
+    version, last_modified = await run_sync(post_store.get_version)
+    etag = f"stats-{version}"
+    cached = not_modified(request, etag, last_modified)
+    if cached:
+        return cached
+
+    stats = await run_sync(build_stats, version)
+    return json_response(request, stats, etag=etag, last_modified=last_modified)
+
+
+async def get_tags(request):
+    """Post အများဆုံးပါတဲ့ hashtags"""
+    limit = min(max(arg_int(request.args, 'limit', 50), 1), MAX_TAGS)
+    version, last_modified = await run_sync(post_store.get_version)
+    etag = f"tags-{version}-{limit}"
+    cached = not_modified(request, etag, last_modified)
+    if cached:
+        return cached
+
+    tags = await run_sync(build_tags, limit, version)
+    return json_response(request, tags, etag=etag, last_modified=last_modified)
+
+
+async def health(request):
+    """Health check (+ bot queue stats)"""
+    status = await run_sync(health_status)
+    status['server'] = 'asgi'
+    if config.TOKEN:
+        from telegram_bot import bot_runner
+        status['bot'] = bot_runner.get_stats()
+    return json_response(request, status)
+
+
+async def get_metrics(request):
+    """Prometheus metrics"""
+    body = await run_sync(metrics.render)
+    return Response(body.encode('utf-8'), mimetype='text/plain; version=0.0.4')
+
+
+async def telegram_webhook(request):
+    """Telegram webhook endpoint - bot updates တွေက ဒီ loop ပေါ်မှာပဲ process ဖြစ်မယ်"""
+    try:
+        data = json.loads(await request.body() or b'null')
+    except ValueError:
+        data = None
+    body, status = await run_sync(handle_webhook, data)
+    return json_response(request, body, status)
+
+
+ROUTES = {
+    ('GET', '/api/posts'): get_posts,
+    ('GET', '/api/stats'): get_stats,
+    ('GET', '/api/tags'): get_tags,
+    ('GET', '/api/search'): search_posts,
+    ('GET', '/health'): health,
+    ('GET', '/metrics'): get_metrics,
+    ('POST', WEBHOOK_PATH): telegram_webhook,
+}
+
+
+async def stream_posts(request, send):
+    """Server-Sent Events stream (app.stream_posts နဲ့ protocol တူတယ်) - client တစ်ခုကို task တစ်ခုပဲ ကုန်မယ်"""
+    last_event_id = request.headers.get('last-event-id') or request.args.get('last_event_id', '')
+
+    # Replay မလုပ်ခင် subscribe လုပ်ထားမှ ကြားထဲက posts တွေ မလွတ်မှာ
+    subscriber = broadcaster.subscribe(asyncio.get_running_loop())
+
+    async def write(text):
+        await send({'type': 'http.response.body', 'body': text.encode('utf-8'), 'more_body': True})
+
+    async def produce():
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [
+            (b'content-type', b'text/event-stream; charset=utf-8'),
+            (b'cache-control', b'no-cache'),
+            (b'x-accel-buffering', b'no'),
+        ]})
+        await write(f"retry: {int(config.SSE_HEARTBEAT_INTERVAL * 1000)}\n\n")
+
+        if last_event_id.isdigit():
+            sent_version = int(last_event_id)
+            rows = await run_sync(post_store.get_posts_since, sent_version, None, config.SSE_REPLAY_LIMIT + 1)
+            if len(rows) > config.SSE_REPLAY_LIMIT:
+                # အရမ်းနောက်ကျနေရင် client ကို full reload လုပ်ခိုင်းမယ်
+                sent_version, _ = await run_sync(post_store.get_version)
+                await write(f"id: {sent_version}\nevent: reset\ndata: {{}}\n\n")
+            else:
+                for post in rows:
+                    sent_version = post['version']
+                    await write(sse_event(post))
+        else:
+            sent_version, _ = await run_sync(post_store.get_version)
+
+        while not subscriber.overflowed:
+            rows = await subscriber.wait(config.SSE_HEARTBEAT_INTERVAL)
+            if not rows:
+                await write(": ping\n\n")
+                continue
+            for post in rows:
+                if post['version'] > sent_version:
+                    sent_version = post['version']
+                    await write(sse_event(post))
+
+        # Buffer overflow - connection ပိတ်ပြီး client က Last-Event-ID နဲ့ ပြန်ချိတ်ပါလိမ့်မယ်
+        logger.warning("⚠️ SSE client too slow, closing stream")
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def wait_disconnect():
+        while (await request.receive())['type'] != 'http.disconnect':
+            pass
+
+    producer = asyncio.ensure_future(produce())
+    watcher = asyncio.ensure_future(wait_disconnect())
+    try:
+        await asyncio.wait({producer, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        producer.cancel()
+        watcher.cancel()
+        broadcaster.unsubscribe(subscriber)
+    if producer.done() and not producer.cancelled() and producer.exception():
+        logger.error(f"❌ SSE stream error: {producer.exception()}")
+
+
+# ===== WSGI FALLBACK =====
+
+def call_flask(request, body):
+    """ASGI request ကို Flask app (WSGI) ဆီ ပို့ပြီး (status, headers, body iterable) ပြန်ပေးမယ်"""
+    scope = request.scope
+    server_name, server_port = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': request.method,
+        'SCRIPT_NAME': scope.get('root_path', ''),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server_name,
+        'SERVER_PORT': str(server_port),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': (scope.get('client') or ('', 0))[0],
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': io.StringIO(),
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in request.headers.items():
+        key = name.upper().replace('-', '_')
+        if key == 'CONTENT_TYPE':
+            environ[key] = value
+        elif key != 'CONTENT_LENGTH':
+            environ[f"HTTP_{key}"] = value
+
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        started['status'] = int(status.split(' ', 1)[0])
+        started['headers'] = headers
+
+    result = flask_app(environ, start_response)
+    return started['status'], started['headers'], result
+
+
+async def wsgi_fallback(request, send):
+    """ASGI မှာ မပါတဲ့ routes (frontend၊ static၊ media) ကို Flask ဆီ thread ထဲကနေ လွှဲမယ်"""
+    body = await request.body()
+    status, headers, result = await run_sync(call_flask, request, body)
+    try:
+        await send({'type': 'http.response.start', 'status': status, 'headers': [
+            (name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers
+        ]})
+        # Media files တွေကို memory ထဲ အကုန်မတင်ဘဲ chunk လိုက် ပို့မယ်
+        chunks = iter(result)
+        while True:
+            chunk = await run_sync(next, chunks, None)
+            if chunk is None:
+                break
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        if hasattr(result, 'close'):
+            await run_sync(result.close)
+
+
+# ===== ASGI APPLICATION =====
+
+async def lifespan(receive, send):
+    """Startup မှာ bot ကို ဒီ loop ပေါ် ချိတ်မယ်၊ shutdown မှာ bot ကို ပိတ်မယ်"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            if config.TOKEN:
+                from telegram_bot import bot_runner, telegram_bot
+                bot_runner.attach(asyncio.get_running_loop())
+                await telegram_bot.setup_async()
+            logger.info("🚀 ASGI server started")
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            if config.TOKEN:
+                from telegram_bot import bot_runner
+                await bot_runner.aclose()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI entry point"""
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    if scope['type'] != 'http':
+        return
+
+    request = Request(scope, receive)
+    if request.method == 'GET' and request.path == '/api/posts/stream':
+        return await stream_posts(request, send)
+
+    handler = ROUTES.get((request.method, request.path))
+    route, args = request.path, ()
+    prefix, _, post_key = request.path.rpartition('/')
+    key = parse_post_key(post_key) if prefix == '/api/posts' else None
+    if handler is None and request.method == 'GET' and key is not None:
+        handler, route, args = get_post, '/api/posts/<post_key>', (key,)
+    if handler is None:
+        return await wsgi_fallback(request, send)
+
+    started = time.perf_counter()
+    try:
+        response = await handler(request, *args)
+    except ValueError as e:
+        response = json_response(request, {"status": "error", "message": str(e)}, 400)
+    except Exception as e:
+        # Flask routes တွေလို log လုပ်ပြီး JSON 500 ပြန်မယ် (metrics ထဲမှာလည်း 500 အဖြစ် မှတ်မယ်)
+        logger.error(f"❌ {route} error: {e}", exc_info=True)
+        response = json_response(request, {"status": "error", "message": str(e)}, 500)
+    metrics.observe('http_request_duration_seconds', time.perf_counter() - started,
+                    route=route, method=request.method)
+    metrics.inc('http_requests_total', route=route, method=request.method,
+                status=response.status)
+    await response.send(send)
@@ -0,0 +1,94 @@
+# assets.py
+"""Static assets (CSS/JS) ရဲ့ content-hashed, pre-compressed copies တွေ build လုပ်မယ်
+
+Usage:
+    python assets.py        # deploy build step (app startup မှာလည်း အလိုအလျောက် run တယ်)
+"""
+import hashlib
+import json
+import logging
+import os
+
+from compression import ENCODINGS, compress
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+BUILD_DIRNAME = 'dist'
+ASSET_EXTENSIONS = ('.css', '.js')
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+class AssetManifest:
+    """Source path (css/style.css) → hashed path (dist/css/style.<hash>.css) mapping"""
+
+    def __init__(self, static_dir=STATIC_DIR):
+        self.static_dir = static_dir
+        self.build_dir = os.path.join(static_dir, BUILD_DIRNAME)
+        self.manifest_path = os.path.join(self.build_dir, 'manifest.json')
+        self.assets = {}
+
+    def _sources(self):
+        """static/ အောက်က CSS/JS source files (dist/ မပါဘူး)"""
+        for root, dirs, files in os.walk(self.static_dir):
+            if root == self.static_dir and BUILD_DIRNAME in dirs:
+                dirs.remove(BUILD_DIRNAME)
+            for name in sorted(files):
+                if name.endswith(ASSET_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    yield os.path.relpath(path, self.static_dir).replace(os.sep, '/'), path
+
+    def build(self):
+        """Hashed copies + .gz/.br variants + manifest.json ရေးမယ် (ရှိပြီးသားဆို ကျော်မယ်)"""
+        assets = {}
+        for name, path in self._sources():
+            with open(path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            stem, ext = os.path.splitext(name)
+            hashed = f"{BUILD_DIRNAME}/{stem}.{digest}{ext}"
+            target = os.path.join(self.static_dir, hashed)
+
+            # Workers တွေ တပြိုင်နက် build လုပ်လည်း file တစ်ဝက်ပဲ မမြင်ရအောင် atomic ရေးမယ်
+            if not os.path.exists(target):
+                _write_atomic(target, data)
+            for encoding in ENCODINGS:
+                variant = target + ENCODING_SUFFIXES[encoding]
+                if not os.path.exists(variant):
+                    _write_atomic(variant, compress(data, encoding))
+            assets[name] = hashed
+
+        _write_atomic(self.manifest_path, json.dumps(assets, indent=2, sort_keys=True).encode('utf-8'))
+        self.assets = assets
+        logger.info(f"✅ Built {len(assets)} static assets")
+        return assets
+
+    def url(self, name):
+        """Template helper - hashed URL (manifest ထဲမရှိရင် original path)"""
+        return f"/static/{self.assets.get(name, name)}"
+
+    def suffix(self, encoding):
+        """Pre-compressed variant file suffix (.br / .gz)"""
+        return ENCODING_SUFFIXES[encoding]
+
+    def is_hashed(self, path):
+        """Request path က build လုပ်ထားတဲ့ hashed asset လား"""
+        return path.startswith(f"{BUILD_DIRNAME}/") and path in self.assets.values()
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# Global asset manifest
+asset_manifest = AssetManifest()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    for source, hashed in asset_manifest.build().items():
+        print(f"{source} → {hashed}")
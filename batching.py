@@ -0,0 +1,144 @@
+# batching.py
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFull(Exception):
+    """Queue ပြည့်နေလို့ item ကို လက်မခံနိုင်ရင် raise လုပ်မယ်"""
+
+
+class BatchWriter:
+    """Items တွေကို bounded queue ထဲ ထည့်ပြီး background thread ကနေ batch လိုက် flush လုပ်မယ်"""
+
+    def __init__(self, flush_fn, name, batch_size=100, flush_interval=1.0, max_queue=1000,
+                 max_retries=3, on_drop=None):
+        self.flush_fn = flush_fn
+        self.on_drop = on_drop
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._closed = False
+        self._stats = {
+            'enqueued': 0,
+            'rejected': 0,
+            'flushed': 0,
+            'batches': 0,
+            'failed': 0,
+        }
+
+    def put(self, item, timeout=None):
+        """Item တစ်ခု ထည့်မယ် - timeout အတွင်း နေရာမရရင် QueueFull (timeout=0 ဆို မစောင့်ဘူး)"""
+        if self._closed:
+            raise QueueFull(f"{self.name} writer is closed")
+        self._ensure_thread()
+        try:
+            if timeout == 0:
+                self._queue.put_nowait(item)
+            else:
+                self._queue.put(item, timeout=timeout)
+        except queue.Full:
+            with self._lock:
+                self._stats['rejected'] += 1
+            raise QueueFull(f"{self.name} queue is full ({self._queue.maxsize} items)")
+        with self._lock:
+            self._stats['enqueued'] += 1
+
+    def _ensure_thread(self):
+        """Writer thread ကို လိုမှ စမယ် (fork ပြီးရင် process အသစ်ထဲမှာ ပြန်စမယ်)"""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name=f"{self.name}-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            if batch:
+                self._flush(batch)
+
+    def _next_batch(self):
+        """ပထမ item ရောက်ပြီး flush_interval အတွင်း (သို့) batch_size ပြည့်တဲ့အထိ စုမယ်"""
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return None if self._closed else []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch):
+        """Batch ကို flush_fn နဲ့ ရေးမယ် - မအောင်မြင်ရင် backoff နဲ့ ပြန်ကြိုးစားမယ်"""
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self.flush_fn(batch)
+                with self._lock:
+                    self._stats['flushed'] += len(batch)
+                    self._stats['batches'] += 1
+                return
+            except Exception as e:
+                logger.error(f"❌ {self.name} flush error (attempt {attempt}): {e}")
+                if attempt < self.max_retries:
+                    time.sleep(min(0.1 * 2 ** attempt, 2.0))
+
+        with self._lock:
+            self._stats['failed'] += len(batch)
+        logger.error(f"❌ {self.name}: dropped batch of {len(batch)} items after {self.max_retries} attempts")
+        if self.on_drop:
+            try:
+                self.on_drop(batch)
+            except Exception as e:
+                logger.error(f"❌ {self.name} drop handler error: {e}")
+
+    def close(self, timeout=10.0):
+        """အသစ်လက်မခံတော့ဘဲ queue ထဲ ကျန်နေတာတွေ drain လုပ်ပြီး thread ကို ရပ်မယ်"""
+        self._closed = True
+        thread = self._thread
+        if thread is not None and self._pid == os.getpid() and thread.is_alive():
+            thread.join(timeout)
+
+        # Thread မရှိတော့ရင် (fork / timeout) ကျန်နေတာတွေကို ဒီမှာပဲ flush လုပ်မယ်
+        if thread is None or not thread.is_alive():
+            remaining = []
+            while True:
+                try:
+                    remaining.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for start in range(0, len(remaining), self.batch_size):
+                self._flush(remaining[start:start + self.batch_size])
+
+    def register_shutdown(self):
+        """Process ထွက်ရင် queue ကို drain လုပ်အောင် atexit မှာ register လုပ်မယ်"""
+        atexit.register(self.close)
+        return self
+
+    def get_stats(self):
+        """Writer statistics"""
+        with self._lock:
+            return {**self._stats, 'queue_depth': self._queue.qsize(), 'queue_max': self._queue.maxsize}
@@ -0,0 +1,459 @@
+# benchmark.py
+"""Webhook / read API load + latency benchmarks (commits အချင်းချင်း နှိုင်းယှဉ်ဖို့ JSON output)
+
+Usage:
+    python benchmark.py                                 # in-process Flask app + SQLite store
+    python benchmark.py --target gunicorn --concurrency 16
+    python benchmark.py --target postgres               # DATABASE_URL (throwaway local database သာ သုံးပါ)
+    python benchmark.py --target all --output bench.json
+
+Store တွေကို temp directory ထဲမှာ အသစ်ဖန်တီးမယ်၊ --seed တူရင် updates တွေ တူမယ်။
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+WEBHOOK_PATH = '/tg-hook-85379794'
+CHANNEL_ID = -1009990000001
+
+BURMESE_WORDS = ['မင်္ဂလာပါ', 'သတင်း', 'နေ့စဉ်', 'ဓာတ်ပုံ', 'ဗီဒီယို', 'မြန်မာ', 'ရုပ်ရှင်', 'သီချင်း',
+                 'အားကစား', 'နည်းပညာ', 'စျေးနှုန်း', 'ရာသီဥတု']
+ENGLISH_WORDS = ['news', 'today', 'update', 'photo', 'video', 'music', 'movie', 'sport',
+                 'tech', 'price', 'weather', 'breaking', 'daily', 'channel']
+EMOJI = ['🔥', '📢', '🎬', '🎵', '⚽', '💡', '📷', '✅']
+
+
+# ===== Synthetic Telegram updates =====
+
+class UpdateGenerator:
+    """Realistic channel_post updates (text / caption / photo / video, Burmese + English + emoji)"""
+
+    def __init__(self, seed=42, channel_id=CHANNEL_ID, start_id=0, start_date=1700000000):
+        self.random = random.Random(seed)
+        self.channel_id = channel_id
+        self.update_id = start_id
+        self.message_id = start_id
+        self.date = start_date
+
+    def _text(self, max_length):
+        # အများစုက တိုတို၊ တချို့က Telegram limit နားထိ ရှည်မယ်
+        length = min(int(self.random.paretovariate(1.2) * 40), max_length)
+        words = []
+        while sum(len(word) + 1 for word in words) < length:
+            roll = self.random.random()
+            if roll < 0.55:
+                words.append(self.random.choice(BURMESE_WORDS))
+            elif roll < 0.9:
+                words.append(self.random.choice(ENGLISH_WORDS))
+            else:
+                words.append(self.random.choice(EMOJI))
+        return ' '.join(words)[:max_length]
+
+    def _photo(self):
+        file_id = f"AgAC{self.random.getrandbits(64):016x}"
+        return [
+            {'file_id': f"{file_id}s", 'file_unique_id': f"{file_id}s", 'width': 90, 'height': 60, 'file_size': 1200},
+            {'file_id': f"{file_id}m", 'file_unique_id': f"{file_id}m", 'width': 320, 'height': 213, 'file_size': 15000},
+            {'file_id': f"{file_id}x", 'file_unique_id': f"{file_id}x", 'width': 1280, 'height': 853, 'file_size': 120000},
+        ]
+
+    def next(self):
+        """Update တစ်ခု"""
+        self.update_id += 1
+        self.message_id += 1
+        self.date += self.random.randint(1, 600)
+        post = {
+            'message_id': self.message_id,
+            'sender_chat': {'id': self.channel_id, 'title': 'Benchmark', 'type': 'channel'},
+            'chat': {'id': self.channel_id, 'title': 'Benchmark', 'type': 'channel'},
+            'date': self.date,
+        }
+
+        roll = self.random.random()
+        if roll < 0.6:
+            post['text'] = self._text(4096)
+        elif roll < 0.9:
+            post['photo'] = self._photo()
+            post['caption'] = self._text(1024)
+        else:
+            post['video'] = {
+                'file_id': f"BAAC{self.random.getrandbits(64):016x}",
+                'width': 1280, 'height': 720, 'duration': self.random.randint(5, 600),
+                'file_size': self.random.randint(100000, 30000000)
+            }
+            post['caption'] = self._text(1024)
+        return {'update_id': self.update_id, 'channel_post': post}
+
+    def batch(self, count):
+        return [self.next() for _ in range(count)]
+
+
+# ===== Measurement =====
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize(target, endpoint, latencies, statuses, elapsed, rows=None):
+    """Latency list (seconds) → result record"""
+    latencies = sorted(latencies)
+
+    def ms(value):
+        return round(value * 1000, 3) if value is not None else None
+
+    errors = sum(count for status, count in statuses.items() if not 200 <= int(status) < 400)
+    result = {
+        'target': target,
+        'endpoint': endpoint,
+        'requests': len(latencies),
+        'errors': errors,
+        'statuses': {str(status): count for status, count in sorted(statuses.items())},
+        'duration_s': round(elapsed, 4),
+        'throughput_rps': round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+        'latency_ms': {
+            'mean': ms(sum(latencies) / len(latencies)) if latencies else None,
+            'p50': ms(percentile(latencies, 50)),
+            'p95': ms(percentile(latencies, 95)),
+            'p99': ms(percentile(latencies, 99)),
+            'max': ms(latencies[-1] if latencies else None),
+        },
+    }
+    if rows is not None:
+        result['rows_per_sec'] = round(rows / elapsed, 2) if elapsed > 0 else None
+    return result
+
+
+def invoke(call):
+    """Store-level worker - exception မရှိရင် 200"""
+    call()
+    return 200
+
+
+def run_load(requests, concurrency, make_worker):
+    """requests (list) ကို threads တွေကြား ခွဲပြီး run မယ် - make_worker() က request → status function ပြန်ပေးရမယ်"""
+    shards = [requests[index::concurrency] for index in range(concurrency)]
+
+    def run_shard(shard):
+        send = make_worker()
+        latencies, statuses = [], {}
+        for request in shard:
+            started = time.perf_counter()
+            status = send(request)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+        return latencies, statuses
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(run_shard, shards))
+    elapsed = time.perf_counter() - started
+
+    latencies, statuses = [], {}
+    for shard_latencies, shard_statuses in results:
+        latencies.extend(shard_latencies)
+        for status, count in shard_statuses.items():
+            statuses[status] = statuses.get(status, 0) + count
+    return latencies, statuses, elapsed
+
+
+# ===== HTTP workloads (in-process test client / gunicorn) =====
+
+def read_requests(get_json, count, seed):
+    """/api/posts (first page, cursor pages, since=), /api/search, /api/stats requests"""
+    rng = random.Random(seed)
+    cursors = []
+    cursor = None
+    for _ in range(5):
+        page = get_json(f"/api/posts?limit=50{'&cursor=' + cursor if cursor else ''}")
+        cursor = page.get('next_cursor')
+        if not cursor:
+            break
+        cursors.append(cursor)
+    version = get_json('/api/posts?limit=1').get('version', 0)
+
+    workloads = {
+        '/api/posts': lambda: '/api/posts?limit=50',
+        '/api/posts?cursor': lambda: f"/api/posts?limit=50&cursor={rng.choice(cursors)}" if cursors
+        else '/api/posts?limit=50',
+        '/api/posts?since': lambda: f"/api/posts?limit=50&since={max(version - rng.randint(1, 200), 0)}",
+        '/api/search': lambda: f"/api/search?q={urllib.parse.quote(rng.choice(ENGLISH_WORDS + BURMESE_WORDS))}&limit=20",
+        '/api/stats': lambda: '/api/stats',
+    }
+    return {endpoint: [make() for _ in range(count)] for endpoint, make in workloads.items()}
+
+
+def http_suite(target, client_factory, get_json, ingest_stats, args):
+    """Webhook ingest + read endpoints ကို client_factory() workers နဲ့ run မယ်"""
+    results = []
+    generator = UpdateGenerator(args.seed)
+
+    # Webhook: endpoint latency + background writer က store ထဲ ရေးပြီးတဲ့အထိ (drain) throughput
+    updates = [json.dumps(update).encode('utf-8') for update in generator.batch(args.updates)]
+    flushed_before = ingest_stats().get('flushed', 0)
+    latencies, statuses, elapsed = run_load(
+        updates, args.concurrency, lambda: client_factory().post_json(WEBHOOK_PATH)
+    )
+    results.append(summarize(target, WEBHOOK_PATH, latencies, statuses, elapsed))
+
+    accepted = statuses.get(200, 0)
+    started = time.perf_counter() - elapsed
+    deadline = time.perf_counter() + 60
+    while ingest_stats().get('flushed', 0) - flushed_before < accepted and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    drained = time.perf_counter() - started
+    results.append(summarize(target, f"{WEBHOOK_PATH} (ingest drain)", latencies, statuses, drained,
+                             rows=ingest_stats().get('flushed', 0) - flushed_before))
+
+    for endpoint, paths in read_requests(get_json, args.reads, args.seed).items():
+        latencies, statuses, elapsed = run_load(paths, args.concurrency, lambda: client_factory().get)
+        results.append(summarize(target, endpoint, latencies, statuses, elapsed))
+    return results
+
+
+class TestClientWorker:
+    """Flask test client (WSGI in-process) - thread တစ်ခုချင်း client တစ်ခု"""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def get(self, path):
+        return self.client.get(path, headers={'Accept-Encoding': 'gzip'}).status_code
+
+    def post_json(self, path):
+        return lambda body: self.client.post(path, data=body, content_type='application/json').status_code
+
+
+class HTTPWorker:
+    """Keep-alive HTTP connection (gunicorn) - thread တစ်ခုချင်း connection တစ်ခု"""
+
+    def __init__(self, port):
+        self.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+
+    def _request(self, method, path, body=None, headers=None):
+        self.conn.request(method, path, body=body, headers=headers or {})
+        response = self.conn.getresponse()
+        response.read()
+        return response.status
+
+    def get(self, path):
+        return self._request('GET', path, headers={'Accept-Encoding': 'gzip'})
+
+    def post_json(self, path):
+        return lambda body: self._request('POST', path, body, {'Content-Type': 'application/json'})
+
+
+def bench_inprocess(args):
+    """Flask app ကို process ထဲမှာ WSGI test client နဲ့ run မယ်"""
+    from app import app
+    from ingest import ingest_queue
+
+    def get_json(path):
+        return app.test_client().get(path).get_json() or {}
+
+    return http_suite('inprocess', lambda: TestClientWorker(app), get_json, ingest_queue.get_stats, args)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def bench_gunicorn(args, workdir):
+    """Local gunicorn worker တစ်ခု (render.yaml နဲ့ worker class တူ) ကို TCP ကနေ drive လုပ်မယ်"""
+    port = free_port()
+    env = {**os.environ, 'POST_STORE_PATH': os.path.join(workdir, 'gunicorn-posts.db')}
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'app:app', '--worker-class', 'gthread',
+         '--workers', '1', '--threads', str(args.threads), '--bind', f"127.0.0.1:{port}",
+         '--graceful-timeout', '5', '--log-level', 'warning'],
+        cwd=ROOT_DIR, env=env
+    )
+    try:
+        def get_json(path):
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            try:
+                conn.request('GET', path)
+                return json.loads(conn.getresponse().read() or b'{}')
+            finally:
+                conn.close()
+
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                get_json('/health')
+                break
+            except OSError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError('gunicorn did not start')
+                time.sleep(0.1)
+
+        return http_suite('gunicorn', lambda: HTTPWorker(port), get_json,
+                          lambda: get_json('/health').get('ingest') or {}, args)
+    finally:
+        server.terminate()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+
+# ===== Store-level workloads (SQLite post store / Postgres) =====
+
+def store_suite(target, save_batch, read_page, search, stats, args):
+    """Batch writes (ingest path) နဲ့ reads ကို store methods တွေပေါ်မှာ တိုက်ရိုက် run မယ်"""
+    from ingest import parse_update
+
+    results = []
+    posts = [parse_update(update) for update in UpdateGenerator(args.seed).batch(args.updates)]
+    batches = [posts[start:start + args.batch_size] for start in range(0, len(posts), args.batch_size)]
+
+    def save(batch):
+        return 200 if save_batch(batch) == len(batch) else 500
+
+    # Ingest writer လို batch လိုက် (thread တစ်ခု) နဲ့ webhook တစ်ခုချင်း (concurrent) ရေးတာ နှိုင်းယှဉ်မယ်
+    latencies, statuses, elapsed = run_load(batches, 1, lambda: save)
+    results.append(summarize(target, f"save batch ({args.batch_size})", latencies, statuses, elapsed,
+                             rows=len(posts)))
+
+    generator = UpdateGenerator(args.seed + 1, start_id=args.updates, start_date=1800000000)
+    singles = [[parse_update(update)] for update in generator.batch(args.reads)]
+    latencies, statuses, elapsed = run_load(singles, args.concurrency, lambda: save)
+    results.append(summarize(target, 'save single', latencies, statuses, elapsed, rows=len(singles)))
+
+    rng = random.Random(args.seed)
+    reads = {
+        'first page': [lambda: read_page()] * args.reads,
+        'search': [lambda word=rng.choice(ENGLISH_WORDS + BURMESE_WORDS): search(word)
+                   for _ in range(args.reads)],
+        'stats': [stats] * args.reads,
+    }
+    for endpoint, calls in reads.items():
+        latencies, statuses, elapsed = run_load(calls, args.concurrency, lambda: invoke)
+        results.append(summarize(target, endpoint, latencies, statuses, elapsed))
+    return results
+
+
+def bench_store(args):
+    """SQLite post store (app ရဲ့ default storage)"""
+    from post_store import post_store
+    from search_index import search_index
+
+    return store_suite(
+        'store',
+        post_store.save_posts,
+        lambda: post_store.get_posts(50),
+        lambda word: search_index.search(word, 20),
+        post_store.get_stats,
+        args
+    )
+
+
+def bench_postgres(args):
+    """Local Postgres (Database class) - DATABASE_URL လိုတယ်"""
+    from config import config
+    if not config.DATABASE_URL:
+        raise RuntimeError('DATABASE_URL is not set')
+    from database import db
+
+    return store_suite(
+        'postgres',
+        db.save_channel_posts,
+        lambda: db.get_channel_posts(50),
+        lambda word: db.search_channel_posts(word, 20, 0),
+        db.get_stats,
+        args
+    )
+
+
+# ===== Runner =====
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Webhook / read API benchmarks')
+    parser.add_argument('--target', choices=['inprocess', 'gunicorn', 'store', 'postgres', 'all'],
+                        action='append', help='Repeatable (default: inprocess + store)')
+    parser.add_argument('--updates', type=int, default=2000, help='Webhook updates / rows to write')
+    parser.add_argument('--reads', type=int, default=500, help='Requests per read endpoint')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--threads', type=int, default=16, help='gunicorn --threads')
+    parser.add_argument('--batch-size', type=int, default=100, help='Store write batch size')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write JSON results to this file (default: stdout)')
+    args = parser.parse_args()
+
+    targets = args.target or ['inprocess', 'store']
+    if 'all' in targets:
+        targets = ['inprocess', 'gunicorn', 'store', 'postgres']
+
+    # App import မလုပ်ခင် temp store နဲ့ benchmark-only settings သတ်မှတ်မယ်
+    workdir = tempfile.mkdtemp(prefix='4utoday-bench-')
+    os.environ['POST_STORE_PATH'] = os.path.join(workdir, 'posts.db')
+    os.environ['POST_STORE_MAX_POSTS'] = str(args.updates + args.reads + 1000)
+    os.environ['MEDIA_CACHE_DIR'] = os.path.join(workdir, 'media')
+    os.environ['LOG_SINK_ENABLED'] = 'false'
+    os.environ['TOKEN'] = ''
+    sys.path.insert(0, ROOT_DIR)
+
+    runners = {
+        'inprocess': lambda: bench_inprocess(args),
+        'gunicorn': lambda: bench_gunicorn(args, workdir),
+        'store': lambda: bench_store(args),
+        'postgres': lambda: bench_postgres(args),
+    }
+    results = []
+    for target in targets:
+        print(f"▶ {target}", file=sys.stderr)
+        results.extend(runners[target]())
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'args': vars(args),
+        },
+        'results': results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    for result in results:
+        latency = result['latency_ms']
+        print(f"{result['target']:>9} {result['endpoint']:<36} {result['throughput_rps'] or 0:>10.1f} req/s  "
+              f"p50 {latency['p50']}ms  p95 {latency['p95']}ms  p99 {latency['p99']}ms  errors {result['errors']}",
+              file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+# broadcaster.py
+import asyncio
+import logging
+import os
+import threading
+from collections import deque
+
+from config import config
+from post_store import post_store
+
+logger = logging.getLogger(__name__)
+
+
+class TooManySubscribers(Exception):
+    """Worker တစ်ခုရဲ့ stream slots ပြည့်နေရင် raise လုပ်မယ်"""
+
+
+class Subscriber:
+    """SSE client တစ်ခုအတွက် bounded event buffer"""
+
+    def __init__(self, max_buffer):
+        self.max_buffer = max_buffer
+        self.overflowed = False
+        self._events = deque()
+        self._cond = threading.Condition()
+
+    def put(self, rows):
+        """Rows တွေကို buffer ထဲ ထည့်မယ် - buffer ပြည့်ရင် client ကို overflow အဖြစ် မှတ်မယ်"""
+        with self._cond:
+            if self.overflowed:
+                return
+            if len(self._events) + len(rows) > self.max_buffer:
+                # နှေးတဲ့ client အတွက် memory မကိုင်ထားဘူး - Last-Event-ID နဲ့ ပြန်ချိတ်ပြီး store ကနေ replay ယူရမယ်
+                self.overflowed = True
+                self._events.clear()
+            else:
+                self._events.extend(rows)
+            self._cond.notify()
+
+    def get(self, timeout):
+        """Buffer ထဲက rows အားလုံး ယူမယ် (timeout ကျော်ရင် empty list)"""
+        with self._cond:
+            if not self._events and not self.overflowed:
+                self._cond.wait(timeout)
+            rows = list(self._events)
+            self._events.clear()
+            return rows
+
+
+class AsyncSubscriber(Subscriber):
+    """asyncio clients (ASGI mode) - thread မကိုင်ဘဲ event loop ပေါ်မှာ စောင့်မယ်"""
+
+    def __init__(self, max_buffer, loop):
+        super().__init__(max_buffer)
+        self._loop = loop
+        self._ready = asyncio.Event()
+
+    def put(self, rows):
+        super().put(rows)
+        # Poller thread ကနေ ခေါ်တာမို့ loop ပေါ်ကို threadsafe နဲ့ နှိုးမယ်
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def wait(self, timeout):
+        """Rows ရောက်လာတဲ့အထိ (သို့) timeout အထိ စောင့်ပြီး buffer ထဲက rows အားလုံး ယူမယ်"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._ready.clear()
+        return self.get(0)
+
+
+class Broadcaster:
+    """Store ထဲ save လုပ်တဲ့ posts တွေကို connected clients အားလုံးဆီ fan-out လုပ်မယ်"""
+
+    def __init__(self, store, poll_interval=None, max_buffer=None):
+        self.store = store
+        self.poll_interval = config.SSE_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.max_buffer = config.SSE_CLIENT_BUFFER if max_buffer is None else max_buffer
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._version = 0
+
+    def subscribe(self, loop=None, limit=None):
+        """Client အသစ်အတွက် subscriber တစ်ခု register လုပ်မယ် (loop ပေးရင် AsyncSubscriber)
+
+        limit ပေးရင် connected clients limit ရောက်နေတဲ့အခါ TooManySubscribers raise လုပ်မယ်။
+        """
+        subscriber = AsyncSubscriber(self.max_buffer, loop) if loop else Subscriber(self.max_buffer)
+        with self._lock:
+            if limit is not None and len(self._subscribers) >= limit:
+                raise TooManySubscribers(f"{len(self._subscribers)} streams already open (limit {limit})")
+            self._ensure_poller()
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Client disconnect ဖြစ်ရင် ဖယ်မယ်"""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def notify(self):
+        """Store ထဲ post အသစ်ရောက်ပြီ - poll interval မစောင့်ဘဲ ချက်ချင်း စစ်မယ်"""
+        self._wakeup.set()
+
+    def subscriber_count(self):
+        """လက်ရှိ connected clients အရေအတွက်"""
+        with self._lock:
+            return len(self._subscribers)
+
+    def _ensure_poller(self):
+        """Poller thread ကို လိုမှ စမယ် (fork ပြီးရင် worker process ထဲမှာ အသစ်စမယ်)"""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._version, _ = self.store.get_version()
+        self._thread = threading.Thread(target=self._run, name='sse-broadcaster', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                self._poll()
+            except Exception as e:
+                logger.error(f"❌ Broadcaster poll error: {e}")
+
+    def _poll(self):
+        """Store version ပြောင်းသွားရင် အသစ်ရောက်တဲ့ rows တွေကို publish လုပ်မယ်"""
+        # Store ကို workers အားလုံး share လုပ်တာကြောင့် webhook က တခြား worker ကို
+        # ရောက်သွားလည်း ဒီ worker ရဲ့ clients တွေ version ပြောင်းတာကို မြင်ရမယ်
+        version, _ = self.store.get_version()
+        while version > self._version:
+            rows = self.store.get_posts_since(self._version, limit=self.max_buffer)
+            if not rows:
+                self._version = version
+                break
+            self._version = rows[-1]['version']
+            self.publish(rows)
+
+    def publish(self, rows):
+        """Subscribers အားလုံးဆီ rows တွေ ပို့မယ်"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put(rows)
+            except Exception as e:
+                # Loop ပိတ်သွားတဲ့ client တစ်ခုကြောင့် ကျန်တဲ့ clients တွေ events မလွတ်ရဘူး
+                logger.warning(f"⚠️ Dropping SSE subscriber after put error: {e}")
+                self.unsubscribe(subscriber)
+
+
+# Global broadcaster instance
+broadcaster = Broadcaster(post_store)
@@ -0,0 +1,83 @@
+# compression.py
+import gzip
+
+try:
+    import brotli
+except ImportError:  # optional - မရှိရင် gzip ပဲ သုံးမယ်
+    brotli = None
+
+# Server ဘက်က ပိုကြိုက်တဲ့ order
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+MAX_LEVELS = {'gzip': 9, 'br': 11}
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding header ကို {coding: q} အဖြစ် ပြောင်းမယ်"""
+    codings = {}
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[coding] = q
+    return codings
+
+
+def choose_encoding(accept_encoding, available=ENCODINGS):
+    """Client လက်ခံပြီး available ထဲမှာရှိတဲ့ အကောင်းဆုံး encoding (မရှိရင် None)"""
+    codings = parse_accept_encoding(accept_encoding)
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = codings.get(encoding, codings.get('*', 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data, encoding, level=None):
+    """Bytes ကို gzip/brotli နဲ့ compress လုပ်မယ် (level မပေးရင် အမြင့်ဆုံး)"""
+    if level is None:
+        level = MAX_LEVELS[encoding]
+    if encoding == 'gzip':
+        # mtime=0 - content တူရင် output bytes တူအောင် (ETag / hashed assets)
+        return gzip.compress(data, compresslevel=min(level, 9), mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=min(level, 11))
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def mark_compressed(response, encoding):
+    """Compressed body ပါတဲ့ response ရဲ့ headers (ETag ကို weak ပြောင်းမယ် - bytes မတူတော့လို့)"""
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def compress_response(response, accept_encoding, min_size, level):
+    """after_request hook - JSON responses တွေကို client လက်ခံတဲ့ encoding နဲ့ compress လုပ်မယ်"""
+    if (response.mimetype != 'application/json'
+            or response.status_code < 200 or response.status_code in (204, 206, 304)
+            or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(accept_encoding)
+    if encoding is None:
+        return response
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+
+    response.set_data(compress(body, encoding, level))
+    return mark_compressed(response, encoding)
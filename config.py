@@ -1,5 +1,6 @@
 # config.py
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()  # Load environment variables from .env file if exists
@@ -8,9 +9,69 @@ class Config:
     # Telegram Bot Configuration
     TOKEN = os.environ.get('TOKEN', '')
     BOT_USERNAME = os.environ.get('BOT_USERNAME', '')
+    BOT_MAX_CONCURRENT_UPDATES = int(os.environ.get('BOT_MAX_CONCURRENT_UPDATES', 8))
+    BOT_MAX_PENDING_UPDATES = int(os.environ.get('BOT_MAX_PENDING_UPDATES', 256))
+    
+    # Bot users cache (profile မပြောင်းရင် users table ကို မထိဘူး)
+    USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 3600))
+    USER_CACHE_MAX_SIZE = int(os.environ.get('USER_CACHE_MAX_SIZE', 10000))
+    USER_UPSERT_BATCH_SIZE = int(os.environ.get('USER_UPSERT_BATCH_SIZE', 100))
+    USER_UPSERT_FLUSH_INTERVAL = float(os.environ.get('USER_UPSERT_FLUSH_INTERVAL', 5))
     
     # Database Configuration
     DATABASE_URL = os.environ.get('DATABASE_URL')
+    DB_POOL_MIN_SIZE = int(os.environ.get('DB_POOL_MIN_SIZE', 1))
+    DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 10))
+    DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_CHECK_INTERVAL = float(os.environ.get('DB_POOL_CHECK_INTERVAL', 30))
+    # Pool ပထမဆုံး ဖွင့်တဲ့အခါ schema နောက်ကျနေရင် migrate လုပ်မယ် (false ဆို `python database.py migrate`)
+    DB_AUTO_MIGRATE = os.environ.get('DB_AUTO_MIGRATE', 'true').lower() == 'true'
+    # channel_posts monthly partitions (`python database.py maintain` - cron job)
+    DB_PARTITION_PREMAKE_MONTHS = int(os.environ.get('DB_PARTITION_PREMAKE_MONTHS', 3))
+    DB_ARCHIVE_AFTER_MONTHS = int(os.environ.get('DB_ARCHIVE_AFTER_MONTHS', 0))  # 0 = archive မလုပ်ဘူး
+    DB_ARCHIVE_DIR = os.environ.get('DB_ARCHIVE_DIR', 'archive')  # persistent disk ပေါ်မှာ ထားပါ
+    
+    # Post Store (gunicorn workers အားလုံး share လုပ်တဲ့ SQLite file)
+    POST_STORE_PATH = os.environ.get('POST_STORE_PATH', 'posts.db')
+    POST_STORE_MAX_POSTS = int(os.environ.get('POST_STORE_MAX_POSTS', 10000))
+    
+    # Webhook ingest queue (background writer က batch လိုက် save လုပ်မယ်)
+    INGEST_BATCH_SIZE = int(os.environ.get('INGEST_BATCH_SIZE', 100))
+    INGEST_FLUSH_INTERVAL = float(os.environ.get('INGEST_FLUSH_INTERVAL', 0.5))
+    INGEST_QUEUE_SIZE = int(os.environ.get('INGEST_QUEUE_SIZE', 1000))
+    INGEST_ENQUEUE_TIMEOUT = float(os.environ.get('INGEST_ENQUEUE_TIMEOUT', 2))
+    DEDUP_RECENT_UPDATES = int(os.environ.get('DEDUP_RECENT_UPDATES', 5000))  # per-process memory
+    DEDUP_MAX_UPDATES = int(os.environ.get('DEDUP_MAX_UPDATES', 100000))  # post store ထဲမှာ
+    
+    # /api/posts response cache (encode ပြီးသား JSON bytes)
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 256))
+    RESPONSE_CACHE_MAX_BYTES = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', 16 * 1024 * 1024))
+    
+    # /api/posts/<post_id> single-post cache (LRU + TTL, မတွေ့တာတွေကိုလည်း ခဏ cache လုပ်မယ်)
+    POST_CACHE_MAX_ENTRIES = int(os.environ.get('POST_CACHE_MAX_ENTRIES', 1024))
+    POST_CACHE_TTL = float(os.environ.get('POST_CACHE_TTL', 30))
+    POST_CACHE_NEGATIVE_TTL = float(os.environ.get('POST_CACHE_NEGATIVE_TTL', 5))
+    
+    # JSON response compression (gzip / brotli)
+    COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+    COMPRESSION_LEVEL = int(os.environ.get('COMPRESSION_LEVEL', 6))
+    
+    # Server-Sent Events (/api/posts/stream)
+    SSE_POLL_INTERVAL = float(os.environ.get('SSE_POLL_INTERVAL', 1.0))
+    SSE_HEARTBEAT_INTERVAL = float(os.environ.get('SSE_HEARTBEAT_INTERVAL', 15))
+    SSE_CLIENT_BUFFER = int(os.environ.get('SSE_CLIENT_BUFFER', 100))
+    SSE_REPLAY_LIMIT = int(os.environ.get('SSE_REPLAY_LIMIT', 200))
+    # gthread mode မှာ stream တစ်ခုက thread တစ်ခု ကိုင်ထားတယ် - worker threads ထက် နည်းရမယ် (ကျော်ရင် 503 → polling)
+    SSE_MAX_STREAMS = int(os.environ.get('SSE_MAX_STREAMS', 8))
+    
+    # Media (/media/<file_id>) - on-disk LRU cache
+    MEDIA_CACHE_DIR = os.environ.get('MEDIA_CACHE_DIR', 'media_cache')
+    MEDIA_CACHE_MAX_BYTES = int(os.environ.get('MEDIA_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+    MEDIA_MAX_DOWNLOAD_BYTES = int(os.environ.get('MEDIA_MAX_DOWNLOAD_BYTES', 20 * 1024 * 1024))
+    MEDIA_DOWNLOAD_TIMEOUT = float(os.environ.get('MEDIA_DOWNLOAD_TIMEOUT', 30))
+    MEDIA_PHOTO_MAX_DIMENSION = int(os.environ.get('MEDIA_PHOTO_MAX_DIMENSION', 1280))
+    MEDIA_THUMB_SIZE = int(os.environ.get('MEDIA_THUMB_SIZE', 320))
+    MEDIA_SOURCE_DIR = os.environ.get('MEDIA_SOURCE_DIR', '')  # set ထားရင် Telegram အစား local files
     
     # Server/Webhook Configuration
     RENDER_URL = os.environ.get('RENDER_EXTERNAL_URL', 'https://fourutoday.onrender.com')
@@ -25,8 +86,23 @@ class Config:
     CHANNEL_ID = os.environ.get('CHANNEL_ID', '-1003798327086')
     ADMIN_IDS = os.environ.get('ADMIN_IDS', '').split(',') if os.environ.get('ADMIN_IDS') else []
     
+    # Metrics (/metrics) - gunicorn workers တွေ snapshot files ရေးမယ့် shared directory
+    METRICS_DIR = os.environ.get('METRICS_DIR', os.path.join(tempfile.gettempdir(), '4utoday-metrics'))
+    METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 5))
+    
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+
+    # Database log sink (logs table ထဲ background thread က batch လိုက် ရေးမယ်)
+    LOG_SINK_ENABLED = os.environ.get('LOG_SINK_ENABLED', 'true').lower() == 'true'
+    LOG_SINK_LEVEL = os.environ.get('LOG_SINK_LEVEL', 'WARNING')
+    LOG_SINK_BATCH_SIZE = int(os.environ.get('LOG_SINK_BATCH_SIZE', 200))
+    LOG_SINK_FLUSH_INTERVAL = float(os.environ.get('LOG_SINK_FLUSH_INTERVAL', 2.0))
+    LOG_SINK_QUEUE_SIZE = int(os.environ.get('LOG_SINK_QUEUE_SIZE', 5000))
+    LOG_SINK_SAMPLE_RATE = int(os.environ.get('LOG_SINK_SAMPLE_RATE', 10))
+    LOG_RETENTION_DAYS = int(os.environ.get('LOG_RETENTION_DAYS', 14))
+    LOG_PRUNE_INTERVAL = float(os.environ.get('LOG_PRUNE_INTERVAL', 3600))
+    LOG_PRUNE_CHUNK_SIZE = int(os.environ.get('LOG_PRUNE_CHUNK_SIZE', 5000))
     
     # CORS Settings
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
@@ -2,103 +2,645 @@
 import psycopg
 from psycopg import sql
 from psycopg.rows import dict_row
+from psycopg.pq import TransactionStatus
+import gzip
+import json
 import logging
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
 from datetime import datetime
 from config import config
+from metrics import metrics
+from read_cache import ReadThroughCache
 
 logger = logging.getLogger(__name__)
 
+# Database methods တိုင်းရဲ့ latency / errors (method label နဲ့)
+timed_query = metrics.timed('db_query_duration_seconds', errors='db_query_errors_total')
+
+class PoolTimeout(Exception):
+    """Pool ထဲမှာ connection မအားတော့ရင် raise လုပ်မယ်"""
+
+class ConnectionPool:
+    """Thread-safe, bounded psycopg connection pool"""
+    
+    def __init__(self, conninfo, min_size=1, max_size=10, timeout=30.0, check_interval=30.0):
+        self.conninfo = conninfo
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_interval = check_interval
+        
+        self._cond = threading.Condition()
+        self._idle = deque()  # (connection, last_used) pairs
+        self._size = 0
+        self._closed = False
+        self._stats = {
+            'connections_opened': 0,
+            'connections_lost': 0,
+            'checkouts': 0,
+            'checkout_timeouts': 0,
+            'waits': 0,
+        }
+        self._waiting = 0
+        
+        try:
+            for _ in range(min_size):
+                conn = self._open()
+                self._idle.append((conn, time.monotonic()))
+                self._size += 1
+        except Exception:
+            # တစ်ဝက်ဖွင့်ပြီးသား connections တွေ မပေါက်ကျန်အောင် ပိတ်မယ်
+            self.close()
+            raise
+    
+    def _open(self):
+        """Connection အသစ် ဖွင့်မယ်"""
+        conn = psycopg.connect(self.conninfo)
+        with self._cond:
+            self._stats['connections_opened'] += 1
+        return conn
+    
+    def _is_healthy(self, conn, last_used):
+        """Checkout မလုပ်ခင် connection ကောင်းမကောင်း စစ်မယ်"""
+        if conn.closed or conn.broken:
+            return False
+        if conn.info.transaction_status != TransactionStatus.IDLE:
+            return False
+        if time.monotonic() - last_used < self.check_interval:
+            return True
+        try:
+            conn.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg.Error:
+            return False
+    
+    def _discard(self, conn):
+        """ပျက်နေတဲ့ connection ကို pool ထဲက ဖယ်မယ်"""
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._stats['connections_lost'] += 1
+            self._cond.notify()
+    
+    def getconn(self):
+        """Pool ထဲက connection တစ်ခု checkout လုပ်မယ်"""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise PoolTimeout("Connection pool is closed")
+                
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['checkout_timeouts'] += 1
+                        raise PoolTimeout(
+                            f"No connection available after {self.timeout}s "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._stats['waits'] += 1
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                else:
+                    conn, last_used = None, None
+                    self._size += 1
+            
+            if conn is None:
+                # Lock အပြင်မှာ connect လုပ်မယ် (တခြား threads တွေ မစောင့်ရအောင်)
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._is_healthy(conn, last_used):
+                logger.warning("⚠️ Dropped database connection detected, reconnecting")
+                self._discard(conn)
+                continue
+            
+            with self._cond:
+                self._stats['checkouts'] += 1
+            return conn
+    
+    def putconn(self, conn):
+        """Connection ကို pool ထဲ ပြန်ထည့်မယ်"""
+        if conn.closed or conn.broken:
+            self._discard(conn)
+            return
+        
+        if conn.info.transaction_status != TransactionStatus.IDLE:
+            try:
+                conn.rollback()
+            except psycopg.Error:
+                self._discard(conn)
+                return
+        
+        with self._cond:
+            if self._closed:
+                self._size -= 1
+                conn.close()
+                return
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+    
+    @contextmanager
+    def connection(self):
+        """Connection checkout - success ဆို commit, error ဆို rollback"""
+        try:
+            conn = self.getconn()
+        except Exception:
+            metrics.record_error()
+            raise
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            metrics.record_error()
+            if not (conn.closed or conn.broken):
+                try:
+                    conn.rollback()
+                except psycopg.Error:
+                    pass
+            raise
+        finally:
+            self.putconn(conn)
+    
+    def get_stats(self):
+        """Pool statistics"""
+        with self._cond:
+            return {
+                **self._stats,
+                'pool_size': self._size,
+                'pool_available': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'requests_waiting': self._waiting,
+                'pool_min': self.min_size,
+                'pool_max': self.max_size,
+            }
+    
+    def close(self):
+        """Idle connections အားလုံးကို ပိတ်မယ်"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._size -= 1
+                conn.close()
+            self._cond.notify_all()
+
+# ===== channel_posts monthly partitions =====
+
+PARTITION_PREFIX = 'channel_posts_p'  # + YYYYMM
+# search_vector (generated) မပါတဲ့ columns - rows တွေ copy လုပ်ရင် သုံးမယ်
+CHANNEL_POST_COLUMNS = (
+    'id, post_id, channel_id, message_type, content, caption, media_url, file_id, file_size, '
+    'width, height, views, date, created_at, updated_at, edit_date'
+)
+
+
+def month_start(value):
+    """value ပါတဲ့ လရဲ့ ပထမနေ့ (00:00)"""
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    """month (လရဲ့ ပထမနေ့) ကနေ count လ ရှေ့/နောက်"""
+    index = month.year * 12 + month.month - 1 + count
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    """လတစ်လရဲ့ partition table name (channel_posts_p202601)"""
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def _create_partition(cur, month):
+    """[month, month + 1) range partition ကို (မရှိသေးရင်) ဖန်တီးမယ် - lock ကို caller က ယူထားရမယ်"""
+    cur.execute(sql.SQL(
+        "CREATE TABLE IF NOT EXISTS {} PARTITION OF channel_posts FOR VALUES FROM ({}) TO ({})"
+    ).format(
+        sql.Identifier(partition_name(month)),
+        sql.Literal(month),
+        sql.Literal(add_months(month, 1))
+    ))
+
+
+def _partition_channel_posts(cur):
+    """channel_posts ကို date နဲ့ monthly range partitioned table အဖြစ် ပြောင်းမယ် (rows, ids မပြောင်းဘူး)
+
+    Partitioned table ရဲ့ unique constraints တွေမှာ partition key (date) ပါရမယ်။
+    Telegram က edit လုပ်လည်း message date မပြောင်းလို့ (post_id, channel_id, date) က post တစ်ခုကို သတ်မှတ်နိုင်တယ်။
+    """
+    cur.execute("ALTER TABLE channel_posts RENAME TO channel_posts_unpartitioned")
+    cur.execute("ALTER SEQUENCE channel_posts_id_seq OWNED BY NONE")
+    # Table အသစ်က နာမည်တူ constraints / indexes တွေ ပြန်သုံးမှာမို့ အဟောင်းတွေ ဖယ်မယ်
+    cur.execute("""
+        ALTER TABLE channel_posts_unpartitioned
+        DROP CONSTRAINT IF EXISTS channel_posts_pkey,
+        DROP CONSTRAINT IF EXISTS channel_posts_post_id_channel_id_key
+    """)
+    cur.execute("DROP INDEX IF EXISTS idx_channel_posts_date_id, idx_channel_posts_search")
+    cur.execute("""
+        CREATE TABLE channel_posts (
+            id INTEGER NOT NULL DEFAULT nextval('channel_posts_id_seq'),
+            post_id INTEGER NOT NULL,
+            channel_id BIGINT NOT NULL,
+            message_type VARCHAR(50),
+            content TEXT,
+            caption TEXT,
+            media_url TEXT,
+            file_id TEXT,
+            file_size INTEGER,
+            width INTEGER,
+            height INTEGER,
+            views INTEGER DEFAULT 0,
+            date TIMESTAMP NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            search_vector tsvector GENERATED ALWAYS AS (
+                to_tsvector('simple', COALESCE(content, '') || ' ' || COALESCE(caption, ''))
+            ) STORED,
+            edit_date TIMESTAMP,
+            PRIMARY KEY (id, date),
+            UNIQUE (post_id, channel_id, date)
+        ) PARTITION BY RANGE (date)
+    """)
+
+    # ရှိပြီးသား posts ရဲ့ ပထမဆုံးလကနေ DB_PARTITION_PREMAKE_MONTHS လ ရှေ့အထိ
+    cur.execute("SELECT MIN(COALESCE(date, created_at)) FROM channel_posts_unpartitioned")
+    oldest = cur.fetchone()[0]
+    month = month_start(min(oldest, datetime.now()) if oldest else datetime.now())
+    last = add_months(month_start(datetime.now()), config.DB_PARTITION_PREMAKE_MONTHS)
+    while month <= last:
+        _create_partition(cur, month)
+        month = add_months(month, 1)
+
+    cur.execute("""
+        UPDATE channel_posts_unpartitioned SET date = COALESCE(created_at, CURRENT_TIMESTAMP)
+        WHERE date IS NULL
+    """)
+    cur.execute(f"""
+        INSERT INTO channel_posts ({CHANNEL_POST_COLUMNS})
+        SELECT {CHANNEL_POST_COLUMNS} FROM channel_posts_unpartitioned
+    """)
+    cur.execute("DROP TABLE channel_posts_unpartitioned")
+    cur.execute("ALTER SEQUENCE channel_posts_id_seq OWNED BY channel_posts.id")
+    cur.execute("CREATE INDEX idx_channel_posts_date_id ON channel_posts (date DESC, id DESC)")
+    cur.execute("CREATE INDEX idx_channel_posts_search ON channel_posts USING GIN (search_vector)")
+
+
+def _unixtime(value):
+    """datetime → unix time (microseconds ပါမှ float - import ပြန်လုပ်ရင် date key မပြောင်းအောင်)"""
+    if value is None:
+        return None
+    return value.timestamp() if value.microsecond else int(value.timestamp())
+
+
+def _archive_record(row):
+    """Archive လုပ်မယ့် row → import_posts.py / save_channel_posts နဲ့ ပြန်ထည့်လို့ရတဲ့ post dict"""
+    return {
+        'message_id': row['post_id'],
+        'channel_id': row['channel_id'],
+        'message_type': row['message_type'],
+        'content': row['content'],
+        'caption': row['caption'],
+        'media_url': row['media_url'],
+        'file_id': row['file_id'],
+        'file_size': row['file_size'],
+        'width': row['width'],
+        'height': row['height'],
+        'date': _unixtime(row['date']),
+        'edit_date': _unixtime(row['edit_date'])
+    }
+
+
+# Schema migrations - schema_migrations table ထဲမှာ apply ပြီးသား versions မှတ်ထားမယ်
+# (အသစ်ထည့်ရင် list အဆုံးမှာပဲ ထည့်ပါ - ရှိပြီးသား entries တွေကို မပြင်ရ)
+# Entry တစ်ခုက SQL string ဒါမှမဟုတ် cursor ကိုယူတဲ့ function ဖြစ်နိုင်တယ်
+MIGRATIONS = [
+    # 1: base schema
+    [
+        """
+        CREATE TABLE IF NOT EXISTS channel_posts (
+            id SERIAL PRIMARY KEY,
+            post_id INTEGER NOT NULL,
+            channel_id BIGINT NOT NULL,
+            message_type VARCHAR(50),
+            content TEXT,
+            caption TEXT,
+            media_url TEXT,
+            file_id TEXT,
+            file_size INTEGER,
+            width INTEGER,
+            height INTEGER,
+            views INTEGER DEFAULT 0,
+            date TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(post_id, channel_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS posts (
+            id SERIAL PRIMARY KEY,
+            post_id VARCHAR(255) UNIQUE NOT NULL,
+            title TEXT,
+            content TEXT,
+            link TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id SERIAL PRIMARY KEY,
+            user_id BIGINT UNIQUE NOT NULL,
+            username VARCHAR(100),
+            first_name VARCHAR(100),
+            last_name VARCHAR(100),
+            is_admin BOOLEAN DEFAULT FALSE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS logs (
+            id SERIAL PRIMARY KEY,
+            level VARCHAR(20),
+            message TEXT,
+            source VARCHAR(100),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ],
+    # 2: keyset pagination (date မရှိတဲ့ rows တွေကို created_at နဲ့ ဖြည့်မယ်)
+    [
+        "UPDATE channel_posts SET date = created_at WHERE date IS NULL",
+        "CREATE INDEX IF NOT EXISTS idx_channel_posts_date_id ON channel_posts (date DESC, id DESC)",
+    ],
+    # 3: full-text search (content + caption) - Burmese text အတွက် 'simple' config သုံးမယ်
+    [
+        """
+        ALTER TABLE channel_posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', COALESCE(content, '') || ' ' || COALESCE(caption, ''))
+        ) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_channel_posts_search ON channel_posts USING GIN (search_vector)",
+    ],
+    # 4: save path ကနေ update လုပ်တဲ့ statistics summary tables (ရှိပြီးသား posts နဲ့ backfill)
+    [
+        """
+        CREATE TABLE IF NOT EXISTS post_stats (
+            id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+            total_posts BIGINT NOT NULL DEFAULT 0,
+            latest_post TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS post_type_counts (
+            message_type VARCHAR(50) PRIMARY KEY,
+            count BIGINT NOT NULL DEFAULT 0
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS post_daily_counts (
+            day DATE PRIMARY KEY,
+            count BIGINT NOT NULL DEFAULT 0
+        )
+        """,
+        """
+        INSERT INTO post_type_counts (message_type, count)
+        SELECT COALESCE(message_type, 'unknown'), COUNT(*) FROM channel_posts GROUP BY 1
+        ON CONFLICT (message_type) DO NOTHING
+        """,
+        """
+        INSERT INTO post_daily_counts (day, count)
+        SELECT date::date, COUNT(*) FROM channel_posts WHERE date IS NOT NULL GROUP BY 1
+        ON CONFLICT (day) DO NOTHING
+        """,
+        """
+        INSERT INTO post_stats (id, total_posts, latest_post)
+        SELECT TRUE, COUNT(*), MAX(date) FROM channel_posts
+        ON CONFLICT (id) DO NOTHING
+        """,
+    ],
+    # 5: log retention (prune_logs)
+    [
+        "CREATE INDEX IF NOT EXISTS idx_logs_created_at ON logs (created_at)",
+    ],
+    # 6: edited posts - အဟောင်း edit က အသစ်ကို မဖျက်ရေးအောင်
+    [
+        "ALTER TABLE channel_posts ADD COLUMN IF NOT EXISTS edit_date TIMESTAMP",
+    ],
+    # 7: monthly date partitions (hot queries က လတ်တလော partitions တွေပဲ ဖတ်မယ်) + type အလိုက် daily rollups
+    [
+        _partition_channel_posts,
+        """
+        CREATE TABLE IF NOT EXISTS post_daily_type_counts (
+            day DATE NOT NULL,
+            message_type VARCHAR(50) NOT NULL,
+            count BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, message_type)
+        )
+        """,
+        """
+        INSERT INTO post_daily_type_counts (day, message_type, count)
+        SELECT date::date, COALESCE(message_type, 'unknown'), COUNT(*) FROM channel_posts GROUP BY 1, 2
+        ON CONFLICT (day, message_type) DO NOTHING
+        """,
+    ],
+]
+
+# Workers / deploy step တွေ တပြိုင်နက် migrate (partitions ဖန်တီး) မလုပ်အောင် pg_advisory_lock key
+MIGRATION_LOCK_ID = 0x34757464  # '4utd'
+# `python database.py maintain` နှစ်ခု တပြိုင်နက် archive မလုပ်အောင်
+MAINTENANCE_LOCK_ID = 0x34757465
+
 class Database:
+    """Postgres access - pool ကို ပထမဆုံး သုံးတဲ့အချိန်မှ ဖွင့်မယ် (import လုပ်ရုံနဲ့ မ connect ဘူး)"""
+    
     def __init__(self):
-        self.conn = None
-        self.connect()
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+        # Fork မတိုင်ခင် parent ဖွင့်ထားတဲ့ pools - child ထဲမှာ close/GC မလုပ်ရ (parent ရဲ့ sockets)
+        self._inherited = []
+        # Single-row lookups (read-through) - save path တွေက commit ပြီးရင် invalidate လုပ်မယ်
+        self._post_cache = ReadThroughCache(self._load_post)
+        # ရှိပြီးသားလို့ သိထားတဲ့ channel_posts partitions (လရဲ့ ပထမနေ့ တွေ)
+        self._partitions = set()
+        metrics.register_gauges(self._pool_gauges)
+    
+    @property
+    def pool(self):
+        """Process ဒီထဲမှာ ဖွင့်ထားတဲ့ pool (မရှိသေးရင် / fork ပြီးရင် အသစ်ဖွင့်မယ်)"""
+        pool = self._pool
+        if pool is not None and self._pid == os.getpid():
+            return pool
+        with self._lock:
+            if self._pool is not None and self._pid != os.getpid():
+                # gunicorn --preload - parent ရဲ့ connections တွေကို child က မထိဘဲ ထားခဲ့မယ်
+                self._inherited.append(self._pool)
+                self._pool = None
+            if self._pool is None:
+                self.connect()
+            return self._pool
+    
+    def _pool_gauges(self):
+        """/metrics အတွက် pool gauges"""
+        stats = self.get_pool_stats()
+        if not stats:
+            return []
+        return [
+            ('db_pool_size', {}, stats['pool_size']),
+            ('db_pool_in_use', {}, stats['in_use']),
+            ('db_pool_requests_waiting', {}, stats['requests_waiting']),
+        ]
     
     def connect(self):
-        """Database connection တည်ဆောက်မယ်"""
+        """Database connection pool တည်ဆောက်မယ် (self._lock ကိုင်ထားပြီး ခေါ်ရမယ်)"""
         try:
-            self.conn = psycopg.connect(config.DATABASE_URL)
+            pool = ConnectionPool(
+                config.DATABASE_URL,
+                min_size=config.DB_POOL_MIN_SIZE,
+                max_size=config.DB_POOL_MAX_SIZE,
+                timeout=config.DB_POOL_TIMEOUT,
+                check_interval=config.DB_POOL_CHECK_INTERVAL
+            )
             logger.info("✅ Database connection successful")
-            self.create_tables()
         except Exception as e:
             logger.error(f"❌ Database connection error: {e}")
             raise
-    
-    def create_tables(self):
-        """လိုအပ်တဲ့ tables တွေ create လုပ်မယ်"""
-        tables = [
-            """
-            CREATE TABLE IF NOT EXISTS channel_posts (
-                id SERIAL PRIMARY KEY,
-                post_id INTEGER NOT NULL,
-                channel_id BIGINT NOT NULL,
-                message_type VARCHAR(50),
-                content TEXT,
-                caption TEXT,
-                media_url TEXT,
-                file_id TEXT,
-                file_size INTEGER,
-                width INTEGER,
-                height INTEGER,
-                views INTEGER DEFAULT 0,
-                date TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(post_id, channel_id)
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS posts (
-                id SERIAL PRIMARY KEY,
-                post_id VARCHAR(255) UNIQUE NOT NULL,
-                title TEXT,
-                content TEXT,
-                link TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT UNIQUE NOT NULL,
-                username VARCHAR(100),
-                first_name VARCHAR(100),
-                last_name VARCHAR(100),
-                is_admin BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS logs (
-                id SERIAL PRIMARY KEY,
-                level VARCHAR(20),
-                message TEXT,
-                source VARCHAR(100),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        ]
         
-        try:
-            with self.conn.cursor() as cur:
-                for table_sql in tables:
-                    cur.execute(table_sql)
-                self.conn.commit()
-                logger.info("✅ Database tables created/verified")
-        except Exception as e:
-            logger.error(f"❌ Table creation error: {e}")
-            self.conn.rollback()
+        if config.DB_AUTO_MIGRATE:
+            try:
+                self._migrate(pool)
+                self._ensure_partitions(self._upcoming_months(), pool)
+            except Exception:
+                # Pool ကို မသိမ်းရသေးဘူး - မပိတ်ရင် retry တိုင်း min_size connections ပေါက်ကျန်မယ်
+                pool.close()
+                raise
+        self._pool, self._pid = pool, os.getpid()
+    
+    def migrate(self):
+        """Pending migrations တွေ apply လုပ်မယ် (deploy step - `python database.py migrate`)"""
+        return self._migrate(self.pool)
+    
+    @timed_query
+    def _migrate(self, pool):
+        """Schema version နောက်ကျနေမှ advisory lock ယူပြီး migrations တွေကို တစ်ခုချင်း transaction နဲ့ apply လုပ်မယ်"""
+        target = len(MIGRATIONS)
+        with pool.connection() as conn, conn.cursor() as cur:
+            # Up-to-date ဖြစ်နေရင် (deploy တစ်ခုမှာ ပထမ worker ပြီးရင်) query တစ်ခုပဲ ကုန်မယ်
+            current = self._schema_version(cur)
+            conn.commit()
+            if current >= target:
+                return current
+            
+            cur.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+            conn.commit()
+            try:
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version INTEGER PRIMARY KEY,
+                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.commit()
+                # Lock စောင့်နေတုန်း တခြား process က apply လုပ်သွားနိုင်လို့ ပြန်ဖတ်မယ်
+                current = self._schema_version(cur)
+                for version in range(current + 1, target + 1):
+                    for statement in MIGRATIONS[version - 1]:
+                        if callable(statement):
+                            statement(cur)
+                        else:
+                            cur.execute(statement)
+                    cur.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (version,))
+                    conn.commit()
+                    logger.info(f"✅ Database migration {version} applied")
+                return target
+            finally:
+                conn.rollback()
+                cur.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+                conn.commit()
+    
+    def _schema_version(self, cur):
+        """Apply ပြီးသား နောက်ဆုံး migration version (schema_migrations မရှိသေးရင် 0)"""
+        cur.execute("SELECT to_regclass('schema_migrations') IS NOT NULL")
+        if not cur.fetchone()[0]:
+            return 0
+        cur.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+        return cur.fetchone()[0]
+    
+    def _upcoming_months(self, months_ahead=None):
+        """ဒီလကနေ months_ahead လ ရှေ့အထိ (partitions ကြိုဖန်တီးဖို့)"""
+        months_ahead = config.DB_PARTITION_PREMAKE_MONTHS if months_ahead is None else months_ahead
+        current = month_start(datetime.now())
+        return {add_months(current, count) for count in range(months_ahead + 1)}
+    
+    def _ensure_partitions(self, months, pool=None):
+        """months တွေအတွက် channel_posts partitions မရှိသေးရင် ဖန်တီးမယ် (သိပြီးသား months ဆို query မလုပ်ဘူး)"""
+        missing = set(months) - self._partitions
+        if not missing:
+            return
+        with (pool or self.pool).connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('channel_posts')")
+            row = cur.fetchone()
+            if row and row[0]:
+                names = {partition_name(month): month for month in missing}
+                cur.execute(
+                    "SELECT name FROM unnest(%s::text[]) AS name WHERE to_regclass(name) IS NULL",
+                    (list(names),)
+                )
+                to_create = sorted(names[name] for name, in cur.fetchall())
+                if to_create:
+                    cur.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+                    for month in to_create:
+                        _create_partition(cur, month)
+                        logger.info(f"🗂️ Created partition {partition_name(month)}")
+        # Archive လုပ်လို့ရတဲ့ လဟောင်းတွေကို မမှတ်ဘူး (maintenance က drop လုပ်သွားနိုင်တယ်)
+        recent = add_months(month_start(datetime.now()), -1)
+        self._partitions.update(month for month in missing if month >= recent)
     
     def save_channel_post(self, post_data):
         """Channel post ကို database မှာ save လုပ်မယ်"""
+        return self.save_channel_posts([post_data]) == 1
+    
+    @timed_query
+    def save_channel_posts(self, posts):
+        """Channel posts တွေကို transaction တစ်ခု၊ pipelined executemany တစ်ခုနဲ့ upsert လုပ်မယ်"""
+        # Date က conflict key ထဲပါတယ် - date မပါတဲ့ row ကို now() နဲ့ ထည့်ရင် edit တိုင်း row အသစ်ဖြစ်မယ်
+        dated = [post_data for post_data in posts if post_data.get('date')]
+        if len(dated) < len(posts):
+            logger.warning(f"⚠️ Skipping {len(posts) - len(dated)} channel posts without a date")
+        posts = dated
+        if not posts:
+            return 0
         try:
-            with self.conn.cursor() as cur:
-                cur.execute("""
+            params = [self._channel_post_params(post_data) for post_data in posts]
+            self._ensure_partitions({month_start(row[10]) for row in params})
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.executemany("""
                     INSERT INTO channel_posts 
                     (post_id, channel_id, message_type, content, caption, media_url, 
-                     file_id, file_size, width, height, date) 
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (post_id, channel_id) DO UPDATE
+                     file_id, file_size, width, height, date, edit_date) 
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (post_id, channel_id, date) DO UPDATE
                     SET content = EXCLUDED.content,
                         caption = EXCLUDED.caption,
                         media_url = EXCLUDED.media_url,
@@ -106,97 +648,190 @@ class Database:
                         file_size = EXCLUDED.file_size,
                         width = EXCLUDED.width,
                         height = EXCLUDED.height,
+                        edit_date = EXCLUDED.edit_date,
                         updated_at = CURRENT_TIMESTAMP
-                    RETURNING id
-                """, (
-                    post_data.get('message_id'),
-                    post_data.get('channel_id'),
-                    post_data.get('message_type'),
-                    post_data.get('content', ''),
-                    post_data.get('caption', ''),
-                    post_data.get('media_url'),
-                    post_data.get('file_id'),
-                    post_data.get('file_size'),
-                    post_data.get('width'),
-                    post_data.get('height'),
-                    datetime.fromtimestamp(post_data.get('date')) if post_data.get('date') else None
-                ))
-                self.conn.commit()
-                return True
+                    -- Retries / ပိုဟောင်းတဲ့ edits / ပြောင်းလဲမှုမရှိတဲ့ writes တွေကို ကျော်မယ်
+                    WHERE EXCLUDED.edit_date IS NOT NULL
+                      AND (channel_posts.edit_date IS NULL OR EXCLUDED.edit_date >= channel_posts.edit_date)
+                      AND (channel_posts.content, channel_posts.caption, channel_posts.media_url,
+                           channel_posts.file_id, channel_posts.file_size, channel_posts.width,
+                           channel_posts.height)
+                          IS DISTINCT FROM
+                          (EXCLUDED.content, EXCLUDED.caption, EXCLUDED.media_url, EXCLUDED.file_id,
+                           EXCLUDED.file_size, EXCLUDED.width, EXCLUDED.height)
+                    RETURNING created_at = updated_at AS inserted, message_type, date, post_id, channel_id
+                """, params, returning=True)
+                
+                # Insert အသစ်ဖြစ်တဲ့ rows တွေကိုပဲ statistics ထဲ ထည့်တွက်မယ် - partitioned table မှာ xmax မရလို့
+                # created_at = updated_at နဲ့ စစ်မယ် (batch တစ်ခုထဲမှာ insert ပြီး ပြန် edit ရင် key တူလို့ တစ်ခါပဲ)
+                inserted = {}
+                while True:
+                    row = cur.fetchone()
+                    if row and row[0]:
+                        inserted[row[3:]] = row[:3]
+                    if not cur.nextset():
+                        break
+                self._update_post_stats(cur, list(inserted.values()))
+            return len(posts)
         except Exception as e:
             logger.error(f"❌ Channel post save error: {e}")
-            self.conn.rollback()
-            return False
+            return 0
+    
+    def _update_post_stats(self, cur, inserted):
+        """Insert လုပ်ခဲ့တဲ့ rows တွေအတွက် summary counters တွေ တိုးမယ် (upsert နဲ့ transaction တစ်ခုတည်း)"""
+        if not inserted:
+            return
+        latest_post = max(date for _, _, date in inserted)
+        self._add_post_counts(cur, Counter(
+            (message_type or 'unknown', date.date()) for _, message_type, date in inserted
+        ))
+        cur.execute("""
+            INSERT INTO post_stats (id, total_posts, latest_post) VALUES (TRUE, %s, %s)
+            ON CONFLICT (id) DO UPDATE
+            SET total_posts = post_stats.total_posts + EXCLUDED.total_posts,
+                latest_post = GREATEST(post_stats.latest_post, EXCLUDED.latest_post)
+        """, (len(inserted), latest_post))
+    
+    def _add_post_counts(self, cur, counts):
+        """{(message_type, day): count} ကို type / daily / daily-type counters ထဲ ပေါင်းမယ် (archive ဆို count အနှုတ်)"""
+        type_counts, daily_counts = Counter(), Counter()
+        for (message_type, day), count in counts.items():
+            type_counts[message_type] += count
+            daily_counts[day] += count
+        
+        # Row locks တွေကို အစဉ်လိုက်ယူမယ် (concurrent batches deadlock မဖြစ်အောင်)
+        cur.executemany("""
+            INSERT INTO post_type_counts (message_type, count) VALUES (%s, %s)
+            ON CONFLICT (message_type) DO UPDATE SET count = post_type_counts.count + EXCLUDED.count
+        """, sorted(type_counts.items()))
+        cur.executemany("""
+            INSERT INTO post_daily_counts (day, count) VALUES (%s, %s)
+            ON CONFLICT (day) DO UPDATE SET count = post_daily_counts.count + EXCLUDED.count
+        """, sorted(daily_counts.items()))
+        cur.executemany("""
+            INSERT INTO post_daily_type_counts (day, message_type, count) VALUES (%s, %s, %s)
+            ON CONFLICT (day, message_type) DO UPDATE SET count = post_daily_type_counts.count + EXCLUDED.count
+        """, sorted((day, message_type, count) for (message_type, day), count in counts.items()))
     
-    def get_channel_posts(self, limit=50, offset=0):
-        """Channel posts အားလုံးကို ယူမယ်"""
+    def _channel_post_params(self, post_data):
+        """Post dict ကို upsert parameters အဖြစ် ပြောင်းမယ်"""
+        return (
+            post_data.get('message_id'),
+            post_data.get('channel_id'),
+            post_data.get('message_type'),
+            post_data.get('content', ''),
+            post_data.get('caption', ''),
+            post_data.get('media_url'),
+            post_data.get('file_id'),
+            post_data.get('file_size'),
+            post_data.get('width'),
+            post_data.get('height'),
+            datetime.fromtimestamp(post_data.get('date')) if post_data.get('date') else None,
+            datetime.fromtimestamp(post_data.get('edit_date')) if post_data.get('edit_date') else None
+        )
+    
+    @timed_query
+    def get_channel_posts(self, limit=50, cursor=None):
+        """Channel posts တွေကို (date, id) keyset pagination နဲ့ ယူမယ် (cursor = decode_cursor() result)"""
         try:
-            with self.conn.cursor(row_factory=dict_row) as cur:
-                cur.execute("""
-                    SELECT * FROM channel_posts 
-                    ORDER BY date DESC 
-                    LIMIT %s OFFSET %s
-                """, (limit, offset))
+            with self.pool.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+                if cursor is None:
+                    cur.execute("""
+                        SELECT * FROM channel_posts 
+                        ORDER BY date DESC, id DESC 
+                        LIMIT %s
+                    """, (limit,))
+                else:
+                    # date <= ... က partition pruning အတွက် (row comparison နဲ့ မ prune ဘူး)
+                    cur.execute("""
+                        SELECT * FROM channel_posts 
+                        WHERE date <= %s::timestamp AND (date, id) < (%s::timestamp, %s)
+                        ORDER BY date DESC, id DESC 
+                        LIMIT %s
+                    """, (cursor[0], *cursor, limit))
                 return cur.fetchall()
         except Exception as e:
             logger.error(f"❌ Get channel posts error: {e}")
             return []
     
-    def get_channel_post_by_id(self, post_id):
-        """Channel post by ID"""
+    @timed_query
+    def search_channel_posts(self, query, limit=20, offset=0):
+        """GIN index ပေါ်က full-text search - (rank အစဉ် rows, total matches) ပြန်ပေးမယ်"""
+        try:
+            with self.pool.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+                cur.execute("""
+                    SELECT p.*, ts_rank(p.search_vector, q) AS rank, COUNT(*) OVER () AS total
+                    FROM channel_posts p, websearch_to_tsquery('simple', %s) q
+                    WHERE p.search_vector @@ q
+                    ORDER BY rank DESC, p.date DESC, p.id DESC
+                    LIMIT %s OFFSET %s
+                """, (query, limit, offset))
+                rows = cur.fetchall()
+                return rows, rows[0]['total'] if rows else 0
+        except Exception as e:
+            logger.error(f"❌ Search channel posts error: {e}")
+            return [], 0
+    
+    @timed_query
+    def get_channel_post_by_id(self, post_id, channel_id):
+        """Channel post by ID (message_id တွေက channel တစ်ခုအတွင်းမှာပဲ unique)"""
         try:
-            with self.conn.cursor(row_factory=dict_row) as cur:
-                cur.execute("SELECT * FROM channel_posts WHERE post_id = %s", (post_id,))
+            with self.pool.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+                cur.execute("""
+                    SELECT * FROM channel_posts WHERE channel_id = %s AND post_id = %s
+                    ORDER BY date DESC LIMIT 1
+                """, (channel_id, post_id))
                 return cur.fetchone()
         except Exception as e:
             logger.error(f"❌ Get channel post error: {e}")
             return None
     
+    @timed_query
     def get_post_count(self):
         """Total post count"""
         try:
-            with self.conn.cursor() as cur:
-                cur.execute("SELECT COUNT(*) as count FROM channel_posts")
-                return cur.fetchone()[0]
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.execute("SELECT total_posts FROM post_stats")
+                row = cur.fetchone()
+                return row[0] if row else 0
         except Exception as e:
             logger.error(f"❌ Get post count error: {e}")
             return 0
     
+    @timed_query
     def get_stats(self):
-        """Get channel statistics"""
+        """Get channel statistics (summary tables ကနေ O(1) ဖတ်မယ်)"""
         try:
-            with self.conn.cursor() as cur:
-                # Total posts
-                cur.execute("SELECT COUNT(*) as total_posts FROM channel_posts")
-                total_posts = cur.fetchone()[0]
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                # Total posts and latest post date
+                cur.execute("SELECT total_posts, latest_post FROM post_stats")
+                row = cur.fetchone()
+                total_posts, latest_post = row if row else (0, None)
                 
                 # Posts by type
-                cur.execute("""
-                    SELECT 
-                        message_type,
-                        COUNT(*) as count
-                    FROM channel_posts
-                    GROUP BY message_type
-                """)
+                cur.execute("SELECT message_type, count FROM post_type_counts")
                 type_counts = {row[0]: row[1] for row in cur.fetchall()}
                 
-                # Latest post date
-                cur.execute("SELECT MAX(date) as latest_post FROM channel_posts")
-                latest_post = cur.fetchone()[0]
+                # Today's posts
+                cur.execute("SELECT count FROM post_daily_counts WHERE day = CURRENT_DATE")
+                row = cur.fetchone()
+                today_posts = row[0] if row else 0
                 
                 return {
                     'total_posts': total_posts,
                     'type_counts': type_counts,
-                    'latest_post': latest_post
+                    'latest_post': latest_post,
+                    'today_posts': today_posts
                 }
         except Exception as e:
             logger.error(f"❌ Get stats error: {e}")
-            return {'total_posts': 0, 'type_counts': {}, 'latest_post': None}
+            return {'total_posts': 0, 'type_counts': {}, 'latest_post': None, 'today_posts': 0}
     
+    @timed_query
     def save_post(self, post_id, title, content, link=None):
         """Regular post ကို save လုပ်မယ်"""
         try:
-            with self.conn.cursor() as cur:
+            with self.pool.connection() as conn, conn.cursor() as cur:
                 cur.execute("""
                     INSERT INTO posts (post_id, title, content, link) 
                     VALUES (%s, %s, %s, %s)
@@ -207,27 +842,31 @@ class Database:
                         updated_at = CURRENT_TIMESTAMP
                     RETURNING id
                 """, (post_id, title, content, link))
-                self.conn.commit()
-                return True
+            self._post_cache.invalidate([post_id])
+            return True
         except Exception as e:
             logger.error(f"❌ Post save error: {e}")
-            self.conn.rollback()
             return False
     
     def get_post(self, post_id):
-        """Get a post by ID"""
+        """Get a post by ID (read-through cache)"""
         try:
-            with self.conn.cursor(row_factory=dict_row) as cur:
-                cur.execute("SELECT * FROM posts WHERE post_id = %s", (post_id,))
-                return cur.fetchone()
+            return self._post_cache.get(post_id)
         except Exception as e:
             logger.error(f"❌ Get post error: {e}")
             return None
     
+    @timed_query
+    def _load_post(self, post_id):
+        with self.pool.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.execute("SELECT * FROM posts WHERE post_id = %s", (post_id,))
+            return cur.fetchone()
+    
+    @timed_query
     def get_all_posts(self, limit=100):
         """Get all posts"""
         try:
-            with self.conn.cursor(row_factory=dict_row) as cur:
+            with self.pool.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
                 cur.execute("SELECT * FROM posts ORDER BY created_at DESC LIMIT %s", (limit,))
                 return cur.fetchall()
         except Exception as e:
@@ -236,21 +875,194 @@ class Database:
     
     def add_log(self, level, message, source):
         """Add log entry"""
+        self.add_logs([(level, message, source, datetime.now())])
+    
+    @timed_query
+    def add_logs(self, entries):
+        """(level, message, source, created_at) entries တွေကို executemany တစ်ခုနဲ့ ထည့်မယ်"""
+        if not entries:
+            return 0
         try:
-            with self.conn.cursor() as cur:
-                cur.execute(
-                    "INSERT INTO logs (level, message, source) VALUES (%s, %s, %s)",
-                    (level, message, source)
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.executemany(
+                    "INSERT INTO logs (level, message, source, created_at) VALUES (%s, %s, %s, %s)",
+                    entries
                 )
-                self.conn.commit()
+                return len(entries)
         except Exception as e:
             logger.error(f"❌ Log save error: {e}")
+            return 0
+    
+    @timed_query
+    def prune_logs(self, older_than, chunk_size=5000):
+        """older_than ထက်ဟောင်းတဲ့ logs တွေကို chunk လိုက် (transaction သေးသေးလေးတွေနဲ့) ဖျက်မယ်"""
+        deleted = 0
+        try:
+            while True:
+                with self.pool.connection() as conn, conn.cursor() as cur:
+                    cur.execute("""
+                        DELETE FROM logs WHERE id IN (
+                            SELECT id FROM logs WHERE created_at < %s
+                            ORDER BY created_at LIMIT %s
+                        )
+                    """, (older_than, chunk_size))
+                    chunk_deleted = cur.rowcount
+                deleted += chunk_deleted
+                if chunk_deleted < chunk_size:
+                    return deleted
+        except Exception as e:
+            logger.error(f"❌ Log prune error: {e}")
+            return deleted
+    
+    def upsert_user(self, user_id, username, first_name, last_name):
+        """Bot user ကို save/update လုပ်မယ်"""
+        return self.upsert_users([(user_id, username, first_name, last_name)]) == 1
+    
+    @timed_query
+    def upsert_users(self, users):
+        """(user_id, username, first_name, last_name) rows တွေကို executemany တစ်ခုနဲ့ upsert လုပ်မယ်"""
+        if not users:
+            return 0
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.executemany("""
+                    INSERT INTO users (user_id, username, first_name, last_name)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (user_id) DO UPDATE
+                    SET username = EXCLUDED.username,
+                        first_name = EXCLUDED.first_name,
+                        last_name = EXCLUDED.last_name
+                """, users)
+                return len(users)
+        except Exception as e:
+            logger.error(f"❌ User save error: {e}")
+            return 0
+    
+    def maintain_partitions(self, premake_months=None, archive_after_months=None, archive_dir=None):
+        """channel_posts partition maintenance (cron job - `python database.py maintain`)
+        
+        နောက် premake_months လ partitions တွေ ကြိုဖန်တီးမယ်၊ archive_after_months (0 = မလုပ်) ထက်ဟောင်းတဲ့
+        partitions တွေကို archive_dir ထဲ jsonl.gz (import_posts.py နဲ့ ပြန်ထည့်လို့ရ) အဖြစ် ရေးပြီး drop မယ်။
+        """
+        archive_after_months = (config.DB_ARCHIVE_AFTER_MONTHS if archive_after_months is None
+                                else archive_after_months)
+        archive_dir = archive_dir or config.DB_ARCHIVE_DIR
+        self._ensure_partitions(self._upcoming_months(premake_months))
+        if archive_after_months <= 0:
+            return []
+        
+        cutoff = add_months(month_start(datetime.now()), -archive_after_months)
+        archived = []
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_try_advisory_lock(%s)", (MAINTENANCE_LOCK_ID,))
+                locked = cur.fetchone()[0]
+            conn.commit()
+            if not locked:
+                logger.warning("⚠️ Partition maintenance is already running elsewhere, skipping archive")
+                return archived
+            try:
+                for name in self._archivable_partitions(conn, cutoff):
+                    archived.append(self._archive_partition(conn, name, archive_dir))
+            finally:
+                conn.rollback()
+                with conn.cursor() as cur:
+                    cur.execute("SELECT pg_advisory_unlock(%s)", (MAINTENANCE_LOCK_ID,))
+                conn.commit()
+        return archived
+    
+    def _archivable_partitions(self, conn, cutoff):
+        """cutoff မတိုင်ခင် ကုန်ဆုံးတဲ့ partitions (အရင် run က detach လုပ်ပြီး မပြီးခဲ့တာတွေလည်း ပါမယ်)"""
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT relname FROM pg_class
+                WHERE relkind = 'r' AND relnamespace = current_schema()::regnamespace AND relname ~ %s
+                ORDER BY relname
+            """, (f"^{PARTITION_PREFIX}[0-9]{{6}}$",))
+            names = [name for name, in cur.fetchall()]
+        conn.commit()
+        return [name for name in names
+                if add_months(datetime.strptime(name[-6:], '%Y%m'), 1) <= cutoff]
+    
+    @timed_query
+    def _archive_partition(self, conn, name, archive_dir):
+        """Partition တစ်ခုကို detach → jsonl.gz ထဲ export → counters နုတ် + drop (crash ဖြစ်ရင် နောက် run က ဆက်လုပ်မယ်)"""
+        table = sql.Identifier(name)
+        with conn.cursor() as cur:
+            cur.execute("SELECT relispartition FROM pg_class WHERE oid = to_regclass(%s)", (name,))
+            if cur.fetchone()[0]:
+                # Detach ပြီးရင် reads / writes တွေ ဒီ rows တွေကို မမြင်တော့ဘူး (export နေတုန်း မပြောင်းတော့ဘူး)
+                cur.execute(sql.SQL("ALTER TABLE channel_posts DETACH PARTITION {}").format(table))
+        conn.commit()
+        
+        # Detach လုပ်ပြီးသား rows တွေ မပြောင်းတော့လို့ id range နဲ့ နာမည်ပေးမယ် - drop မတိုင်ခင် crash ဖြစ်ရင်
+        # နောက် run က file တူတူကို ပြန်တွေ့ပြီး export ထပ်မလုပ်ဘူး (နောက်မှ ပြန်ဖန်တီးတဲ့ partition က ids အသစ်)
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL("SELECT COALESCE(MIN(id), 0), COALESCE(MAX(id), 0) FROM {}").format(table))
+            min_id, max_id = cur.fetchone()
+        conn.commit()
+        os.makedirs(archive_dir, exist_ok=True)
+        path = os.path.join(archive_dir, f"{name}-{min_id}-{max_id}.jsonl.gz")
+        if os.path.exists(path):
+            logger.info(f"📦 {path} already exists, skipping export of {name}")
+        else:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='wb') as f, \
+                        conn.cursor(name=f"archive_{name}", row_factory=dict_row) as cur:
+                    cur.itersize = 2000
+                    cur.execute(sql.SQL("SELECT * FROM {} ORDER BY date, id").format(table))
+                    for row in cur:
+                        f.write(json.dumps(_archive_record(row), ensure_ascii=False).encode() + b'\n')
+                raw.flush()
+                os.fsync(raw.fileno())
+            conn.commit()
+            os.replace(tmp_path, path)
+        
+        # File durable ဖြစ်မှ drop မယ် - counters တွေကလည်း channel_posts ထဲ ကျန်တဲ့ rows တွေကိုပဲ ပြမယ်
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL("""
+                SELECT COALESCE(message_type, 'unknown'), date::date, COUNT(*) FROM {} GROUP BY 1, 2
+            """).format(table))
+            counts = {(message_type, day): -count for message_type, day, count in cur.fetchall()}
+            rows = -sum(counts.values())
+            self._add_post_counts(cur, counts)
+            cur.execute("UPDATE post_stats SET total_posts = total_posts - %s", (rows,))
+            for rollup in ('post_type_counts', 'post_daily_counts', 'post_daily_type_counts'):
+                cur.execute(f"DELETE FROM {rollup} WHERE count <= 0")
+            cur.execute(sql.SQL("DROP TABLE {}").format(table))
+        conn.commit()
+        
+        logger.info(f"📦 Archived {name} ({rows} posts) to {path}")
+        return {'partition': name, 'posts': rows, 'path': path}
+    
+    def get_pool_stats(self):
+        """Connection pool statistics (pool မဖွင့်ရသေးရင် {} - stats ကြောင့် မ connect ဘူး)"""
+        if self._pool is None or self._pid != os.getpid():
+            return {}
+        return self._pool.get_stats()
     
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
-            logger.info("Database connection closed")
+        """Close database connection pool"""
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.close()
+                logger.info("Database connection pool closed")
+            self._pool = None
 
-# Global database instance
+# Global database instance (lazy - ပထမဆုံး query မှ connect လုပ်မယ်)
 db = Database()
+
+
+if __name__ == '__main__':
+    # Deploy step: python database.py migrate
+    # Cron job: python database.py maintain (partitions ကြိုဖန်တီး + partitions ဟောင်းတွေ archive)
+    import sys
+    logging.basicConfig(level=logging.INFO)
+    if sys.argv[1:] == ['migrate']:
+        print(f"Schema version: {db.migrate()}")
+    elif sys.argv[1:] == ['maintain']:
+        for archive in db.maintain_partitions():
+            print(f"Archived {archive['partition']}: {archive['posts']} posts -> {archive['path']}")
+    else:
+        sys.exit("Usage: python database.py migrate|maintain")
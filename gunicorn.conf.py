@@ -0,0 +1,7 @@
+# gunicorn.conf.py - gunicorn က working directory ထဲက ဒီ file ကို အလိုအလျောက် load လုပ်တယ်
+
+
+def child_exit(server, worker):
+    """Worker ထွက်သွားရင် (crash / restart အပါအဝင်) သူ့ရဲ့ metrics snapshot ကို /metrics ထဲ ဆက်မပေါင်းအောင် ဖျက်မယ်"""
+    from metrics import metrics
+    metrics.mark_process_dead(worker.pid)
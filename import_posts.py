@@ -0,0 +1,290 @@
+# import_posts.py
+"""Channel history ကို post store / Postgres ထဲ bulk import လုပ်မယ့် CLI
+
+Usage:
+    python import_posts.py result.json                  # Telegram Desktop channel export
+    python import_posts.py updates.jsonl --target postgres
+    python import_posts.py updates.jsonl.gz --batch-size 5000
+    python import_posts.py archive/channel_posts_p202401-20250201T030000.jsonl.gz --target postgres
+
+Interrupt ဖြစ်သွားရင် command တူတူ ပြန် run ရင် checkpoint ကနေ ဆက်လုပ်မယ်။
+"""
+import argparse
+import gzip
+import json
+import logging
+import os
+import re
+import time
+
+from ingest import InvalidUpdate, parse_update
+
+logger = logging.getLogger('import_posts')
+
+CHUNK_SIZE = 1 << 16
+MESSAGES_RE = re.compile(r'"messages"\s*:\s*\[')
+CHANNEL_ID_RE = re.compile(r'"id"\s*:\s*(-?\d+)')
+
+# Telegram export ရဲ့ media_type → Bot API message type
+EXPORT_MEDIA_TYPES = {
+    'video_file': 'video',
+    'animation': 'animation',
+    'voice_message': 'voice',
+    'audio_file': 'audio',
+    'video_message': 'video_note',
+    'sticker': 'sticker',
+}
+
+
+def open_input(path, mode='rb'):
+    """Input file ဖွင့်မယ် (.gz ဆို gzip နဲ့)"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+# ===== JSONL (one Telegram update per line) =====
+
+def iter_jsonl(path, offset=0):
+    """(byte offset after line, post dict) တွေကို တစ်ကြောင်းချင်း yield လုပ်မယ်"""
+    with open_input(path) as f:
+        if offset:
+            f.seek(offset)
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            position = f.tell()
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                if isinstance(data, dict) and 'message_type' in data:
+                    # database.py maintain က archive လုပ်ထားတဲ့ post dict
+                    post = data
+                else:
+                    # Update ({"update_id", "channel_post"}) သို့မဟုတ် message တစ်ခုတည်း
+                    if 'channel_post' not in data and 'message_id' in data:
+                        data = {'channel_post': data}
+                    post = parse_update(data)
+            except (ValueError, InvalidUpdate) as e:
+                logger.warning(f"⚠️ Skipping invalid line at byte {position}: {e}")
+                post = None
+            yield position, post
+
+
+# ===== Telegram Desktop export (result.json) =====
+
+def iter_json_array(f, header_re=MESSAGES_RE):
+    """Top-level "messages" array ထဲက objects တွေကို file တစ်ခုလုံး memory ထဲမတင်ဘဲ yield လုပ်မယ်"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    header = ''
+
+    # "messages": [ ရောက်တဲ့အထိ ဖတ်မယ် (channel id က အဲဒီမတိုင်ခင်မှာ ရှိတယ်)
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            raise ValueError('No "messages" array found in export')
+        buffer += chunk
+        match = header_re.search(buffer)
+        if match:
+            header = buffer[:match.start()]
+            buffer = buffer[match.end():]
+            break
+    yield header
+
+    position = 0
+    eof = False
+    while True:
+        # Separators တွေ ကျော်မယ်
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        try:
+            obj, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise ValueError('Export file ended in the middle of the messages array')
+            chunk = f.read(CHUNK_SIZE)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield obj
+        position = end
+        if position > CHUNK_SIZE:
+            buffer = buffer[position:]
+            position = 0
+
+
+def export_text(text):
+    """Export ရဲ့ text (string သို့မဟုတ် entity list) ကို plain text ပြောင်းမယ်"""
+    if isinstance(text, str):
+        return text
+    return ''.join(part if isinstance(part, str) else part.get('text', '') for part in text or [])
+
+
+def export_post(message, channel_id):
+    """Export message တစ်ခုကို post dict အဖြစ် ပြောင်းမယ် (service messages ဆို None)"""
+    if message.get('type') != 'message' or not isinstance(message.get('id'), int):
+        return None
+
+    text = export_text(message.get('text'))
+    if 'photo' in message:
+        message_type = 'photo'
+    elif 'media_type' in message:
+        message_type = EXPORT_MEDIA_TYPES.get(message['media_type'], 'document')
+    elif 'file' in message:
+        message_type = 'document'
+    else:
+        message_type = 'text'
+
+    date = message.get('date_unixtime')
+    edited = message.get('edited_unixtime')
+    # Export က caption ကို text ထဲမှာပဲ ထားတယ် - parse_update လိုပဲ content တစ်ခုတည်းမှာ သိမ်းမယ်
+    # (caption ထဲပါ ထပ်ထည့်ရင် re-import လုပ်တိုင်း content နှစ်ခါဖြစ်မယ်)
+    return {
+        'message_id': message['id'],
+        'channel_id': channel_id,
+        'message_type': message_type,
+        'content': text,
+        'width': message.get('width'),
+        'height': message.get('height'),
+        'date': int(date) if date else None,
+        'edit_date': int(edited) if edited else None
+    }
+
+
+def iter_export(path, skip=0):
+    """(processed record count, post dict) တွေကို yield လုပ်မယ် - resume အတွက် skip records ကျော်မယ်"""
+    with open_input(path, 'rt') as f:
+        messages = iter_json_array(f)
+        header = next(messages)
+        match = CHANNEL_ID_RE.search(header)
+        # Export က channel id ကို -100 prefix မပါဘဲ သိမ်းထားတယ် (Bot API chat id နဲ့ ကိုက်အောင်)
+        channel_id = int(f"-100{match.group(1)}") if match else None
+
+        for count, message in enumerate(messages, start=1):
+            if count <= skip:
+                continue
+            yield count, export_post(message, channel_id)
+
+
+# ===== Checkpoint =====
+
+def load_checkpoint(path, input_path):
+    """Checkpoint ရှိရင် ဖတ်မယ် (input file မတူရင် ignore)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        checkpoint = json.load(f)
+    if checkpoint.get('input') != os.path.abspath(input_path):
+        logger.warning(f"⚠️ Checkpoint {path} belongs to another input, ignoring it")
+        return {}
+    return checkpoint
+
+
+def save_checkpoint(path, checkpoint):
+    """Checkpoint ကို atomic ရေးမယ် (crash ဖြစ်လည်း file မပျက်အောင်)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+# ===== Import =====
+
+def get_writer(target):
+    """Batch writer function (posts list → saved count)"""
+    if target == 'postgres':
+        from database import db
+        return db.save_channel_posts
+
+    from post_store import post_store
+    return post_store.save_posts
+
+
+def run_import(input_path, target='store', batch_size=1000, checkpoint_path=None,
+               report_every=10.0, restart=False):
+    """Input file ကို batch လိုက် import လုပ်ပြီး checkpoint မှတ်မယ်"""
+    checkpoint_path = checkpoint_path or f"{input_path}.checkpoint"
+    checkpoint = {} if restart else load_checkpoint(checkpoint_path, input_path)
+    records = checkpoint.get('records', 0)
+    offset = checkpoint.get('offset', 0)
+    imported = checkpoint.get('imported', 0)
+    skipped = checkpoint.get('skipped', 0)
+    if records:
+        logger.info(f"↩️ Resuming {input_path} after {records} records ({imported} posts imported)")
+
+    is_jsonl = '.jsonl' in os.path.basename(input_path)
+    items = iter_jsonl(input_path, offset) if is_jsonl else iter_export(input_path, records)
+    write = get_writer(target)
+
+    started = last_report = time.monotonic()
+    session_rows = 0
+    batch = []
+
+    def flush():
+        nonlocal imported, session_rows, last_report
+        if batch:
+            saved = write(batch)
+            if saved != len(batch):
+                raise RuntimeError(f"Batch write failed ({saved}/{len(batch)} saved)")
+            imported += len(batch)
+            session_rows += len(batch)
+            batch.clear()
+        save_checkpoint(checkpoint_path, {
+            'input': os.path.abspath(input_path),
+            'records': records,
+            'offset': offset,
+            'imported': imported,
+            'skipped': skipped
+        })
+        now = time.monotonic()
+        if now - last_report >= report_every:
+            last_report = now
+            logger.info(f"📦 {imported} posts imported ({session_rows / (now - started):.0f} rows/sec)")
+
+    for position, post in items:
+        if post is not None and not post.get('date'):
+            # Postgres က date ကို conflict key အဖြစ်သုံးတယ် - date မပါတဲ့ record တစ်ခုကြောင့် import တစ်ခုလုံး မရပ်ဘူး
+            skipped += 1
+            logger.warning(f"⚠️ Skipping message {post.get('message_id')} without a date (record {records + 1})")
+        elif post is not None:
+            batch.append(post)
+        if is_jsonl:
+            offset = position
+        records += 1
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    elapsed = time.monotonic() - started
+    rate = session_rows / elapsed if elapsed > 0 else 0.0
+    logger.info(f"✅ Import finished: {imported} posts from {records} records, {skipped} skipped without a date "
+                f"({session_rows} this run in {elapsed:.1f}s, {rate:.0f} rows/sec)")
+    return {'imported': imported, 'records': records, 'skipped': skipped, 'rows_per_sec': rate}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk import Telegram channel history')
+    parser.add_argument('input', help='Telegram export result.json, JSONL of updates or a '
+                                      'channel_posts archive (.gz ok)')
+    parser.add_argument('--target', choices=['store', 'postgres'], default='store',
+                        help='store = SQLite post store (default), postgres = DATABASE_URL')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--checkpoint', help='Checkpoint file (default: <input>.checkpoint)')
+    parser.add_argument('--restart', action='store_true', help='Ignore any existing checkpoint')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    run_import(args.input, args.target, args.batch_size, args.checkpoint, restart=args.restart)
+
+
+if __name__ == '__main__':
+    main()
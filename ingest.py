@@ -0,0 +1,181 @@
+# ingest.py
+import logging
+import threading
+from collections import OrderedDict
+
+from batching import BatchWriter, QueueFull
+from broadcaster import broadcaster
+from config import config
+from database import db
+from metrics import metrics
+from post_store import post_store
+from read_cache import post_cache
+
+logger = logging.getLogger(__name__)
+
+
+MEDIA_TYPES = ('photo', 'video', 'animation', 'document', 'audio', 'voice', 'video_note', 'sticker')
+
+
+class InvalidUpdate(ValueError):
+    """Telegram update ပုံစံ မမှန်ရင် raise လုပ်မယ်"""
+
+
+def message_type(channel_post):
+    """Post ရဲ့ type (text, photo, video, ...) - stats counters တွေမှာ သုံးမယ်"""
+    for media_type in MEDIA_TYPES:
+        if media_type in channel_post:
+            return media_type
+    return 'text' if 'text' in channel_post else 'other'
+
+
+def best_photo_size(sizes, max_dimension):
+    """Photo sizes ထဲက max_dimension မကျော်တဲ့ အကြီးဆုံးကို ရွေးမယ် (အားလုံးကျော်ရင် အသေးဆုံး)"""
+    sizes = [size for size in sizes if isinstance(size, dict) and size.get('file_id')]
+    if not sizes:
+        return None
+
+    def area(size):
+        return (size.get('width') or 0) * (size.get('height') or 0)
+
+    fitting = [size for size in sizes
+               if max(size.get('width') or 0, size.get('height') or 0) <= max_dimension]
+    return max(fitting, key=area) if fitting else min(sizes, key=area)
+
+
+def extract_media(channel_post):
+    """Post ထဲက media ရဲ့ file_id, size, dimensions နဲ့ /media URL"""
+    media_type = message_type(channel_post)
+    media = channel_post.get(media_type) if media_type in MEDIA_TYPES else None
+    if media_type == 'photo' and isinstance(media, list):
+        media = best_photo_size(media, config.MEDIA_PHOTO_MAX_DIMENSION)
+    if not isinstance(media, dict) or not isinstance(media.get('file_id'), str):
+        return {}
+
+    file_size = media.get('file_size')
+    # Bot API က 20MB ထက်ကြီးတဲ့ files တွေကို download မပေးဘူး
+    downloadable = file_size is None or file_size <= config.MEDIA_MAX_DOWNLOAD_BYTES
+    return {
+        'file_id': media['file_id'],
+        'file_size': file_size,
+        'width': media.get('width'),
+        'height': media.get('height'),
+        'media_url': f"/media/{media['file_id']}" if downloadable else None
+    }
+
+
+def parse_update(data):
+    """Webhook update ကို validate လုပ်ပြီး channel post ဖြစ်ရင် post dict ပြန်ပေးမယ် (မဟုတ်ရင် None)"""
+    if not isinstance(data, dict):
+        raise InvalidUpdate("Update must be a JSON object")
+
+    # Edited posts တွေကို row အသစ်မဟုတ်ဘဲ ရှိပြီးသား row ကို update လုပ်မယ်
+    edited = 'channel_post' not in data and 'edited_channel_post' in data
+    channel_post = data.get('edited_channel_post' if edited else 'channel_post')
+    if channel_post is None:
+        return None
+    if not isinstance(channel_post, dict) or not isinstance(channel_post.get('message_id'), int):
+        raise InvalidUpdate("channel_post.message_id is missing")
+    if not isinstance(channel_post.get('date'), int):
+        # Postgres က (post_id, channel_id, date) နဲ့ upsert လုပ်တာမို့ edits တွေမှာ မူရင်း date ပါရမယ်
+        raise InvalidUpdate("channel_post.date is missing")
+
+    # Get content
+    content = ''
+    if 'text' in channel_post:
+        content = channel_post['text']
+    elif 'caption' in channel_post:
+        content = channel_post['caption']
+
+    return {
+        'message_id': channel_post['message_id'],
+        'channel_id': (channel_post.get('chat') or {}).get('id'),
+        'message_type': message_type(channel_post),
+        'content': content,
+        'date': channel_post.get('date'),
+        'edit_date': channel_post.get('edit_date') or (channel_post.get('date') if edited else None),
+        'update_id': data.get('update_id'),
+        **extract_media(channel_post)
+    }
+
+
+class RecentUpdates:
+    """မကြာခင်က လက်ခံခဲ့တဲ့ update_ids (process memory ထဲမှာ bounded, post store နဲ့ restart ကျော်ပြီး မှတ်ထားတယ်)"""
+
+    def __init__(self, store, max_size):
+        self.store = store
+        self.max_size = max_size
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'accepted': 0, 'duplicates': 0}
+
+    def claim(self, update_id):
+        """Update အသစ်ဆိုရင် မှတ်ပြီး True၊ retry (ပြီးခဲ့တာ/process လုပ်နေဆဲ) ဆိုရင် False"""
+        with self._lock:
+            duplicate = update_id in self._ids
+            if not duplicate:
+                self._remember(update_id)
+
+        # Memory ထဲမှာ မရှိရင် store ကို စစ်မယ် (restart ဖြစ်ခဲ့ရင် / တခြား worker က လုပ်ခဲ့ရင်)
+        if not duplicate and self.store.has_update(update_id):
+            duplicate = True
+
+        with self._lock:
+            self._stats['duplicates' if duplicate else 'accepted'] += 1
+        return not duplicate
+
+    def release(self, update_id):
+        """Queue မဝင်ခဲ့ရင် (503) Telegram ရဲ့ retry ကို လက်ခံနိုင်အောင် ပြန်ဖယ်မယ်"""
+        with self._lock:
+            self._ids.pop(update_id, None)
+
+    def _remember(self, update_id):
+        self._ids[update_id] = True
+        while len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+
+    def get_stats(self):
+        """Dedup counters"""
+        with self._lock:
+            return {**self._stats, 'tracked': len(self._ids)}
+
+
+@metrics.timed('ingest_batch_duration_seconds')
+def write_batch(posts):
+    """Queue ထဲက posts တွေကို transaction တစ်ခုတည်းနဲ့ store ထဲ ရေးမယ် (DATABASE_URL ရှိရင် Postgres ကိုအရင်)"""
+    if config.DATABASE_URL:
+        # Postgres မအောင်မြင်ရင် store ကို မထိဘဲ batch တစ်ခုလုံး retry (upsert က idempotent)
+        if db.save_channel_posts(posts) != len(posts):
+            raise RuntimeError(f"Failed to write {len(posts)} channel posts to Postgres")
+    # update_ids တွေကို posts နဲ့ transaction တစ်ခုတည်းမှာ မှတ်မယ် - writes နှစ်ခုလုံး ပြီးမှ clients ကို နှိုးမယ်
+    post_store.save_posts(posts)
+    post_cache.invalidate({(post_data['channel_id'], post_data['message_id']) for post_data in posts})
+    broadcaster.notify()
+    logger.info(f"✅ {len(posts)} channel posts saved")
+
+
+def release_batch(posts):
+    """Retry အကုန်ကျရှုံးပြီး drop လုပ်လိုက်တဲ့ batch - Telegram ပြန်ပို့ရင် duplicate မဖြစ်အောင် update_ids ပြန်ဖယ်မယ်"""
+    for post_data in posts:
+        if isinstance(post_data.get('update_id'), int):
+            recent_updates.release(post_data['update_id'])
+
+
+def enqueue_post(post_data):
+    """Post ကို ingest queue ထဲ ထည့်မယ် - queue ပြည့်ရင် QueueFull"""
+    ingest_queue.put(post_data, timeout=config.INGEST_ENQUEUE_TIMEOUT)
+
+
+# Global ingest queue (process ထွက်ရင် ကျန်နေတာတွေ drain လုပ်မယ်)
+ingest_queue = BatchWriter(
+    write_batch,
+    name='ingest',
+    batch_size=config.INGEST_BATCH_SIZE,
+    flush_interval=config.INGEST_FLUSH_INTERVAL,
+    max_queue=config.INGEST_QUEUE_SIZE,
+    on_drop=release_batch
+).register_shutdown()
+
+# Webhook retries တွေကို update_id နဲ့ ဖယ်မယ်
+recent_updates = RecentUpdates(post_store, config.DEDUP_RECENT_UPDATES)
+metrics.register_gauges(lambda: [('ingest_queue_depth', {}, ingest_queue.get_stats()['queue_depth'])])
@@ -0,0 +1,112 @@
+# log_sink.py
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from batching import BatchWriter, QueueFull
+from config import config
+
+WRITER_NAME = 'log-sink'
+
+
+class DatabaseLogHandler(logging.Handler):
+    """Log records တွေကို memory ထဲ buffer လုပ်ပြီး logs table ထဲ batch လိုက် ရေးမယ့် handler
+
+    Request path ကို ဘယ်တော့မှ မပိတ်ဘူး - queue များလာရင် ERROR အောက် records တွေကို
+    sample_rate ထဲက တစ်ခုပဲ ယူမယ်၊ queue ပြည့်ရင် drop လုပ်မယ်။
+    """
+
+    def __init__(self, database, level=logging.WARNING, batch_size=200, flush_interval=2.0,
+                 max_queue=5000, sample_rate=10, retention_days=14, prune_interval=3600,
+                 prune_chunk_size=5000):
+        super().__init__(level)
+        self.database = database
+        self.sample_rate = max(sample_rate, 1)
+        self.retention_days = retention_days
+        self.prune_interval = prune_interval
+        self.prune_chunk_size = prune_chunk_size
+        self.high_water = max_queue * 3 // 4
+        self._next_prune = time.monotonic()
+        self._sample_counter = itertools.count()
+        self._lock = threading.Lock()
+        self._stats = {'sampled_out': 0, 'dropped': 0, 'pruned': 0}
+        self.writer = BatchWriter(
+            self._write,
+            name=WRITER_NAME,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_queue=max_queue,
+            max_retries=2
+        )
+
+    def emit(self, record):
+        # Writer thread ကိုယ်တိုင် ထုတ်တဲ့ logs (DB error စသည်) ကို ပြန်မထည့်ဘူး - loop မဖြစ်အောင်
+        if record.threadName == f"{WRITER_NAME}-writer":
+            return
+        try:
+            if (record.levelno < logging.ERROR
+                    and self.writer.get_stats()['queue_depth'] >= self.high_water
+                    and next(self._sample_counter) % self.sample_rate):
+                with self._lock:
+                    self._stats['sampled_out'] += 1
+                return
+
+            entry = (
+                record.levelname,
+                self.format(record),
+                record.name[:100],
+                datetime.fromtimestamp(record.created)
+            )
+            self.writer.put(entry, timeout=0)
+        except QueueFull:
+            with self._lock:
+                self._stats['dropped'] += 1
+        except Exception:
+            self.handleError(record)
+
+    def _write(self, entries):
+        """Writer thread ပေါ်မှာ run မယ် - batch ရေးပြီး retention အချိန်ရောက်ရင် prune လုပ်မယ်"""
+        if self.database.add_logs(entries) != len(entries):
+            raise RuntimeError(f"Failed to write {len(entries)} log records")
+        if time.monotonic() >= self._next_prune:
+            self._next_prune = time.monotonic() + self.prune_interval
+            self.prune()
+
+    def prune(self):
+        """retention_days ထက်ဟောင်းတဲ့ logs တွေကို chunk လိုက် ဖျက်မယ်"""
+        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        deleted = self.database.prune_logs(cutoff, self.prune_chunk_size)
+        with self._lock:
+            self._stats['pruned'] += deleted
+        return deleted
+
+    def close(self):
+        """Buffer ထဲ ကျန်နေတာတွေ flush လုပ်ပြီး handler ကို ပိတ်မယ်"""
+        self.writer.close()
+        super().close()
+
+    def get_stats(self):
+        """Sink statistics (writer stats + sampling/drop counters)"""
+        with self._lock:
+            return {**self.writer.get_stats(), **self._stats}
+
+
+def install_log_sink(logger=None):
+    """Database log handler ကို root logger (သို့မဟုတ် ပေးထားတဲ့ logger) မှာ တပ်မယ်"""
+    from database import db
+
+    handler = DatabaseLogHandler(
+        db,
+        level=logging.getLevelName(config.LOG_SINK_LEVEL.upper()),
+        batch_size=config.LOG_SINK_BATCH_SIZE,
+        flush_interval=config.LOG_SINK_FLUSH_INTERVAL,
+        max_queue=config.LOG_SINK_QUEUE_SIZE,
+        sample_rate=config.LOG_SINK_SAMPLE_RATE,
+        retention_days=config.LOG_RETENTION_DAYS,
+        prune_interval=config.LOG_PRUNE_INTERVAL,
+        prune_chunk_size=config.LOG_PRUNE_CHUNK_SIZE
+    )
+    (logger or logging.getLogger()).addHandler(handler)
+    return handler
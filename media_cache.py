@@ -0,0 +1,306 @@
+# media_cache.py
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from config import config
+from post_store import post_store
+
+try:
+    from PIL import Image
+except ImportError:  # optional - မရှိရင် thumbnail_url မပို့ဘဲ /media?thumb=1 က original ကို ပြန်ပေးမယ်
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+TOUCH_INTERVAL = 60
+COPY_CHUNK_SIZE = 1 << 16
+
+# File header bytes → Content-Type (cache files တွေမှာ extension မပါဘူး)
+SIGNATURES = [
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF8', 'image/gif'),
+    (b'\x1aE\xdf\xa3', 'video/webm'),
+    (b'OggS', 'audio/ogg'),
+    (b'ID3', 'audio/mpeg'),
+    (b'%PDF', 'application/pdf'),
+]
+
+
+class MediaNotFound(Exception):
+    """File ID မရှိရင် (သို့) download လုပ်ခွင့်မရှိရင် raise လုပ်မယ်"""
+
+
+class TelegramDownloader:
+    """Bot API getFile နဲ့ Telegram ကနေ file download လုပ်မယ်"""
+
+    def __init__(self, token, timeout=30.0, max_bytes=20 * 1024 * 1024):
+        self.token = token
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+
+    def fetch(self, file_id, dest):
+        if not self.token:
+            raise MediaNotFound("Bot token is not configured")
+
+        query = urllib.parse.urlencode({'file_id': file_id})
+        try:
+            with urllib.request.urlopen(
+                f"https://api.telegram.org/bot{self.token}/getFile?{query}", timeout=self.timeout
+            ) as response:
+                result = json.load(response)['result']
+        except urllib.error.HTTPError as e:
+            if e.code in (400, 404):
+                raise MediaNotFound(f"Telegram has no file {file_id}") from e
+            raise
+
+        url = f"https://api.telegram.org/file/bot{self.token}/{result['file_path']}"
+        with urllib.request.urlopen(url, timeout=self.timeout) as response, open(dest, 'wb') as f:
+            copy_limited(response, f, self.max_bytes)
+
+
+class LocalDownloader:
+    """Directory ထဲက <file_id> (extension ရှိ/မရှိ) files တွေကို copy လုပ်မယ် - development/tests အတွက်"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch(self, file_id, dest):
+        for name in (file_id, *sorted(os.listdir(self.directory))):
+            if name == file_id or os.path.splitext(name)[0] == file_id:
+                source = os.path.join(self.directory, name)
+                if os.path.isfile(source):
+                    shutil.copyfile(source, dest)
+                    return
+        raise MediaNotFound(f"No local file for {file_id}")
+
+
+def copy_limited(source, dest, max_bytes):
+    """Stream ကို copy လုပ်မယ် - max_bytes ကျော်ရင် ValueError"""
+    copied = 0
+    while True:
+        chunk = source.read(COPY_CHUNK_SIZE)
+        if not chunk:
+            return copied
+        copied += len(chunk)
+        if copied > max_bytes:
+            raise ValueError(f"File is larger than {max_bytes} bytes")
+        dest.write(chunk)
+
+
+def sniff_mimetype(path):
+    """File header ကနေ Content-Type ခန့်မှန်းမယ်"""
+    with open(path, 'rb') as f:
+        head = f.read(16)
+    for signature, mimetype in SIGNATURES:
+        if head.startswith(signature):
+            return mimetype
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    if head[4:8] == b'ftyp':
+        return 'video/mp4'
+    return 'application/octet-stream'
+
+
+class MediaCache:
+    """Download လုပ်ပြီးသား media နဲ့ thumbnails တွေအတွက် size-bounded on-disk LRU cache
+
+    Workers အားလုံး directory တစ်ခုတည်းကို share လုပ်တယ် - files တွေကို tmp file ကနေ
+    os.replace နဲ့ atomic ရေးပြီး LRU order ကို atime နဲ့ မှတ်မယ်။ Process တစ်ခုအတွင်းမှာ
+    key တစ်ခုကို တစ်ကြိမ်ပဲ fetch လုပ်မယ် (single-flight)။
+    """
+
+    def __init__(self, directory, downloader, max_bytes, thumb_size=320, is_allowed=None):
+        self.directory = directory
+        self.downloader = downloader
+        self.max_bytes = max_bytes
+        self.thumb_size = thumb_size
+        self.is_allowed = is_allowed
+        self._lock = threading.Lock()
+        self._inflight = {}  # key → (Event, [error])
+        self._total_bytes = None
+        self._stats = {'hits': 0, 'misses': 0, 'fetches': 0, 'errors': 0, 'evictions': 0}
+
+    def _path(self, key):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    @property
+    def supports_thumbnails(self):
+        """Pillow ရှိမှ thumbnails generate လုပ်နိုင်မယ်"""
+        return Image is not None
+
+    def get(self, file_id):
+        """Original file ရဲ့ local path (cache ထဲမရှိရင် downloader နဲ့ ယူမယ်)"""
+        return self._get_or_create(file_id, lambda dest: self._download(file_id, dest))
+
+    def thumbnail(self, file_id):
+        """Thumbnail path (ပထမဆုံး request မှာ တစ်ခါပဲ generate လုပ်မယ်) - မလုပ်နိုင်ရင် original"""
+        original = self.get(file_id)
+        if Image is None:
+            return original
+        try:
+            return self._get_or_create(f"{file_id}:thumb", lambda dest: self._make_thumbnail(original, dest))
+        except OSError:
+            # Image မဟုတ်တဲ့ media (video, document, ...)
+            return original
+
+    def _download(self, file_id, dest):
+        if self.is_allowed is not None and not self.is_allowed(file_id):
+            raise MediaNotFound(f"Unknown file {file_id}")
+        self.downloader.fetch(file_id, dest)
+
+    def _make_thumbnail(self, source, dest):
+        with Image.open(source) as image:
+            image.thumbnail((self.thumb_size, self.thumb_size))
+            image.convert('RGB').save(dest, 'JPEG', quality=80, optimize=True)
+
+    def _get_or_create(self, key, create):
+        path = self._path(key)
+        if self._touch(path):
+            with self._lock:
+                self._stats['hits'] += 1
+            return path
+
+        with self._lock:
+            self._stats['misses'] += 1
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = (threading.Event(), [])
+
+        event, error = flight
+        if not leader:
+            event.wait()
+            if error:
+                raise error[0]
+            return path
+
+        try:
+            self._create(path, create)
+            return path
+        except Exception as e:
+            error.append(e)
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+
+    def _create(self, path, create):
+        """tmp file ထဲ ရေးပြီး atomic rename လုပ်မယ်"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            create(tmp_path)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        with self._lock:
+            self._stats['fetches'] += 1
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += size
+            over_limit = self._total_bytes > self.max_bytes
+        if over_limit:
+            self._evict()
+
+    def _touch(self, path):
+        """Cache hit ဖြစ်ရင် atime ကို update လုပ်မယ် (LRU order) - mtime (Last-Modified) မပြောင်းဘူး"""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        now = time.time()
+        if now - stat.st_atime > TOUCH_INTERVAL:
+            try:
+                os.utime(path, (now, stat.st_mtime))
+            except FileNotFoundError:
+                return False
+        return True
+
+    def _files(self):
+        """Cache files (path, stat) - tmp files မပါဘူး"""
+        if not os.path.isdir(self.directory):
+            return
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    yield entry.path, entry.stat()
+                except FileNotFoundError:
+                    continue
+
+    def _scan_size(self):
+        return sum(stat.st_size for _, stat in self._files())
+
+    def _evict(self):
+        """အကြာဆုံး မသုံးခဲ့တဲ့ files တွေကို max_bytes ရဲ့ 90% အောက်ရောက်တဲ့အထိ ဖျက်မယ်"""
+        files = sorted(self._files(), key=lambda item: item[1].st_atime)
+        total = sum(stat.st_size for _, stat in files)
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for path, stat in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= stat.st_size
+            evicted += 1
+
+        with self._lock:
+            self._total_bytes = total
+            self._stats['evictions'] += evicted
+        if evicted:
+            logger.info(f"🧹 Media cache evicted {evicted} files ({total} bytes kept)")
+
+    def get_stats(self):
+        """Hit/miss counters နဲ့ cache size"""
+        with self._lock:
+            return {
+                **self._stats,
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'inflight': len(self._inflight),
+                'thumbnails': self.supports_thumbnails,
+            }
+
+
+def make_downloader():
+    """MEDIA_SOURCE_DIR ရှိရင် local files၊ မရှိရင် Telegram Bot API"""
+    if config.MEDIA_SOURCE_DIR:
+        return LocalDownloader(config.MEDIA_SOURCE_DIR)
+    return TelegramDownloader(
+        config.TOKEN,
+        timeout=config.MEDIA_DOWNLOAD_TIMEOUT,
+        max_bytes=config.MEDIA_MAX_DOWNLOAD_BYTES
+    )
+
+
+# Global media cache (store ထဲက posts တွေရဲ့ files တွေကိုပဲ download လုပ်မယ်)
+media_cache = MediaCache(
+    config.MEDIA_CACHE_DIR,
+    make_downloader(),
+    max_bytes=config.MEDIA_CACHE_MAX_BYTES,
+    thumb_size=config.MEDIA_THUMB_SIZE,
+    is_allowed=post_store.has_file_id
+)
@@ -0,0 +1,287 @@
+# metrics.py
+import atexit
+import bisect
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# Seconds - Prometheus client ရဲ့ default buckets နဲ့ တူတယ်
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HELP = {
+    'http_requests_total': ('counter', 'HTTP requests by route, method and status'),
+    'http_request_duration_seconds': ('histogram', 'HTTP request latency by route'),
+    'db_query_duration_seconds': ('histogram', 'Database method latency'),
+    'db_query_errors_total': ('counter', 'Database method errors'),
+    'bot_updates_total': ('counter', 'Bot updates by result'),
+    'bot_update_duration_seconds': ('histogram', 'Bot update processing time'),
+    'ingest_batch_duration_seconds': ('histogram', 'Webhook ingest batch write time'),
+}
+
+
+def _labels_key(labels):
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=None):
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metrics:
+    """Process တစ်ခုရဲ့ counters / histograms - worker တစ်ခုချင်း snapshot file ရေးပြီး /metrics မှာ ပေါင်းမယ်
+
+    gunicorn workers တွေက memory မ share လို့ METRICS_DIR ထဲမှာ metrics-<pid>.json တွေ
+    ရေးထားမယ်။ အသက်ရှင်နေတဲ့ workers ရဲ့ files တွေကိုပဲ ပေါင်းမယ် - worker ထွက်ရင် (atexit /
+    gunicorn child_exit) file ကို ဖျက်ပြီး ကျန်နေတဲ့ dead pid files တွေကို render က ရှင်းမယ်
+    (prometheus_client ရဲ့ mark_process_dead လို - worker ပြန်စရင် counters တွေ reset ဖြစ်မယ်)။
+    """
+
+    def __init__(self, directory, flush_interval=5.0, buckets=DEFAULT_BUCKETS):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.buckets = buckets
+        self._counters = {}
+        self._histograms = {}
+        self._gauge_callbacks = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._closed = False
+        # timed() call state - threads နဲ့ asyncio tasks တစ်ခုချင်းစီမှာ သီးသန့်ရှိမယ်
+        self._call = contextvars.ContextVar('metrics_call', default=None)
+
+    # ----- recording -----
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        self._ensure_thread()
+
+    def observe(self, name, value, **labels):
+        key = (name, _labels_key(labels))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+        self._ensure_thread()
+
+    def register_gauges(self, callback):
+        """Snapshot ယူတိုင်း ခေါ်မယ့် callback - [(name, labels dict, value), ...] ပြန်ပေးရမယ်"""
+        self._gauge_callbacks.append(callback)
+
+    def timed(self, name, errors=None, **labels):
+        """Function ကြာချိန်ကို histogram ထဲ မှတ်မယ့် decorator (errors ပေးထားရင် exceptions တွေကိုလည်း ရေတွက်မယ်)"""
+        def decorator(fn):
+            series = {**labels} or {'method': fn.__name__}
+
+            if inspect.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    with self._timing(name, errors, series):
+                        return await fn(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self._timing(name, errors, series):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @contextlib.contextmanager
+    def _timing(self, name, errors, series):
+        call = {'errors': errors, 'series': series, 'counted': False}
+        token = self._call.set(call)
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            if errors and not call['counted']:
+                self.inc(errors, **series)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - started, **series)
+            self._call.reset(token)
+
+    def record_error(self):
+        """timed() function ထဲမှာ ဖြစ်ပြီး function က ကိုယ်တိုင် catch လုပ်မယ့် error ကို ရေတွက်မယ်"""
+        call = self._call.get()
+        if call and call['errors'] and not call['counted']:
+            call['counted'] = True
+            self.inc(call['errors'], **call['series'])
+
+    # ----- per-process snapshots -----
+
+    def _ensure_thread(self):
+        """Snapshot writer thread ကို လိုမှ စမယ် (fork ပြီးရင် worker ထဲမှာ အသစ်စမယ်)"""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='metrics-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.write_snapshot()
+
+    def snapshot(self):
+        gauges = []
+        for callback in self._gauge_callbacks:
+            try:
+                gauges.extend((name, _labels_key(labels), value) for name, labels, value in callback())
+            except Exception as e:
+                logger.error(f"❌ Metrics gauge error: {e}")
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'counters': [[name, labels, value] for (name, labels), value in self._counters.items()],
+                'histograms': [[name, labels, list(buckets), total, count]
+                               for (name, labels), (buckets, total, count) in self._histograms.items()],
+                'gauges': gauges,
+            }
+
+    def _snapshot_path(self, pid):
+        return os.path.join(self.directory, f"metrics-{pid}.json")
+
+    def write_snapshot(self):
+        """ဒီ process ရဲ့ metrics ကို metrics-<pid>.json အဖြစ် atomic ရေးမယ်"""
+        if self._closed:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._snapshot_path(os.getpid())
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.snapshot(), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"❌ Metrics snapshot error: {e}")
+
+    def mark_process_dead(self, pid):
+        """ထွက်သွားတဲ့ worker ရဲ့ snapshot file ကို ဖျက်မယ် (gunicorn child_exit hook / atexit)"""
+        try:
+            os.remove(self._snapshot_path(pid))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"❌ Metrics cleanup error: {e}")
+
+    def close(self):
+        """Process ထွက်ရင် ကိုယ့် snapshot file ကို ဖျက်မယ် (writer thread က နောက်ထပ် မရေးတော့ဘူး)"""
+        self._closed = True
+        self.mark_process_dead(os.getpid())
+
+    def _read_snapshots(self):
+        snapshots = {}
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if not (name.startswith('metrics-') and name.endswith('.json')):
+                    continue
+                pid = name[len('metrics-'):-len('.json')]
+                if not pid.isdigit():
+                    continue
+                if int(pid) != os.getpid() and not _pid_alive(int(pid)):
+                    # child_exit မရောက်ခဲ့တဲ့ worker (kill -9 / restart) - counts တွေ ထပ်မပေါင်းတော့ဘူး
+                    self.mark_process_dead(int(pid))
+                    continue
+                try:
+                    with open(os.path.join(self.directory, name)) as f:
+                        snapshot = json.load(f)
+                    snapshots[snapshot['pid']] = snapshot
+                except (OSError, ValueError, KeyError):
+                    continue
+        # ဒီ process အတွက်တော့ နောက်ဆုံး values ကို တိုက်ရိုက်ယူမယ်
+        snapshots[os.getpid()] = self.snapshot()
+        return snapshots.values()
+
+    # ----- exposition -----
+
+    def render(self):
+        """Workers အားလုံးရဲ့ metrics ကို Prometheus text format နဲ့ ပြန်ပေးမယ်"""
+        counters, histograms, gauges = {}, {}, {}
+        for snapshot in self._read_snapshots():
+            for name, labels, value in snapshot['counters']:
+                key = (name, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+            for name, labels, buckets, total, count in snapshot['histograms']:
+                key = (name, tuple(map(tuple, labels)))
+                merged = histograms.setdefault(key, [[0] * len(buckets), 0.0, 0])
+                merged[0] = [a + b for a, b in zip(merged[0], buckets)]
+                merged[1] += total
+                merged[2] += count
+            for name, labels, value in snapshot['gauges']:
+                key = (name, tuple(map(tuple, labels)))
+                gauges[key] = gauges.get(key, 0) + value
+
+        lines = []
+        described = set()
+
+        def describe(name, default_type):
+            if name in described:
+                return
+            described.add(name)
+            metric_type, help_text = HELP.get(name, (default_type, name.replace('_', ' ')))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        for (name, labels), value in sorted(counters.items()):
+            describe(name, 'counter')
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for (name, labels), value in sorted(gauges.items()):
+            describe(name, 'gauge')
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for (name, labels), (buckets, total, count) in sorted(histograms.items()):
+            describe(name, 'histogram')
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), buckets):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f"{name}_bucket{_format_labels(labels, ('le', le))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return '\n'.join(lines) + '\n'
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+# Global metrics registry (process ထွက်ရင် snapshot file ကို ဖျက်မယ်)
+metrics = Metrics(config.METRICS_DIR, config.METRICS_FLUSH_INTERVAL)
+atexit.register(metrics.close)
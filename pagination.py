@@ -0,0 +1,36 @@
+# pagination.py
+import base64
+import json
+
+
+class InvalidCursor(ValueError):
+    """Client ပို့တဲ့ cursor ကို decode မလုပ်နိုင်ရင် raise လုပ်မယ်"""
+
+
+def encode_cursor(date, row_id):
+    """(date, id) keyset position ကို opaque cursor string အဖြစ် ပြောင်းမယ်"""
+    if hasattr(date, 'isoformat'):
+        date = date.isoformat()
+    raw = json.dumps([date, row_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Opaque cursor ကို (date, id) tuple အဖြစ် ပြန်ပြောင်းမယ်"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        date, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(date, str) or not isinstance(row_id, int):
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+    return date, row_id
+
+
+def paginate(rows, limit):
+    """limit + 1 rows ထဲက page နဲ့ next_cursor ကို ခွဲထုတ်မယ်"""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(last['date'], last['id'])
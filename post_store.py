@@ -0,0 +1,543 @@
+# post_store.py
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# #hashtag - Latin/digits/_ အပြင် Myanmar blocks (combining marks အပါအဝင်) ကိုလည်း ယူမယ်
+HASHTAG_RE = re.compile(r'(?<![\w&#])#([\w\u1000-\u109f\ua9e0-\ua9ff\uaa60-\uaa7f]+)')
+MAX_TAG_LENGTH = 64
+
+
+def extract_hashtags(*texts):
+    """Text တွေထဲက hashtags (lowercase၊ # မပါ၊ ထပ်နေတာ ဖယ်ပြီး ပေါ်တဲ့အစဉ်အတိုင်း)"""
+    tags = {}
+    for text in texts:
+        for match in HASHTAG_RE.findall(text or ''):
+            tag = match.lower()[:MAX_TAG_LENGTH]
+            # #123 လို ဂဏန်းသက်သက်တွေက tags မဟုတ်ဘူး (Telegram နဲ့ တူအောင်)
+            if not tag.isdigit():
+                tags.setdefault(tag, None)
+    return list(tags)
+
+
+def _add_post_tags(conn, rows):
+    """Rows (id, date, content, caption) တွေရဲ့ hashtags ကို tags / post_tags ထဲ ထည့်ပြီး counts တိုးမယ်"""
+    pairs = [(row['id'], row['date'], tag)
+             for row in rows for tag in extract_hashtags(row['content'], row['caption'])]
+    if not pairs:
+        return
+    conn.executemany("""
+        INSERT INTO tags (name, count) VALUES (?, ?)
+        ON CONFLICT (name) DO UPDATE SET count = count + excluded.count
+    """, Counter(tag for _, _, tag in pairs).items())
+    conn.executemany("""
+        INSERT OR IGNORE INTO post_tags (tag_id, date, channel_post_id)
+        SELECT id, ?, ? FROM tags WHERE name = ?
+    """, [(date, row_id, tag) for row_id, date, tag in pairs])
+
+
+def _remove_post_tags(conn, row_ids):
+    """Posts တွေရဲ့ tag links တွေ ဖယ်ပြီး counts လျှော့မယ် (post မရှိတော့တဲ့ tags တွေ ဖျက်မယ်)"""
+    params = [(row_id,) for row_id in row_ids]
+    if not params:
+        return
+    conn.executemany("""
+        UPDATE tags SET count = count - 1
+        WHERE id IN (SELECT tag_id FROM post_tags WHERE channel_post_id = ?)
+    """, params)
+    conn.executemany("DELETE FROM post_tags WHERE channel_post_id = ?", params)
+    conn.execute("DELETE FROM tags WHERE count <= 0")
+
+
+def _backfill_tags(conn):
+    """Migration 6 - ရှိပြီးသား posts တွေရဲ့ hashtags ကို index လုပ်မယ်"""
+    _add_post_tags(conn, conn.execute("SELECT id, date, content, caption FROM channel_posts").fetchall())
+
+
+# Schema migrations (PRAGMA user_version နဲ့ ဘယ် migration အထိ apply ပြီးလဲ မှတ်ထားမယ်)
+MIGRATIONS = [
+    # 1: base schema
+    [
+        """
+        CREATE TABLE IF NOT EXISTS channel_posts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            post_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL DEFAULT 0,
+            message_type TEXT,
+            content TEXT,
+            caption TEXT,
+            media_url TEXT,
+            file_id TEXT,
+            file_size INTEGER,
+            width INTEGER,
+            height INTEGER,
+            views INTEGER DEFAULT 0,
+            date TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            UNIQUE(post_id, channel_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_channel_posts_date_id ON channel_posts (date, id)",
+        """
+        CREATE TABLE IF NOT EXISTS store_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+        """,
+        "INSERT OR IGNORE INTO store_meta (key, value) VALUES ('post_count', 0)",
+    ],
+    # 2: store-wide version counter (conditional GET / delta sync)
+    [
+        "ALTER TABLE channel_posts ADD COLUMN version INTEGER NOT NULL DEFAULT 0",
+        "UPDATE channel_posts SET version = id",
+        "CREATE INDEX IF NOT EXISTS idx_channel_posts_version ON channel_posts (version)",
+        "CREATE INDEX IF NOT EXISTS idx_channel_posts_updated_at ON channel_posts (updated_at)",
+        """
+        INSERT OR IGNORE INTO store_meta (key, value)
+        SELECT 'version', COALESCE(MAX(version), 0) FROM channel_posts
+        """,
+        "INSERT OR IGNORE INTO store_meta (key, value) VALUES ('last_modified', 0)",
+    ],
+    # 3: incrementally maintained statistics
+    [
+        """
+        CREATE TABLE IF NOT EXISTS post_type_counts (
+            message_type TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS post_daily_counts (
+            day TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        """
+        INSERT INTO post_type_counts (message_type, count)
+        SELECT COALESCE(message_type, 'unknown'), COUNT(*) FROM channel_posts GROUP BY 1
+        """,
+        """
+        INSERT INTO post_daily_counts (day, count)
+        SELECT substr(date, 1, 10), COUNT(*) FROM channel_posts GROUP BY 1
+        """,
+    ],
+    # 4: /media/<file_id> lookups
+    [
+        "CREATE INDEX IF NOT EXISTS idx_channel_posts_file_id ON channel_posts (file_id)",
+    ],
+    # 5: webhook dedup (update_id) နဲ့ edited posts
+    [
+        "ALTER TABLE channel_posts ADD COLUMN edit_date TEXT",
+        """
+        CREATE TABLE IF NOT EXISTS processed_updates (
+            update_id INTEGER PRIMARY KEY,
+            processed_at INTEGER NOT NULL
+        )
+        """,
+    ],
+    # 6: hashtag index (tags + post_tags) - tag= filter ကို (date, id) keyset နဲ့ index ကနေပဲ ဖတ်မယ်
+    [
+        """
+        CREATE TABLE IF NOT EXISTS tags (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            count INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_tags_count ON tags (count DESC, name)",
+        """
+        CREATE TABLE IF NOT EXISTS post_tags (
+            tag_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            channel_post_id INTEGER NOT NULL,
+            PRIMARY KEY (tag_id, date, channel_post_id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_post_tags_post ON post_tags (channel_post_id)",
+        _backfill_tags,
+    ],
+]
+
+# Content columns - ဒီထဲက တစ်ခုခု ပြောင်းမှ UPDATE လုပ်မယ်
+CONTENT_COLUMNS = ('content', 'caption', 'media_url', 'file_id', 'file_size', 'width', 'height')
+
+
+class PostStore:
+    """Gunicorn workers အားလုံး share လုပ်တဲ့ SQLite (WAL mode) post store"""
+
+    def __init__(self, path=None, max_posts=None, max_updates=None):
+        self.path = path or config.POST_STORE_PATH
+        self.max_posts = config.POST_STORE_MAX_POSTS if max_posts is None else max_posts
+        self.max_updates = config.DEDUP_MAX_UPDATES if max_updates is None else max_updates
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._pid = os.getpid()
+
+    def _connection(self):
+        """Thread တစ်ခုချင်းစီအတွက် connection (fork ပြီးရင် အသစ်ပြန်ဖွင့်မယ်)"""
+        if self._pid != os.getpid():
+            # Parent process ရဲ့ connection တွေကို fork ပြီးနောက် မသုံးရဘူး
+            self._local = threading.local()
+            self._pid = os.getpid()
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn):
+        """မ apply ရသေးတဲ့ schema migrations တွေကို apply လုပ်မယ်"""
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                current = conn.execute("PRAGMA user_version").fetchone()[0]
+                for version, statements in enumerate(MIGRATIONS[current:], start=current + 1):
+                    for statement in statements:
+                        if callable(statement):
+                            # Python steps (backfills) တွေက conn ကို ယူမယ်
+                            statement(conn)
+                        else:
+                            conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {version}")
+                    logger.info(f"✅ Post store migration {version} applied")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._schema_ready = True
+            logger.info(f"✅ Post store ready: {self.path}")
+
+    def _row_values(self, post_data, now):
+        """Input post dict ကို column values အဖြစ် ပြောင်းမယ်"""
+        date = post_data.get('date')
+        if isinstance(date, (int, float)):
+            date = datetime.fromtimestamp(date).isoformat()
+        edit_date = post_data.get('edit_date')
+        if isinstance(edit_date, (int, float)):
+            edit_date = datetime.fromtimestamp(edit_date).isoformat()
+        return {
+            'post_id': post_data.get('message_id'),
+            'channel_id': post_data.get('channel_id') or 0,
+            'message_type': post_data.get('message_type'),
+            'content': post_data.get('content', ''),
+            'caption': post_data.get('caption', ''),
+            'media_url': post_data.get('media_url'),
+            'file_id': post_data.get('file_id'),
+            'file_size': post_data.get('file_size'),
+            'width': post_data.get('width'),
+            'height': post_data.get('height'),
+            'date': date or now,
+            'edit_date': edit_date,
+        }
+
+    def _meta(self, conn, key):
+        """store_meta ထဲက counter တစ်ခု"""
+        row = conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def save_post(self, post_data):
+        """Post တစ်ခုကို save (upsert) လုပ်မယ်"""
+        return self.save_posts([post_data]) == 1
+
+    def save_posts(self, posts):
+        """Posts တွေကို transaction တစ်ခုတည်းနဲ့ save (upsert) လုပ်မယ်"""
+        if not posts:
+            return 0
+
+        conn = self._connection()
+        now = datetime.now().isoformat()
+        inserted = []
+        # Row id → နောက်ဆုံး content (batch တစ်ခုထဲ insert ပြီး edit ရင် edit ကိုပဲ tag လုပ်မယ်)
+        tagged, retagged = {}, []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # ပြောင်းသွားတဲ့ row တိုင်း version အသစ်ရမယ် (delta sync / SSE event ID အဖြစ်သုံးမယ်)
+            start_version = version = self._meta(conn, 'version')
+            for post_data in posts:
+                values = self._row_values(post_data, now)
+                existing = conn.execute(
+                    f"SELECT id, date, edit_date, {', '.join(CONTENT_COLUMNS)} FROM channel_posts "
+                    "WHERE post_id = ? AND channel_id = ?",
+                    (values['post_id'], values['channel_id'])
+                ).fetchone()
+
+                if existing:
+                    if not self._is_newer_edit(existing, values):
+                        continue
+                    version += 1
+                    retagged.append(existing['id'])
+                    tagged[existing['id']] = {**values, 'id': existing['id'], 'date': existing['date']}
+                    conn.execute("""
+                        UPDATE channel_posts
+                        SET content = :content, caption = :caption, media_url = :media_url,
+                            file_id = :file_id, file_size = :file_size, width = :width,
+                            height = :height, edit_date = :edit_date, updated_at = :now,
+                            version = :version
+                        WHERE id = :id
+                    """, {**values, 'now': now, 'version': version, 'id': existing['id']})
+                else:
+                    version += 1
+                    cursor = conn.execute("""
+                        INSERT INTO channel_posts
+                        (post_id, channel_id, message_type, content, caption, media_url,
+                         file_id, file_size, width, height, date, edit_date, created_at,
+                         updated_at, version)
+                        VALUES (:post_id, :channel_id, :message_type, :content, :caption,
+                                :media_url, :file_id, :file_size, :width, :height, :date,
+                                :edit_date, :now, :now, :version)
+                    """, {**values, 'now': now, 'version': version})
+                    inserted.append(values)
+                    tagged[cursor.lastrowid] = {**values, 'id': cursor.lastrowid}
+
+            self._mark_updates(conn, [post_data.get('update_id') for post_data in posts])
+            if version == start_version:
+                # Retries / မပြောင်းတဲ့ edits - post rows တွေ မထိဘူး
+                conn.execute("COMMIT")
+                return len(posts)
+
+            # Edit လုပ်ခဲ့တဲ့ posts တွေရဲ့ tags ကို ပြန်တွက်မယ်
+            _remove_post_tags(conn, retagged)
+            _add_post_tags(conn, tagged.values())
+            conn.execute("UPDATE store_meta SET value = ? WHERE key = 'version'", (version,))
+            conn.execute(
+                "UPDATE store_meta SET value = ? WHERE key = 'last_modified'",
+                (int(datetime.now().timestamp()),)
+            )
+            if inserted:
+                self._update_stats(conn, inserted, 1)
+                self._apply_retention(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return len(posts)
+
+    def _is_newer_edit(self, existing, values):
+        """ရှိပြီးသား row ကို update လုပ်သင့်လား - edit အသစ်ဖြစ်ပြီး content တကယ်ပြောင်းမှ True
+
+        Edit မဟုတ်တဲ့ redelivery (retry) က edit လုပ်ပြီးသား content ကို ပြန်မဖျက်ရဘူး၊
+        အစီအစဉ်မကျ ရောက်လာတဲ့ edit အဟောင်းကလည်း အသစ်ကို မဖျက်ရဘူး။
+        """
+        if values['edit_date'] is None:
+            return False
+        if existing['edit_date'] and values['edit_date'] < existing['edit_date']:
+            return False
+        return any(existing[column] != values[column] for column in CONTENT_COLUMNS)
+
+    def _mark_updates(self, conn, update_ids):
+        """Process လုပ်ပြီးသား update_ids တွေ မှတ်မယ် (နောက်ဆုံး max_updates ခုပဲ ထားမယ်)"""
+        update_ids = [(update_id, int(datetime.now().timestamp()))
+                      for update_id in update_ids if isinstance(update_id, int)]
+        if not update_ids:
+            return
+        conn.executemany(
+            "INSERT OR IGNORE INTO processed_updates (update_id, processed_at) VALUES (?, ?)",
+            update_ids
+        )
+        conn.execute("""
+            DELETE FROM processed_updates WHERE update_id <= (
+                SELECT update_id FROM processed_updates ORDER BY update_id DESC LIMIT 1 OFFSET ?
+            )
+        """, (self.max_updates,))
+
+    def mark_updates(self, update_ids):
+        """Post မဟုတ်တဲ့ updates (bot commands) တွေကို processed အဖြစ် မှတ်မယ်"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._mark_updates(conn, update_ids)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def has_update(self, update_id):
+        """ဒီ update_id ကို process လုပ်ပြီးပြီလား (restart / တခြား worker ကလည်း ဖြစ်နိုင်တယ်)"""
+        conn = self._connection()
+        return conn.execute(
+            "SELECT 1 FROM processed_updates WHERE update_id = ?", (update_id,)
+        ).fetchone() is not None
+
+    def _update_stats(self, conn, rows, sign):
+        """Insert (sign=1) / delete (sign=-1) လုပ်တဲ့ rows တွေအတွက် summary counters ပြောင်းမယ်"""
+        type_counts = Counter(row['message_type'] or 'unknown' for row in rows)
+        daily_counts = Counter(row['date'][:10] for row in rows)
+        conn.executemany("""
+            INSERT INTO post_type_counts (message_type, count) VALUES (?, ?)
+            ON CONFLICT (message_type) DO UPDATE SET count = count + excluded.count
+        """, [(key, sign * count) for key, count in type_counts.items()])
+        conn.executemany("""
+            INSERT INTO post_daily_counts (day, count) VALUES (?, ?)
+            ON CONFLICT (day) DO UPDATE SET count = count + excluded.count
+        """, [(key, sign * count) for key, count in daily_counts.items()])
+        conn.execute(
+            "UPDATE store_meta SET value = value + ? WHERE key = 'post_count'",
+            (sign * len(rows),)
+        )
+
+    def _apply_retention(self, conn):
+        """Retention cap ကျော်နေရင် အဟောင်းဆုံး posts တွေကို ဖျက်မယ်"""
+        if not self.max_posts:
+            return
+        excess = self._meta(conn, 'post_count') - self.max_posts
+        if excess <= 0:
+            return
+        expired = conn.execute("""
+            SELECT id, message_type, date FROM channel_posts
+            ORDER BY date ASC, id ASC LIMIT ?
+        """, (excess,)).fetchall()
+        conn.executemany("DELETE FROM channel_posts WHERE id = ?", [(row['id'],) for row in expired])
+        _remove_post_tags(conn, [row['id'] for row in expired])
+        self._update_stats(conn, expired, -1)
+
+    def get_posts(self, limit=50, cursor=None, tag=None):
+        """နောက်ဆုံး posts တွေကို (date, id) keyset နဲ့ date index ကနေ ယူမယ် (tag ပေးရင် post_tags index ကနေ)"""
+        conn = self._connection()
+        if tag is not None:
+            return self._get_tagged_posts(conn, limit, cursor, tag)
+        if cursor is None:
+            rows = conn.execute("""
+                SELECT * FROM channel_posts
+                ORDER BY date DESC, id DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+        else:
+            rows = conn.execute("""
+                SELECT * FROM channel_posts
+                WHERE (date, id) < (?, ?)
+                ORDER BY date DESC, id DESC
+                LIMIT ?
+            """, (*cursor, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def _get_tagged_posts(self, conn, limit, cursor, tag):
+        """Tag တစ်ခုရဲ့ posts - post_tags (tag_id, date, id) primary key ကို အစဉ်လိုက် ဖတ်မယ်"""
+        position = "AND (t.date, t.channel_post_id) < (?, ?)" if cursor is not None else ""
+        rows = conn.execute(f"""
+            SELECT p.* FROM post_tags t
+            JOIN channel_posts p ON p.id = t.channel_post_id
+            WHERE t.tag_id = (SELECT id FROM tags WHERE name = ?) {position}
+            ORDER BY t.date DESC, t.channel_post_id DESC
+            LIMIT ?
+        """, (tag.lower(), *(cursor or ()), limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_tags(self, limit=50):
+        """Post အများဆုံးပါတဲ့ tags တွေ - [{'name', 'count'}, ...]"""
+        rows = self._connection().execute(
+            "SELECT name, count FROM tags WHERE count > 0 ORDER BY count DESC, name LIMIT ?", (limit,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count_tags(self):
+        """Post တစ်ခုခုမှာ ပါနေတဲ့ tags အရေအတွက်"""
+        return self._connection().execute("SELECT COUNT(*) FROM tags WHERE count > 0").fetchone()[0]
+
+    def get_posts_since(self, version=0, timestamp=None, limit=50):
+        """version (သို့) timestamp နောက်ပိုင်း အသစ်/ပြင်ထားတဲ့ posts တွေ (version အစဉ်လိုက်)"""
+        conn = self._connection()
+        if timestamp is not None:
+            rows = conn.execute("""
+                SELECT * FROM channel_posts
+                WHERE updated_at > ?
+                ORDER BY updated_at ASC, version ASC
+                LIMIT ?
+            """, (timestamp, limit)).fetchall()
+        else:
+            rows = conn.execute("""
+                SELECT * FROM channel_posts
+                WHERE version > ?
+                ORDER BY version ASC
+                LIMIT ?
+            """, (version, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_posts_by_ids(self, ids):
+        """Row IDs တွေနဲ့ posts ယူမယ် (ids အစဉ်အတိုင်း)"""
+        if not ids:
+            return []
+        placeholders = ','.join('?' * len(ids))
+        rows = self._connection().execute(
+            f"SELECT * FROM channel_posts WHERE id IN ({placeholders})", list(ids)
+        ).fetchall()
+        by_id = {row['id']: dict(row) for row in rows}
+        return [by_id[row_id] for row_id in ids if row_id in by_id]
+
+    def get_post_ids(self):
+        """Store ထဲ ရှိနေတဲ့ row IDs အားလုံး (retention cap ကြောင့် bounded)"""
+        return {row[0] for row in self._connection().execute("SELECT id FROM channel_posts")}
+
+    def get_post(self, channel_id, post_id):
+        """(channel_id, post_id) နဲ့ post တစ်ခု ယူမယ် (message_id တွေက channel တစ်ခုအတွင်းမှာပဲ unique)"""
+        row = self._connection().execute(
+            "SELECT * FROM channel_posts WHERE channel_id = ? AND post_id = ?",
+            (channel_id, post_id)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def has_file_id(self, file_id):
+        """Store ထဲက post တစ်ခုခုမှာ ဒီ file_id ရှိမရှိ"""
+        conn = self._connection()
+        return conn.execute(
+            "SELECT 1 FROM channel_posts WHERE file_id = ? LIMIT 1", (file_id,)
+        ).fetchone() is not None
+
+    def get_version(self):
+        """Store-wide version နဲ့ နောက်ဆုံး write အချိန် (unix seconds)"""
+        rows = self._connection().execute(
+            "SELECT key, value FROM store_meta WHERE key IN ('version', 'last_modified')"
+        ).fetchall()
+        meta = {row['key']: row['value'] for row in rows}
+        return meta.get('version', 0), meta.get('last_modified', 0)
+
+    def get_stats(self):
+        """Summary tables ကနေ statistics ဖတ်မယ် (post အရေအတွက်နဲ့ မဆိုင်ဘဲ O(1))"""
+        conn = self._connection()
+        type_counts = {
+            row['message_type']: row['count']
+            for row in conn.execute("SELECT message_type, count FROM post_type_counts WHERE count > 0")
+        }
+        today = conn.execute(
+            "SELECT count FROM post_daily_counts WHERE day = ?",
+            (datetime.now().date().isoformat(),)
+        ).fetchone()
+        # (date, id) index ရဲ့ နောက်ဆုံး entry
+        latest = conn.execute("SELECT MAX(date) FROM channel_posts").fetchone()
+        return {
+            'total_posts': self._meta(conn, 'post_count'),
+            'type_counts': type_counts,
+            'latest_post': latest[0] if latest else None,
+            'today_posts': today['count'] if today else 0
+        }
+
+    def count(self):
+        """Store ထဲက post အရေအတွက်"""
+        return self._meta(self._connection(), 'post_count')
+
+    def close(self):
+        """လက်ရှိ thread ရဲ့ connection ကို ပိတ်မယ်"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+# Global post store instance
+post_store = PostStore()
@@ -0,0 +1,108 @@
+# read_cache.py
+import threading
+import time
+from collections import OrderedDict
+
+from config import config
+from post_store import post_store
+
+
+class ReadThroughCache:
+    """Key တစ်ခုချင်း lookups (single post) အတွက် bounded LRU + TTL read-through cache
+
+    - မတွေ့တဲ့ keys (loader က None) ကိုလည်း negative_ttl အတွင်း cache လုပ်မယ်
+    - Key တစ်ခုကို တပြိုင်နက် requests အများကြီး ရောက်လာရင် loader ကို တစ်ခါပဲ ခေါ်မယ် (single-flight)
+    - invalidate() က load လုပ်နေဆဲ value ဟောင်းကိုလည်း cache ထဲ မဝင်အောင် တားမယ်
+    """
+
+    def __init__(self, loader, max_entries=None, ttl=None, negative_ttl=None):
+        self.loader = loader
+        self.max_entries = max_entries or config.POST_CACHE_MAX_ENTRIES
+        self.ttl = config.POST_CACHE_TTL if ttl is None else ttl
+        self.negative_ttl = config.POST_CACHE_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        self._entries = OrderedDict()  # key -> (value, expires_at)
+        self._inflight = {}  # key -> [event, result, error, stale]
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'negative_hits': 0, 'misses': 0, 'coalesced': 0,
+                       'evictions': 0, 'invalidations': 0, 'errors': 0}
+
+    def get(self, key):
+        """Cache ထဲမှာ (မကုန်သေးရင်) ပြန်ပေးမယ်၊ မရှိရင် loader(key) နဲ့ load လုပ်ပြီး သိမ်းမယ်"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._stats['hits' if value is not None else 'negative_hits'] += 1
+                    return value
+                del self._entries[key]
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = [threading.Event(), None, None, False]
+                self._stats['misses'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        event = flight[0]
+        if not leader:
+            event.wait()
+            if flight[2] is not None:
+                raise flight[2]
+            return flight[1]
+
+        try:
+            value = flight[1] = self.loader(key)
+        except Exception as e:
+            flight[2] = e
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+        else:
+            with self._lock:
+                if not flight[3]:
+                    self._put(key, value)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+
+    def _put(self, key, value):
+        ttl = self.ttl if value is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def invalidate(self, keys):
+        """Write path ကနေ ခေါ်မယ် - ဒီ keys တွေရဲ့ cached / loading values တွေကို ဖယ်မယ်"""
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._stats['invalidations'] += 1
+                flight = self._inflight.get(key)
+                if flight is not None:
+                    # Write မတိုင်ခင် စဖတ်ခဲ့တဲ့ value - caller ကို ပြန်ပေးပေမယ့် မသိမ်းဘူး
+                    flight[3] = True
+
+    def clear(self):
+        """Entries အားလုံး ဖယ်မယ်"""
+        with self._lock:
+            self._entries.clear()
+            for flight in self._inflight.values():
+                flight[3] = True
+
+    def get_stats(self):
+        """Cache statistics"""
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries), 'max_entries': self.max_entries}
+
+
+# Global single-post cache (/api/posts/<post_key>, key = (channel_id, post_id)) - ingest write path က invalidate လုပ်မယ်
+post_cache = ReadThroughCache(lambda key: post_store.get_post(*key))
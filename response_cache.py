@@ -0,0 +1,108 @@
+# response_cache.py
+import json
+import threading
+from collections import OrderedDict
+
+from compression import compress
+from config import config
+
+try:
+    import orjson
+except ImportError:  # optional - မရှိရင် stdlib json သုံးမယ်
+    orjson = None
+
+
+def dumps(obj):
+    """Object ကို UTF-8 JSON bytes အဖြစ် encode လုပ်မယ် (orjson ရှိရင် orjson)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class ResponseCache:
+    """Encode လုပ်ပြီးသား JSON bodies တွေအတွက် size-bounded LRU cache (store version ပြောင်းရင် invalidate)"""
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.max_entries = max_entries or config.RESPONSE_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or config.RESPONSE_CACHE_MAX_BYTES
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._version = None
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def get_or_build(self, key, version, build):
+        """Cache ထဲမှာရှိရင် bytes ပြန်ပေးမယ်၊ မရှိရင် build() ကို encode လုပ်ပြီး သိမ်းမယ်"""
+        return self._get_or_create(key, version, lambda: dumps(build()))
+
+    def get_or_build_encoded(self, key, version, build, encoding):
+        """get_or_build + compressed variant (entry တစ်ခုကို တစ်ကြိမ်ပဲ compress လုပ်မယ်) - (body, encoding)"""
+        body = self.get_or_build(key, version, build)
+        if encoding is None or len(body) < config.COMPRESSION_MIN_SIZE:
+            return body, None
+        compressed = self._get_or_create(
+            (key, encoding), version, lambda: compress(body, encoding, config.COMPRESSION_LEVEL)
+        )
+        return compressed, encoding
+
+    def _get_or_create(self, key, version, create):
+        with self._lock:
+            self._check_version(version)
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return body
+            self._stats['misses'] += 1
+
+        body = create()
+
+        with self._lock:
+            # Build နေတုန်း store ပြောင်းသွားရင် version အဟောင်းနဲ့ မသိမ်းဘူး
+            if self._version == version:
+                self._put(key, body)
+        return body
+
+    def _check_version(self, version):
+        """Store version တိုးသွားရင် entries အားလုံး ဖျက်မယ်"""
+        if self._version is None or version > self._version:
+            if self._entries:
+                self._stats['invalidations'] += 1
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
+
+    def _put(self, key, body):
+        if len(body) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = body
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._stats['evictions'] += 1
+
+    def clear(self):
+        """Entries အားလုံး ဖျက်မယ်"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self):
+        """Hit/miss counters နဲ့ cache size"""
+        with self._lock:
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'encoder': 'orjson' if orjson is not None else 'json',
+            }
+
+
+# Global response cache instance
+response_cache = ResponseCache()
@@ -0,0 +1,96 @@
+# search_index.py
+import re
+import threading
+from collections import Counter, defaultdict
+
+from post_store import post_store
+
+# Latin/digits (\w) အပြင် Myanmar blocks (combining marks အပါအဝင်) ကိုလည်း word character အဖြစ်ယူမယ်
+TOKEN_RE = re.compile(r'[\w\u1000-\u109f\ua9e0-\ua9ff\uaa60-\uaa7f]+')
+
+SYNC_BATCH_SIZE = 500
+
+
+def tokenize(text):
+    """Text ကို lowercase tokens တွေအဖြစ် ခွဲမယ်"""
+    return [token.lower() for token in TOKEN_RE.findall(text or '')]
+
+
+class InvertedIndex:
+    """Post store အတွက် in-memory inverted index (token → row id → term frequency)"""
+
+    def __init__(self, store):
+        self.store = store
+        self._postings = defaultdict(dict)
+        self._doc_tokens = {}
+        self._doc_keys = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def _sync(self):
+        """Store version ပြောင်းသွားရင် အသစ်/ပြင်ထားတဲ့ rows တွေကိုပဲ index လုပ်မယ်"""
+        version, _ = self.store.get_version()
+        while version > self._version:
+            rows = self.store.get_posts_since(self._version, limit=SYNC_BATCH_SIZE)
+            if not rows:
+                self._version = version
+                break
+            for row in rows:
+                self._index(row)
+            self._version = rows[-1]['version']
+
+        # Retention က ဖျက်သွားတဲ့ rows တွေကို index ထဲကပါ ဖယ်မယ် (store ထက် docs များနေမှ ids စစ်မယ်)
+        if len(self._doc_keys) > self.store.count():
+            existing = self.store.get_post_ids()
+            for row_id in [row_id for row_id in self._doc_keys if row_id not in existing]:
+                self._remove(row_id)
+
+    def _index(self, row):
+        """Row တစ်ခုကို index ထဲ ထည့်မယ် (ရှိပြီးသားဆို tokens အဟောင်းတွေ အရင်ဖယ်မယ်)"""
+        self._remove(row['id'])
+        counts = Counter(tokenize(row.get('content')) + tokenize(row.get('caption')))
+        for token, count in counts.items():
+            self._postings[token][row['id']] = count
+        self._doc_tokens[row['id']] = tuple(counts)
+        self._doc_keys[row['id']] = (row['date'], row['id'])
+
+    def _remove(self, row_id):
+        for token in self._doc_tokens.pop(row_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(row_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._doc_keys.pop(row_id, None)
+
+    def search(self, query, limit=20, offset=0):
+        """Query tokens အားလုံးပါတဲ့ posts တွေ (score, date အစဉ်) - (rows, total) ပြန်ပေးမယ်"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return [], 0
+
+        with self._lock:
+            self._sync()
+
+            # Posting list အတိုဆုံးကနေ စပြီး intersect လုပ်မယ် (cost က matches နဲ့ပဲ ဆိုင်တယ်)
+            postings = sorted((self._postings.get(token, {}) for token in tokens), key=len)
+            if not postings[0]:
+                return [], 0
+            matches = set(postings[0])
+            for posting in postings[1:]:
+                matches.intersection_update(posting)
+                if not matches:
+                    return [], 0
+
+            ranked = sorted(
+                matches,
+                key=lambda row_id: (sum(posting[row_id] for posting in postings), self._doc_keys[row_id]),
+                reverse=True
+            )
+
+        # Sync ပြီးနောက် ဖျက်သွားတဲ့ rows တွေ မပါအောင် store ကနေပဲ ဖတ်မယ် (နောက် search မှာ index ထဲက ဖယ်မယ်)
+        return self.store.get_posts_by_ids(ranked[offset:offset + limit]), len(ranked)
+
+
+# Global search index instance (non-database storage mode)
+search_index = InvertedIndex(post_store)
@@ -1,7 +1,10 @@
-// static/js/app.js
+// static/js/script.js
 // ===== CONFIGURATION =====
 const API_BASE_URL = window.location.origin; // Same origin as the frontend
 const REFRESH_INTERVAL = 30000; // 30 seconds
+const SEARCH_DEBOUNCE = 300; // ms
+const DASHBOARD_REFRESH_DELAY = 1000; // ms - coalesce stats/tag refreshes during bursts of live posts
+const TAG_FILTER_LIMIT = 100;
 
 // DOM Elements
 const postsContainer = document.getElementById('postsContainer');
@@ -19,10 +22,18 @@ const tagCloudEl = document.getElementById('tagCloud');
 
 // State
 let allPosts = [];
-let allTags = new Set();
+let allTags = []; // [{name, count}] from /api/tags, most used first
+let dashboardTimer;
+let viewTimer;
+let tagRequestId = 0;
+let storeVersion = null; // Backend store version (delta sync)
 let countdown = REFRESH_INTERVAL / 1000;
 let refreshTimer;
 let countdownTimer;
+let searchTimer;
+let searchRequestId = 0;
+let eventSource = null; // Live stream (/api/posts/stream); polling is the fallback
+const sharedPostId = new URLSearchParams(window.location.search).get('post'); // Shared link (?post=<id>)
 
 // ===== FUNCTIONS =====
 
@@ -45,35 +56,20 @@ function formatDate(dateString) {
     }
 }
 
-// Update dashboard stats
-function updateDashboardStats(posts) {
-    totalPostsEl.textContent = posts.length;
-    
-    // Count unique tags
-    const tags = new Set();
-    posts.forEach(post => {
-        if (post.tags) {
-            post.tags.split(',').forEach(tag => {
-                if (tag.trim()) tags.add(tag.trim());
-            });
-        }
-    });
-    activeTagsEl.textContent = tags.size;
-    
-    // Count today's posts
-    const today = new Date().toDateString();
-    const todayCount = posts.filter(post => {
-        try {
-            const postDate = new Date(post.created_at).toDateString();
-            return postDate === today;
-        } catch (e) {
-            return false;
+// Update dashboard stats from the backend summary counters (covers every post, not just the loaded page)
+async function fetchStats() {
+    try {
+        const response = await fetch(`${API_BASE_URL}/api/stats`, { cache: 'no-cache' });
+        if (!response.ok) {
+            throw new Error(`API error: ${response.status}`);
         }
-    }).length;
-    todayPostsEl.textContent = todayCount;
-    
-    // Update tag cloud
-    updateTagCloud(Array.from(tags));
+        const stats = await response.json();
+        totalPostsEl.textContent = stats.total_posts ?? 0;
+        todayPostsEl.textContent = stats.today_posts ?? 0;
+        activeTagsEl.textContent = stats.total_tags ?? 0;
+    } catch (error) {
+        console.error('Error fetching stats:', error);
+    }
 }
 
 // Create tag cloud
@@ -84,64 +80,73 @@ function updateTagCloud(tags) {
     }
     
     let html = '';
-    tags.slice(0, 8).forEach(tag => {
+    tags.slice(0, 8).forEach(({ name: tag }) => {
         const randomSize = Math.floor(Math.random() * 6) + 14;
         const randomColor = `hsl(${Math.random() * 360}, 70%, 60%)`;
-        html += `<span class="tag-cloud-item" style="font-size: ${randomSize}px; color: ${randomColor};" data-tag="${tag}">${tag}</span> `;
+        html += `<span class="tag-cloud-item" style="font-size: ${randomSize}px; color: ${randomColor};" data-tag="${escapeHtml(tag)}">${escapeHtml(tag)}</span> `;
     });
     tagCloudEl.innerHTML = html;
     
     // Add click event to tag cloud items
     document.querySelectorAll('.tag-cloud-item').forEach(item => {
         item.addEventListener('click', () => {
-            tagSelect.value = item.dataset.tag;
-            filterPosts();
+            selectTag(item.dataset.tag);
         });
     });
 }
 
+// Newest first, same order as the backend (date, id)
+function comparePosts(a, b) {
+    const dateA = a.date || a.created_at || '';
+    const dateB = b.date || b.created_at || '';
+    if (dateA !== dateB) return dateA < dateB ? 1 : -1;
+    return (b.telegram_message_id || 0) - (a.telegram_message_id || 0);
+}
+
+// Merge new/updated posts into allPosts (id is "<channel_id>:<message_id>", the same for every backend)
+function mergePosts(posts) {
+    const postsById = new Map(allPosts.map(post => [post.id, post]));
+    posts.forEach(post => postsById.set(post.id, post));
+    allPosts = Array.from(postsById.values()).sort(comparePosts);
+}
+
+// Fetch only posts changed since storeVersion
+async function fetchPostDeltas() {
+    let changed = false;
+    let hasMore = true;
+    
+    while (hasMore) {
+        // no-cache: browser revalidates with If-None-Match and gets a cheap 304 when nothing changed
+        const response = await fetch(`${API_BASE_URL}/api/posts?since=${storeVersion}`, { cache: 'no-cache' });
+        if (!response.ok) {
+            throw new Error(`API error: ${response.status}`);
+        }
+        
+        const data = await response.json();
+        if (data.posts && data.posts.length > 0) {
+            mergePosts(data.posts);
+            changed = true;
+        }
+        storeVersion = data.version;
+        hasMore = data.has_more;
+    }
+    return changed;
+}
+
 // Fetch posts from backend API
 async function fetchPosts() {
     try {
-        loadingEl.style.display = 'block';
-        noPostsEl.style.display = 'none';
-        
-        const response = await fetch(`${API_BASE_URL}/api/posts`);
-        if (!response.ok) {
-            if (response.status === 404) {
-                // Try channel posts endpoint as fallback
-                const channelResponse = await fetch(`${API_BASE_URL}/api/channel/posts`);
-                if (channelResponse.ok) {
-                    const channelData = await channelResponse.json();
-                    allPosts = channelData.data?.posts || [];
-                } else {
-                    throw new Error(`API error: ${response.status}`);
-                }
-            } else {
-                throw new Error(`API error: ${response.status}`);
-            }
+        if (storeVersion !== null) {
+            // Delta sync - nothing to re-render if nothing changed
+            const changed = await fetchPostDeltas();
+            lastUpdateEl.textContent = 'Just now';
+            if (!changed) return;
         } else {
-            const data = await response.json();
-            allPosts = data.posts || [];
+            await fetchAllPosts();
+            startLiveStream();
         }
         
-        // Update dashboard
-        updateDashboardStats(allPosts);
-        
-        // Extract tags for filter dropdown
-        extractTags();
-        populateTagFilter();
-        
-        // Display posts
-        displayPosts(allPosts);
-        
-        // Update last update time
-        lastUpdateEl.textContent = 'Just now';
-        loadingEl.style.display = 'none';
-        
-        if (allPosts.length === 0) {
-            noPostsEl.style.display = 'block';
-        }
+        renderPosts();
         
     } catch (error) {
         console.error('Error fetching posts:', error);
@@ -162,17 +167,166 @@ async function fetchPosts() {
     }
 }
 
-// Extract unique tags from posts
-function extractTags() {
-    allTags.clear();
-    allPosts.forEach(post => {
-        if (post.tags) {
-            post.tags.split(',').forEach(tag => {
-                const cleanTag = tag.trim();
-                if (cleanTag) allTags.add(cleanTag);
-            });
-        }
+// Re-render dashboard, filters and posts from allPosts
+function renderPosts() {
+    // Stats and tag counts come from the backend summary tables / tag index
+    scheduleDashboardRefresh();
+    
+    // Display posts (keeping an active search or tag filter)
+    showCurrentView();
+    
+    // Update last update time
+    lastUpdateEl.textContent = 'Just now';
+    loadingEl.style.display = 'none';
+    
+    if (allPosts.length === 0) {
+        noPostsEl.style.display = 'block';
+    }
+}
+
+// Show allPosts, or re-run the active search / tag filter so live posts don't reset it
+function showCurrentView() {
+    clearTimeout(viewTimer);
+    const searchTerm = searchInput.value.trim();
+    if (searchTerm) {
+        viewTimer = setTimeout(() => runSearch(searchTerm), DASHBOARD_REFRESH_DELAY);
+    } else if (tagSelect.value !== 'all') {
+        viewTimer = setTimeout(filterPosts, DASHBOARD_REFRESH_DELAY);
+    } else {
+        displayPosts(allPosts);
+    }
+}
+
+// Subscribe to pushed posts; returns false when the browser can't stream
+function startLiveStream() {
+    if (!window.EventSource || storeVersion === null) return false;
+    if (eventSource) return true;
+    
+    // Reconnects resume from the last received post via the Last-Event-ID header
+    eventSource = new EventSource(`${API_BASE_URL}/api/posts/stream?last_event_id=${storeVersion}`);
+    
+    eventSource.onopen = () => {
+        stopPolling();
+        countdownEl.textContent = 'live';
+    };
+    
+    eventSource.onmessage = (event) => {
+        mergePosts([JSON.parse(event.data)]);
+        storeVersion = Number(event.lastEventId);
+        renderPosts();
+    };
+    
+    // Too far behind to replay - reload the first page
+    eventSource.addEventListener('reset', () => {
+        storeVersion = null;
+        fetchPosts();
     });
+    
+    eventSource.onerror = () => {
+        // CONNECTING means the browser retries by itself; CLOSED (e.g. 503 when the
+        // server's stream slots are full) means give up and poll
+        if (eventSource && eventSource.readyState === EventSource.CLOSED) {
+            stopLiveStream();
+            startPolling();
+        }
+    };
+    return true;
+}
+
+function stopLiveStream() {
+    if (eventSource) {
+        eventSource.close();
+        eventSource = null;
+    }
+}
+
+function startPolling() {
+    stopPolling();
+    refreshTimer = setInterval(fetchPosts, REFRESH_INTERVAL);
+    countdownTimer = setInterval(updateCountdown, 1000);
+}
+
+function stopPolling() {
+    clearInterval(refreshTimer);
+    clearInterval(countdownTimer);
+}
+
+// Fetch the first page of posts (full load)
+async function fetchAllPosts() {
+    loadingEl.style.display = 'block';
+    noPostsEl.style.display = 'none';
+    
+    const response = await fetch(`${API_BASE_URL}/api/posts`, { cache: 'no-cache' });
+    if (!response.ok) {
+        if (response.status === 404) {
+            // Try channel posts endpoint as fallback
+            const channelResponse = await fetch(`${API_BASE_URL}/api/channel/posts`);
+            if (channelResponse.ok) {
+                const channelData = await channelResponse.json();
+                allPosts = channelData.data?.posts || [];
+            } else {
+                throw new Error(`API error: ${response.status}`);
+            }
+        } else {
+            throw new Error(`API error: ${response.status}`);
+        }
+    } else {
+        const data = await response.json();
+        allPosts = data.posts || [];
+        storeVersion = data.version ?? null;
+    }
+}
+
+// Shared link - fetch just that post instead of the whole list
+async function showSharedPost(postId) {
+    loadingEl.style.display = 'block';
+    try {
+        const response = await fetch(`${API_BASE_URL}/api/posts/${encodeURIComponent(postId)}`);
+        if (!response.ok) {
+            throw new Error(response.status === 404 ? 'Post not found' : `API error: ${response.status}`);
+        }
+        displayPosts([await response.json()]);
+    } catch (error) {
+        console.error('Error fetching post:', error);
+        postsContainer.innerHTML = `
+            <div class="empty-state">
+                <div class="empty-icon">
+                    <i class="fas fa-exclamation-triangle"></i>
+                </div>
+                <h3>${escapeHtml(error.message)}</h3>
+                <a class="refresh-btn" href="/" style="margin-top: 20px;">
+                    <i class="fas fa-list"></i> All posts
+                </a>
+            </div>
+        `;
+    } finally {
+        loadingEl.style.display = 'none';
+        lastUpdateEl.textContent = 'Just now';
+    }
+}
+
+// Fetch most used tags from the backend tag index (no client-side scanning)
+async function fetchTags() {
+    try {
+        const response = await fetch(`${API_BASE_URL}/api/tags?limit=${TAG_FILTER_LIMIT}`, { cache: 'no-cache' });
+        if (!response.ok) {
+            throw new Error(`API error: ${response.status}`);
+        }
+        const data = await response.json();
+        allTags = data.tags || [];
+        updateTagCloud(allTags);
+        populateTagFilter();
+    } catch (error) {
+        console.error('Error fetching tags:', error);
+    }
+}
+
+function scheduleDashboardRefresh() {
+    clearTimeout(dashboardTimer);
+    dashboardTimer = setTimeout(() => {
+        fetchStats();
+        fetchTags();
+    }, allTags.length ? DASHBOARD_REFRESH_DELAY : 0);
 }
 
 // Populate tag filter dropdown
@@ -182,21 +336,37 @@ function populateTagFilter() {
     // Keep "All Posts" option
     tagSelect.innerHTML = '<option value="all">All Posts</option>';
     
-    // Add sorted tags
-    const sortedTags = Array.from(allTags).sort();
-    sortedTags.forEach(tag => {
+    // Add tags, most used first
+    allTags.forEach(({ name, count }) => {
         const option = document.createElement('option');
-        option.value = tag;
-        option.textContent = tag;
+        option.value = name;
+        option.textContent = `${name} (${count})`;
         tagSelect.appendChild(option);
     });
     
-    // Restore selection
-    if (currentTag && Array.from(allTags).includes(currentTag)) {
+    // Restore selection (a tag picked from a card may be outside the top list)
+    if (currentTag && currentTag !== 'all') {
+        ensureTagOption(currentTag);
         tagSelect.value = currentTag;
     }
 }
 
+// Add an option for a tag unless the dropdown already has one
+function ensureTagOption(tag) {
+    if (Array.from(tagSelect.options).some(option => option.value === tag)) return;
+    const option = document.createElement('option');
+    option.value = tag;
+    option.textContent = tag;
+    tagSelect.appendChild(option);
+}
+
+// Make sure a tag clicked on a card is selectable even if it is not in the top list
+function selectTag(tag) {
+    ensureTagOption(tag);
+    tagSelect.value = tag;
+    filterPosts();
+}
+
 // Display posts in grid
 function displayPosts(posts) {
     postsContainer.innerHTML = '';
@@ -214,24 +384,28 @@ function displayPosts(posts) {
         
         // Determine media type and create HTML
         let mediaHtml = '';
-        if (post.file_url) {
-            const isVideo = post.file_url.match(/\.(mp4|webm|ogg|mov)$/i) || 
-                           post.file_url.includes('youtube.com') || 
-                           post.file_url.includes('youtu.be');
-            
-            if (isVideo) {
-                mediaHtml = `
-                    <div class="no-media">
-                        <i class="fas fa-video"></i>
-                    </div>
-                `;
-            } else {
-                mediaHtml = `<img src="${post.file_url}" alt="${post.post_title || 'Post image'}" class="post-media" loading="lazy" onerror="this.style.display='none'; this.parentNode.querySelector('.no-media')?.style.display='flex';">`;
-                // Add fallback
-                mediaHtml += `<div class="no-media" style="display: none;">
-                    <i class="fas fa-image"></i>
-                </div>`;
-            }
+        const isImage = ['photo', 'sticker'].includes(post.media_type);
+        const isVideo = ['video', 'animation', 'video_note'].includes(post.media_type) ||
+                       (post.file_url && (post.file_url.match(/\.(mp4|webm|ogg|mov)$/i) ||
+                        post.file_url.includes('youtube.com') ||
+                        post.file_url.includes('youtu.be')));
+        
+        if (post.file_url && isVideo && post.file_url.startsWith('/media/')) {
+            // Cache ကနေ Range requests နဲ့ stream လုပ်မယ် (play မနှိပ်မချင်း မဒေါင်းဘူး)
+            mediaHtml = `<video src="${post.file_url}" class="post-media" controls preload="none"></video>`;
+        } else if (post.file_url && isVideo) {
+            mediaHtml = `
+                <div class="no-media">
+                    <i class="fas fa-video"></i>
+                </div>
+            `;
+        } else if (post.file_url && (isImage || !post.media_type)) {
+            const imageUrl = post.thumbnail_url || post.file_url;
+            mediaHtml = `<img src="${imageUrl}" alt="${escapeHtml(post.post_title || 'Post image')}" class="post-media" loading="lazy" onerror="this.style.display='none'; this.parentNode.querySelector('.no-media')?.style.display='flex';">`;
+            // Add fallback
+            mediaHtml += `<div class="no-media" style="display: none;">
+                <i class="fas fa-image"></i>
+            </div>`;
         } else {
             mediaHtml = `
                 <div class="no-media">
@@ -242,11 +416,11 @@ function displayPosts(posts) {
         
         // Create tags HTML
         let tagsHtml = '';
-        if (post.tags && post.tags !== 'telegram') {
+        if (post.tags) {
             tagsHtml = post.tags.split(',').map(tag => {
                 const cleanTag = tag.trim();
                 if (!cleanTag) return '';
-                return `<span class="tag" data-tag="${cleanTag}">${cleanTag}</span>`;
+                return `<span class="tag" data-tag="${escapeHtml(cleanTag)}">${escapeHtml(cleanTag)}</span>`;
             }).join('');
         }
         
@@ -259,13 +433,13 @@ function displayPosts(posts) {
                 <h3 class="post-title">${escapeHtml(post.post_title || 'Untitled Post')}</h3>
                 <div class="post-meta">
                     <span><i class="far fa-clock"></i> ${formattedDate}</span>
-                    <span><i class="far fa-comment"></i> #${post.telegram_message_id || post.id}</span>
+                    <a href="?post=${encodeURIComponent(post.id)}"><i class="far fa-comment"></i> #${post.telegram_message_id}</a>
                 </div>
                 <p class="post-description">${escapeHtml(post.post_description || post.content || 'No description available')}</p>
                 ${tagsHtml ? `<div class="post-tags">${tagsHtml}</div>` : ''}
                 <div class="post-actions">
                     ${post.file_url ? `<a href="${post.file_url}" target="_blank" class="action-btn view-btn"><i class="fas fa-external-link-alt"></i> View File</a>` : ''}
-                    <button class="action-btn save-btn" onclick="savePost(${post.id})">
+                    <button class="action-btn save-btn" onclick="savePost('${escapeHtml(post.id)}')">
                         <i class="far fa-bookmark"></i> Save
                     </button>
                 </div>
@@ -278,41 +452,68 @@ function displayPosts(posts) {
     // Add click event to tags
     document.querySelectorAll('.post-tags .tag').forEach(tag => {
         tag.addEventListener('click', (e) => {
-            tagSelect.value = e.target.dataset.tag;
-            filterPosts();
+            selectTag(e.target.dataset.tag);
         });
     });
 }
 
-// Filter posts based on selected tag
-function filterPosts() {
+// Filter posts based on selected tag (server-side tag index, covers every post)
+async function filterPosts() {
+    clearTimeout(viewTimer);
     const selectedTag = tagSelect.value;
+    const requestId = ++tagRequestId;
     if (selectedTag === 'all') {
         displayPosts(allPosts);
-    } else {
-        const filtered = allPosts.filter(post => 
-            post.tags && post.tags.toLowerCase().includes(selectedTag.toLowerCase())
-        );
-        displayPosts(filtered);
+        return;
+    }
+    
+    try {
+        const response = await fetch(`${API_BASE_URL}/api/posts?tag=${encodeURIComponent(selectedTag)}&limit=100`);
+        if (!response.ok) {
+            throw new Error(`API error: ${response.status}`);
+        }
+        const data = await response.json();
+        
+        // Ignore results of an older, slower tag request
+        if (requestId === tagRequestId) {
+            displayPosts(data.posts || []);
+        }
+    } catch (error) {
+        console.error('Error filtering posts:', error);
     }
 }
 
-// Search posts
+// Search posts (server-side, so it covers every post, not just the loaded page)
 function searchPosts() {
-    const searchTerm = searchInput.value.toLowerCase();
+    clearTimeout(searchTimer);
+    clearTimeout(viewTimer);
+    const searchTerm = searchInput.value.trim();
     if (!searchTerm) {
+        searchRequestId++;
         displayPosts(allPosts);
         return;
     }
     
-    const filtered = allPosts.filter(post => 
-        (post.post_title && post.post_title.toLowerCase().includes(searchTerm)) ||
-        (post.post_description && post.post_description.toLowerCase().includes(searchTerm)) ||
-        (post.content && post.content.toLowerCase().includes(searchTerm)) ||
-        (post.tags && post.tags.toLowerCase().includes(searchTerm))
-    );
-    
-    displayPosts(filtered);
+    // Wait until the user stops typing
+    searchTimer = setTimeout(() => runSearch(searchTerm), SEARCH_DEBOUNCE);
+}
+
+async function runSearch(searchTerm) {
+    const requestId = ++searchRequestId;
+    try {
+        const response = await fetch(`${API_BASE_URL}/api/search?q=${encodeURIComponent(searchTerm)}&limit=50`);
+        if (!response.ok) {
+            throw new Error(`API error: ${response.status}`);
+        }
+        const data = await response.json();
+        
+        // Ignore results of an older, slower search
+        if (requestId === searchRequestId) {
+            displayPosts(data.posts || []);
+        }
+    } catch (error) {
+        console.error('Error searching posts:', error);
+    }
 }
 
 // Save post (example function)
@@ -321,12 +522,12 @@ function savePost(postId) {
     // In a real app, you would save this to localStorage or send to backend
 }
 
-// Escape HTML to prevent XSS
+// Escape HTML to prevent XSS (quotes too, so the result is safe inside attributes)
 function escapeHtml(text) {
     if (!text) return '';
     const div = document.createElement('div');
     div.textContent = text;
-    return div.innerHTML;
+    return div.innerHTML.replace(/"/g, '&quot;').replace(/'/g, '&#39;');
 }
 
 // Countdown timer for auto-refresh
@@ -341,12 +542,16 @@ function updateCountdown() {
 
 // ===== INITIALIZATION =====
 document.addEventListener('DOMContentLoaded', () => {
-    // Initial fetch
-    fetchPosts();
-    
-    // Set up auto-refresh
-    refreshTimer = setInterval(fetchPosts, REFRESH_INTERVAL);
-    countdownTimer = setInterval(updateCountdown, 1000);
+    if (sharedPostId) {
+        // Shared link: one cached lookup, no full list download or live updates
+        showSharedPost(sharedPostId);
+    } else {
+        // Initial fetch
+        fetchPosts();
+        
+        // Set up auto-refresh (stopped once the live stream connects)
+        startPolling();
+    }
     
     // Event listeners
     tagSelect.addEventListener('change', filterPosts);
@@ -358,29 +563,16 @@ document.addEventListener('DOMContentLoaded', () => {
     
     searchInput.addEventListener('input', searchPosts);
     
-    // Also fetch stats from /api/stats endpoint
-    fetch(`${API_BASE_URL}/api/stats`)
-        .then(res => {
-            if (res.ok) return res.json();
-            return fetch(`${API_BASE_URL}/api/channel/stats`);
-        })
-        .then(res => res.json())
-        .then(stats => {
-            // Update stats if needed
-            if (stats.data) {
-                totalPostsEl.textContent = stats.data.total_posts || stats.total_posts || 0;
-            }
-        })
-        .catch(console.error);
+    fetchStats();
 });
 
-// Clean up timers when page is hidden
+// Clean up timers and the live stream when page is hidden
 document.addEventListener('visibilitychange', function() {
+    if (sharedPostId) return;
     if (document.hidden) {
-        clearInterval(refreshTimer);
-        clearInterval(countdownTimer);
-    } else {
-        refreshTimer = setInterval(fetchPosts, REFRESH_INTERVAL);
-        countdownTimer = setInterval(updateCountdown, 1000);
+        stopPolling();
+        stopLiveStream();
+    } else if (!startLiveStream()) {
+        startPolling();
     }
 });
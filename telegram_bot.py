@@ -1,13 +1,19 @@
 # telegram_bot.py
 import asyncio
+import atexit
 import logging
-from telegram import Bot, Update
+import os
+from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 from telegram.constants import ParseMode
 import threading
+import time
 
+from batching import QueueFull
 from config import config
 from database import db
+from metrics import metrics
+from user_cache import UserUpsertCache
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +23,7 @@ class TelegramBot:
         self.bot = None
         self.application = None
         self.is_setup = False
+        self._setup_lock = None
     
     async def setup_async(self):
         """Bot ကို async နည်းနဲ့ setup လုပ်မယ်"""
@@ -27,6 +34,16 @@ class TelegramBot:
         if self.is_setup:
             return True
         
+        # Updates အများကြီး တပြိုင်နက်ရောက်ရင် setup တစ်ခါပဲ လုပ်အောင်
+        if self._setup_lock is None:
+            self._setup_lock = asyncio.Lock()
+        async with self._setup_lock:
+            if self.is_setup:
+                return True
+            return await self._setup()
+    
+    async def _setup(self):
+        """Application create ပြီး initialize လုပ်မယ်"""
         try:
             # Application create လုပ်မယ်
             self.application = Application.builder().token(self.token).build()
@@ -101,9 +118,11 @@ class TelegramBot:
             await update.message.reply_text("⛔ ဤ command ကို သုံးခွင့်မရှိပါ။")
             return
         
-        # Database ကနေ statistics ယူမယ်
+        # /api/stats နဲ့ source တူ - thread ထဲမှာ ဖတ်ပြီး bot loop ကို မ block ဘူး
         try:
-            stats = db.get_stats()
+            from app import read_stats
+            stats = await asyncio.to_thread(read_stats)
+            latest_post = stats['latest_post'][:16].replace('T', ' ') if stats['latest_post'] else 'N/A'
             
             stats_text = f"""
 📊 **Bot Statistics**
@@ -111,7 +130,8 @@ class TelegramBot:
 📝 Total Posts: {stats['total_posts']}
 🖼️ Photo Posts: {stats['type_counts'].get('photo', 0)}
 📝 Text Posts: {stats['type_counts'].get('text', 0)}
-🕒 Latest Post: {stats['latest_post'].strftime('%Y-%m-%d %H:%M') if stats['latest_post'] else 'N/A'}
+📅 Today: {stats['today_posts']}
+🕒 Latest Post: {latest_post}
 
 🔗 Webhook: {config.WEBHOOK_URL}
 🌐 Server: {config.RENDER_URL}
@@ -126,20 +146,8 @@ class TelegramBot:
         message = update.message.text
         user = update.effective_user
         
-        # Database ထဲမှာ user ကို save/update လုပ်မယ်
-        try:
-            with db.conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO users (user_id, username, first_name, last_name)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (user_id) DO UPDATE
-                    SET username = EXCLUDED.username,
-                        first_name = EXCLUDED.first_name,
-                        last_name = EXCLUDED.last_name
-                """, (user.id, user.username, user.first_name, user.last_name))
-                db.conn.commit()
-        except Exception as e:
-            logger.error(f"User save error: {e}")
+        # User အသစ် (သို့) profile ပြောင်းမှသာ database ထဲ batch နဲ့ save/update လုပ်မယ်
+        user_cache.touch(user.id, user.username, user.first_name, user.last_name)
         
         # Echo message
         await update.message.reply_text(f"📩 Message received: {message[:50]}...")
@@ -151,7 +159,10 @@ class TelegramBot:
             return False
         
         try:
-            bot = Bot(token=self.token)
+            # Application ရဲ့ bot (HTTP client) ကိုပဲ ပြန်သုံးမယ်
+            if not await self.setup_async():
+                return False
+            bot = self.application.bot
             
             # Delete existing webhook
             await bot.delete_webhook(drop_pending_updates=True)
@@ -177,30 +188,168 @@ class TelegramBot:
         except Exception as e:
             logger.error(f"❌ Process update error: {e}")
 
+class BotRunner:
+    """Bot ကို long-lived event loop တစ်ခုတည်းမှာ run မယ်
+
+    WSGI mode မှာ dedicated thread ပေါ်က loop ကို ကိုယ်တိုင်စမယ်၊ ASGI mode မှာတော့
+    attach() နဲ့ server ရဲ့ loop ပေါ်မှာပဲ run မယ်။
+    """
+    
+    def __init__(self, bot, max_concurrency=None, max_pending=None):
+        self.bot = bot
+        self.max_concurrency = max_concurrency or config.BOT_MAX_CONCURRENT_UPDATES
+        self.max_pending = max_pending or config.BOT_MAX_PENDING_UPDATES
+        self.loop = None
+        self._thread = None
+        self._pid = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+        self._stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'rejected': 0,
+            'pending': 0,
+            'running': 0,
+        }
+    
+    def start(self):
+        """Event loop thread ကို လိုမှ စမယ် (fork ပြီးရင် worker ထဲမှာ အသစ်စမယ်)"""
+        with self._lock:
+            if self.loop is not None and self._pid == os.getpid():
+                return self.loop
+            
+            self._pid = os.getpid()
+            self.loop = asyncio.new_event_loop()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._thread = threading.Thread(target=self._run, name='telegram-bot-loop', daemon=True)
+            self._thread.start()
+            return self.loop
+    
+    def attach(self, loop):
+        """ASGI mode - thread မစဘဲ server ရဲ့ running loop ပေါ်မှာ updates တွေ process လုပ်မယ်"""
+        with self._lock:
+            self._pid = os.getpid()
+            self.loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._thread = None
+        return loop
+    
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+    
+    def run(self, coro, timeout=None):
+        """Coroutine ကို bot loop ပေါ်မှာ run ပြီး result ကို စောင့်မယ်"""
+        return asyncio.run_coroutine_threadsafe(coro, self.start()).result(timeout)
+    
+    def submit_update(self, update_data):
+        """Update ကို bot loop ဆီ ပို့မယ် (မစောင့်ဘူး) - pending များလွန်းရင် QueueFull"""
+        with self._lock:
+            if self._stats['pending'] >= self.max_pending:
+                self._stats['rejected'] += 1
+                metrics.inc('bot_updates_total', result='rejected')
+                raise QueueFull(f"Bot update queue is full ({self.max_pending} pending)")
+            self._stats['pending'] += 1
+            self._stats['submitted'] += 1
+        metrics.inc('bot_updates_total', result='submitted')
+        return asyncio.run_coroutine_threadsafe(self._process(update_data), self.start())
+    
+    async def _process(self, update_data):
+        """Semaphore နဲ့ concurrency ကန့်သတ်ပြီး update ကို process လုပ်မယ်"""
+        acquired = False
+        try:
+            async with self._semaphore:
+                acquired = True
+                self._update_stats(pending=-1, running=1)
+                started = time.perf_counter()
+                try:
+                    await self.bot.process_update_async(update_data)
+                    self._update_stats(completed=1)
+                except Exception:
+                    self._update_stats(failed=1)
+                    raise
+                finally:
+                    self._update_stats(running=-1)
+                    metrics.observe('bot_update_duration_seconds', time.perf_counter() - started)
+        finally:
+            if not acquired:
+                self._update_stats(pending=-1)
+    
+    def _update_stats(self, **deltas):
+        """Stats counters တွေကို thread-safe ပြောင်းမယ်"""
+        with self._lock:
+            for key, delta in deltas.items():
+                self._stats[key] += delta
+        for key in ('completed', 'failed'):
+            if key in deltas:
+                metrics.inc('bot_updates_total', deltas[key], result=key)
+    
+    def _gauges(self):
+        """/metrics အတွက် update queue gauges"""
+        stats = self.get_stats()
+        return [(f"bot_updates_{key}", {}, stats[key]) for key in ('pending', 'running')]
+    
+    def get_stats(self):
+        """Update queue depth နဲ့ processing statistics"""
+        with self._lock:
+            return {**self._stats, 'max_concurrency': self.max_concurrency}
+    
+    def stop(self, timeout=5.0):
+        """Pending updates တွေ ပြီးအောင်စောင့်၊ Application ကို shutdown လုပ်ပြီး loop ကို ရပ်မယ်"""
+        if self._thread is None or self._pid != os.getpid():
+            return
+        try:
+            self.run(self._shutdown(timeout), timeout * 2)
+        except Exception as e:
+            logger.error(f"❌ Bot shutdown error: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+    
+    async def aclose(self, timeout=5.0):
+        """ASGI shutdown - process လုပ်နေဆဲ updates တွေ စောင့်ပြီး Application ကို shutdown လုပ်မယ်"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            stats = self.get_stats()
+            if not stats['pending'] and not stats['running']:
+                break
+            await asyncio.sleep(0.05)
+        if self.bot.is_setup:
+            await self.bot.application.shutdown()
+    
+    async def _shutdown(self, timeout):
+        """Loop ပေါ်က ကျန်နေတဲ့ tasks တွေကို စောင့်ပြီး Application ကို shutdown လုပ်မယ်"""
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
+        if self.bot.is_setup:
+            await self.bot.application.shutdown()
+
 # Global bot instance
+user_cache = UserUpsertCache(db.upsert_users)
+atexit.register(user_cache.close)
 telegram_bot = TelegramBot()
+bot_runner = BotRunner(telegram_bot)
+metrics.register_gauges(bot_runner._gauges)
+atexit.register(bot_runner.stop)
 
 # Sync wrapper functions for Flask
 def setup_webhook_sync():
     """Sync wrapper for webhook setup"""
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        return loop.run_until_complete(telegram_bot.setup_webhook_async())
+        return bot_runner.run(telegram_bot.setup_webhook_async(), timeout=30)
     except Exception as e:
         logger.error(f"❌ Webhook setup error (sync): {e}")
         return False
-    finally:
-        loop.close()
 
-def process_update_sync(update_data):
+def submit_update(update_data):
+    """Update ကို bot event loop ဆီ ပို့မယ် (Flask request ကို block မလုပ်ဘူး)"""
+    return bot_runner.submit_update(update_data)
+
+def process_update_sync(update_data, timeout=30):
     """Sync wrapper for processing updates"""
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        return loop.run_until_complete(telegram_bot.process_update_async(update_data))
+        return submit_update(update_data).result(timeout)
     except Exception as e:
         logger.error(f"❌ Process update error (sync): {e}")
         return False
-    finally:
-        loop.close()
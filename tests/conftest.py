@@ -0,0 +1,16 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+
+# Tests တွေ Postgres / Telegram မလိုဘူး - config import မတိုင်ခင် stores တွေကို temp dir ထဲ ညွှန်မယ်
+_tmp = tempfile.mkdtemp(prefix='4utoday-tests-')
+os.environ['DATABASE_URL'] = ''
+os.environ['TOKEN'] = ''
+os.environ['LOG_SINK_ENABLED'] = 'false'
+os.environ.setdefault('POST_STORE_PATH', os.path.join(_tmp, 'posts.db'))
+os.environ.setdefault('METRICS_DIR', os.path.join(_tmp, 'metrics'))
+os.environ.setdefault('MEDIA_CACHE_DIR', os.path.join(_tmp, 'media'))
+os.environ.setdefault('DB_ARCHIVE_DIR', os.path.join(_tmp, 'archive'))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
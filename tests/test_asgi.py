@@ -0,0 +1,44 @@
+# tests/test_asgi.py
+import asyncio
+
+import httpx
+import pytest
+
+from app import app as flask_app, post_store
+from asgi import app as asgi_app
+
+
+def asgi_get(path):
+    async def fetch():
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            return await client.get(path)
+    return asyncio.run(fetch())
+
+
+@pytest.fixture(autouse=True)
+def posts():
+    post_store.save_posts([
+        {'message_id': 700 + n, 'channel_id': -100, 'message_type': 'text',
+         'content': f'asgi parity {n} #parity', 'date': 1700000700 + n}
+        for n in range(3)
+    ])
+
+
+@pytest.mark.parametrize('path', [
+    '/api/posts?limit=2',
+    '/api/posts?tag=parity',
+    '/api/posts?since=0&limit=2',
+    '/api/search?q=parity&limit=2&offset=1',
+    '/api/search?q=parity&limit=abc',
+    '/api/search?q=',
+    '/api/posts?tag=',
+    '/api/posts?cursor=bogus',
+])
+def test_asgi_routes_match_flask(path):
+    """ASGI routes တွေက Flask routes နဲ့ helpers တူတူ သုံးလို့ status / body တူရမယ်"""
+    expected = flask_app.test_client().get(path)
+    actual = asgi_get(path)
+
+    assert actual.status_code == expected.status_code
+    assert actual.json() == expected.get_json()
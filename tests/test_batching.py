@@ -0,0 +1,73 @@
+# tests/test_batching.py
+import threading
+
+import pytest
+
+from batching import BatchWriter, QueueFull
+
+
+def test_items_are_flushed_in_batches():
+    batches = []
+    writer = BatchWriter(batches.append, 'test', batch_size=3, flush_interval=0.05)
+
+    for item in range(7):
+        writer.put(item)
+    writer.close()
+
+    assert [item for batch in batches for item in batch] == list(range(7))
+    assert all(len(batch) <= 3 for batch in batches)
+    stats = writer.get_stats()
+    assert stats['flushed'] == 7
+    assert stats['queue_depth'] == 0
+
+
+def test_full_queue_rejects_items():
+    """Writer thread ပိတ်ဆို့နေရင် queue ပြည့်ပြီး QueueFull ရမယ်"""
+    release = threading.Event()
+    writer = BatchWriter(lambda batch: release.wait(), 'test', batch_size=1, flush_interval=0.01, max_queue=1)
+
+    writer.put('first')
+    with pytest.raises(QueueFull):
+        for _ in range(10):
+            writer.put('next', timeout=0)
+
+    release.set()
+    writer.close()
+    assert writer.get_stats()['rejected'] == 1
+
+
+def test_failed_flush_is_retried():
+    attempts = []
+
+    def flaky(batch):
+        attempts.append(batch)
+        if len(attempts) == 1:
+            raise RuntimeError('database is down')
+
+    writer = BatchWriter(flaky, 'test', flush_interval=0.01, max_retries=3)
+    writer._flush(['a'])
+
+    assert attempts == [['a'], ['a']]
+    assert writer.get_stats()['flushed'] == 1
+
+
+def test_dropped_batch_calls_on_drop():
+    """Retries ကုန်သွားရင် batch ကို on_drop ဆီ ပေးမယ်"""
+    dropped = []
+
+    def failing(batch):
+        raise RuntimeError('database is down')
+
+    writer = BatchWriter(failing, 'test', max_retries=1, on_drop=dropped.append)
+    writer._flush(['a', 'b'])
+
+    assert dropped == [['a', 'b']]
+    assert writer.get_stats()['failed'] == 2
+
+
+def test_closed_writer_refuses_items():
+    writer = BatchWriter(lambda batch: None, 'test', flush_interval=0.01)
+    writer.close()
+
+    with pytest.raises(QueueFull):
+        writer.put('late')
@@ -0,0 +1,62 @@
+# tests/test_broadcaster.py
+import pytest
+
+from broadcaster import Broadcaster, Subscriber, TooManySubscribers
+from post_store import PostStore
+
+
+class BrokenSubscriber(Subscriber):
+    def put(self, rows):
+        raise RuntimeError('Event loop is closed')
+
+
+def test_publish_drops_failing_subscriber_and_keeps_fanning_out(tmp_path):
+    """Subscriber တစ်ခု put မှာ error တက်လည်း ကျန်တဲ့ subscribers တွေ rows ရရမယ်"""
+    broadcaster = Broadcaster(PostStore(str(tmp_path / 'posts.db')), max_buffer=10)
+    broken, healthy = BrokenSubscriber(10), Subscriber(10)
+    broadcaster._subscribers.update([broken, healthy])
+
+    broadcaster.publish([{'id': 1}])
+
+    assert healthy.get(0) == [{'id': 1}]
+    assert broadcaster._subscribers == {healthy}
+
+
+def test_subscribe_limit_frees_slot_on_unsubscribe(tmp_path):
+    """Limit ပြည့်ရင် TooManySubscribers - client ထွက်သွားရင် slot ပြန်ရမယ်"""
+    broadcaster = Broadcaster(PostStore(str(tmp_path / 'posts.db')), max_buffer=10)
+    first = broadcaster.subscribe(limit=2)
+    broadcaster.subscribe(limit=2)
+    with pytest.raises(TooManySubscribers):
+        broadcaster.subscribe(limit=2)
+
+    broadcaster.unsubscribe(first)
+    broadcaster.subscribe(limit=2)
+    assert broadcaster.subscriber_count() == 2
+
+
+def test_stream_cap_returns_503_and_closed_streams_give_slots_back(monkeypatch):
+    """gthread mode: cap ကျော်ရင် 503၊ disconnect / overflow ဖြစ်တဲ့ stream က slot ပြန်ပေးမယ်"""
+    from app import app, broadcaster, config
+
+    monkeypatch.setattr(config, 'SSE_MAX_STREAMS', broadcaster.subscriber_count() + 1)
+    client = app.test_client()
+
+    # Client disconnect (response close) ဖြစ်ရင် slot ပြန်ရမယ်
+    stream = client.get('/api/posts/stream', buffered=False)
+    assert stream.status_code == 200
+    busy = client.get('/api/posts/stream')
+    assert busy.status_code == 503
+    assert busy.headers['Retry-After']
+    stream.close()
+
+    # နှေးလို့ overflow ဖြစ်တဲ့ client ကို stream ပိတ်ပြီး slot ပြန်ပေးမယ်
+    stream = client.get('/api/posts/stream', buffered=False)
+    assert stream.status_code == 200
+    chunks = stream.response
+    assert next(chunks).startswith(b'retry:')
+    broadcaster.publish([{'version': 0}] * (broadcaster.max_buffer + 1))
+    assert list(chunks) == []
+    stream = client.get('/api/posts/stream', buffered=False)
+    assert stream.status_code == 200
+    stream.close()
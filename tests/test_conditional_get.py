@@ -0,0 +1,74 @@
+# tests/test_conditional_get.py
+import pytest
+
+from app import app, post_store
+from ingest import write_batch
+
+
+def post(message_id, content, edit_date=None):
+    return {'message_id': message_id, 'channel_id': -300, 'message_type': 'text', 'content': content,
+            'date': 1700000000 + message_id, 'edit_date': edit_date}
+
+
+@pytest.fixture
+def client():
+    write_batch([post(701, 'first')])
+    return app.test_client()
+
+
+def test_unchanged_store_returns_304(client):
+    response = client.get('/api/posts')
+    etag = response.headers['ETag']
+
+    again = client.get('/api/posts', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert again.status_code == 304
+    assert again.headers['ETag'] == etag
+    assert again.data == b''
+
+
+def test_weak_etag_from_compressed_response_matches(client):
+    """Proxy/compression က W/ ထည့်ပြန်လာလည်း 304 ရမယ်"""
+    etag = client.get('/api/posts').headers['ETag'].removeprefix('W/')
+
+    assert client.get('/api/posts', headers={'If-None-Match': f'W/{etag}'}).status_code == 304
+
+
+def test_new_post_changes_etag(client):
+    etag = client.get('/api/posts').headers['ETag']
+    write_batch([post(702, 'second')])
+
+    response = client.get('/api/posts', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_since_returns_only_new_and_edited_posts(client):
+    """since=<version> က နောက်ပိုင်း အသစ်/ပြင်ထားတဲ့ posts တွေပဲ ပြန်ပေးမယ်"""
+    version = client.get('/api/posts').get_json()['version']
+    write_batch([post(703, 'third'), post(701, 'first edited', edit_date=1700009999)])
+
+    delta = client.get(f'/api/posts?since={version}').get_json()
+
+    assert sorted(item['post_description'] for item in delta['posts']) == ['first edited', 'third']
+    assert delta['version'] == post_store.get_version()[0]
+    assert delta['has_more'] is False
+    assert client.get(f"/api/posts?since={delta['version']}").get_json()['posts'] == []
+
+
+def test_since_pages_through_large_deltas(client):
+    version = client.get('/api/posts').get_json()['version']
+    write_batch([post(message_id, f'bulk {message_id}') for message_id in range(710, 715)])
+
+    first = client.get(f'/api/posts?since={version}&limit=3').get_json()
+    rest = client.get(f"/api/posts?since={first['version']}&limit=3").get_json()
+
+    assert first['has_more'] is True
+    assert [item['telegram_message_id'] for item in first['posts'] + rest['posts']] == list(range(710, 715))
+    assert rest['has_more'] is False
+
+
+def test_since_cannot_be_combined_with_tag(client):
+    assert client.get('/api/posts?since=1&tag=news').status_code == 400
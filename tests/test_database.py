@@ -0,0 +1,135 @@
+# tests/test_database.py
+"""ConnectionPool / Database.connect - Postgres မလိုဘဲ fake psycopg connections နဲ့ စစ်မယ်"""
+import types
+
+import psycopg
+import pytest
+from psycopg.pq import TransactionStatus
+
+import database
+from database import ConnectionPool, Database, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.info = types.SimpleNamespace(transaction_status=TransactionStatus.IDLE)
+        self.commits = 0
+        self.rollbacks = 0
+
+    def execute(self, query):
+        if self.broken:
+            raise psycopg.OperationalError('server closed the connection')
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = TransactionStatus.IDLE
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """psycopg.connect အစား FakeConnection ပြန်ပေးပြီး ဖွင့်ခဲ့တဲ့ connections အားလုံး မှတ်မယ်"""
+    connections = []
+
+    def connect(conninfo):
+        conn = FakeConnection()
+        connections.append(conn)
+        return conn
+
+    monkeypatch.setattr(database.psycopg, 'connect', connect)
+    return connections
+
+
+def test_pool_reuses_returned_connections(opened):
+    pool = ConnectionPool('fake', min_size=1, max_size=2)
+
+    with pool.connection() as conn:
+        pass
+    with pool.connection() as again:
+        pass
+
+    assert conn is again
+    assert conn.commits == 2
+    assert len(opened) == 1
+    assert pool.get_stats()['checkouts'] == 2
+
+
+def test_pool_times_out_when_exhausted(opened):
+    pool = ConnectionPool('fake', min_size=0, max_size=1, timeout=0.05)
+    conn = pool.getconn()
+
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+
+    pool.putconn(conn)
+    assert pool.getconn() is conn
+    assert pool.get_stats()['checkout_timeouts'] == 1
+
+
+def test_pool_replaces_dropped_connections(opened):
+    pool = ConnectionPool('fake', min_size=1, max_size=1, check_interval=0)
+    opened[0].broken = True
+
+    conn = pool.getconn()
+
+    assert conn is opened[1]
+    assert opened[0].closed
+    assert pool.get_stats()['connections_lost'] == 1
+
+
+def test_connection_rolls_back_on_error(opened):
+    pool = ConnectionPool('fake', min_size=1, max_size=1)
+
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            conn.info.transaction_status = TransactionStatus.INTRANS
+            raise ValueError('boom')
+
+    assert conn.rollbacks == 1
+    assert conn.commits == 0
+    assert pool.get_stats()['pool_available'] == 1
+
+
+def test_pool_closes_opened_connections_when_warmup_fails(monkeypatch, opened):
+    connect = database.psycopg.connect
+
+    def flaky_connect(conninfo):
+        if len(opened) == 2:
+            raise psycopg.OperationalError('too many connections')
+        return connect(conninfo)
+
+    monkeypatch.setattr(database.psycopg, 'connect', flaky_connect)
+
+    with pytest.raises(psycopg.OperationalError):
+        ConnectionPool('fake', min_size=3, max_size=3)
+
+    assert len(opened) == 2
+    assert all(conn.closed for conn in opened)
+
+
+def test_connect_closes_pool_when_migration_fails(monkeypatch, opened):
+    """Migration fail ရင် pool ကို ပိတ်ပြီးမှ raise - retry တိုင်း connections မပေါက်ကျန်ရဘူး"""
+    monkeypatch.setattr(database.config, 'DATABASE_URL', 'fake')
+    monkeypatch.setattr(database.config, 'DB_AUTO_MIGRATE', True)
+    monkeypatch.setattr(database.config, 'DB_POOL_MIN_SIZE', 2)
+
+    def failing_migrate(self, pool):
+        raise psycopg.OperationalError('lock timeout')
+
+    monkeypatch.setattr(Database, '_migrate', failing_migrate)
+    db = Database()
+
+    for _ in range(2):
+        with pytest.raises(psycopg.OperationalError):
+            db.connect()
+
+    assert len(opened) == 4
+    assert all(conn.closed for conn in opened)
+    assert db._pool is None
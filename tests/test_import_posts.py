@@ -0,0 +1,45 @@
+# tests/test_import_posts.py
+import json
+
+import import_posts
+
+
+def export_message(message_id, text, date=1700000000, **extra):
+    message = {'id': message_id, 'type': 'message', 'text': text, **extra}
+    if date is not None:
+        message['date_unixtime'] = str(date)
+    return message
+
+
+def write_export(path, messages):
+    with open(path, 'w') as f:
+        json.dump({'name': 'Channel', 'id': 1234, 'messages': messages}, f)
+
+
+def test_export_post_sets_content_only():
+    """Media post ရဲ့ caption ကို content တစ်ခုတည်းမှာ သိမ်းမယ် (re-import မှာ content နှစ်ခါ မဖြစ်အောင်)"""
+    photo = import_posts.export_post(export_message(1, 'Sunset #travel', photo='photos/1.jpg'), -1001234)
+    text = import_posts.export_post(export_message(2, 'Hello'), -1001234)
+
+    assert photo['message_type'] == 'photo'
+    assert photo['content'] == 'Sunset #travel'
+    assert 'caption' not in photo
+    assert text['content'] == 'Hello'
+    assert 'caption' not in text
+
+
+def test_undated_records_are_skipped_not_fatal(tmp_path, monkeypatch):
+    """Date မပါတဲ့ record ကို ရေတွက်ပြီး ကျော်မယ် - ကျန်တဲ့ posts တွေ import ဆက်လုပ်ရမယ်"""
+    written = []
+    monkeypatch.setattr(import_posts, 'get_writer', lambda target: lambda batch: written.extend(batch) or len(batch))
+    export = tmp_path / 'result.json'
+    write_export(export, [export_message(1, 'one'), export_message(2, 'two', date=None), export_message(3, 'three')])
+
+    result = import_posts.run_import(str(export), target='postgres', batch_size=2)
+
+    assert [post['message_id'] for post in written] == [1, 3]
+    assert result['imported'] == 2
+    assert result['records'] == 3
+    assert result['skipped'] == 1
+    checkpoint = json.loads((tmp_path / 'result.json.checkpoint').read_text())
+    assert checkpoint['skipped'] == 1
@@ -0,0 +1,39 @@
+# tests/test_ingest.py
+import pytest
+
+import ingest
+
+
+def post(message_id, update_id):
+    return {'message_id': message_id, 'channel_id': -100, 'message_type': 'text', 'content': 'hi',
+            'date': 1700000000 + message_id, 'edit_date': None, 'update_id': update_id}
+
+
+@pytest.fixture
+def failing_postgres(monkeypatch):
+    monkeypatch.setattr(ingest.config, 'DATABASE_URL', 'postgresql://unused')
+    monkeypatch.setattr(ingest.db, 'save_channel_posts', lambda posts: 0)
+
+
+def test_postgres_failure_leaves_store_and_clients_untouched(failing_postgres, monkeypatch):
+    """Postgres မရေးနိုင်ရင် store ထဲ မထည့်ဘူး၊ SSE clients ကိုလည်း မနှိုးဘူး"""
+    notified = []
+    monkeypatch.setattr(ingest.broadcaster, 'notify', lambda: notified.append(True))
+    version = ingest.post_store.get_version()[0]
+
+    with pytest.raises(RuntimeError):
+        ingest.write_batch([post(9001, 77001)])
+
+    assert ingest.post_store.get_version()[0] == version
+    assert not ingest.post_store.has_update(77001)
+    assert notified == []
+
+
+def test_dropped_batch_releases_update_ids(failing_postgres, monkeypatch):
+    """Drop လုပ်လိုက်တဲ့ batch ရဲ့ update_id ကို Telegram ပြန်ပို့ရင် လက်ခံရမယ်"""
+    monkeypatch.setattr(ingest.ingest_queue, 'max_retries', 1)
+    assert ingest.recent_updates.claim(77002)
+
+    ingest.ingest_queue._flush([post(9002, 77002)])
+
+    assert ingest.recent_updates.claim(77002)
@@ -0,0 +1,108 @@
+# tests/test_media_cache.py
+import io
+import os
+import time
+
+import pytest
+
+import media_cache
+from ingest import extract_media
+from media_cache import MediaCache, MediaNotFound, copy_limited
+
+
+class StubDownloader:
+    """Telegram အစား bytes တွေ ရေးပေးမယ် - fetch အကြိမ်ရေ မှတ်ထားမယ်"""
+
+    def __init__(self, files):
+        self.files = files
+        self.fetched = []
+
+    def fetch(self, file_id, dest):
+        self.fetched.append(file_id)
+        if file_id not in self.files:
+            raise MediaNotFound(file_id)
+        with open(dest, 'wb') as f:
+            f.write(self.files[file_id])
+
+
+def age(path, seconds):
+    """LRU order ကို atime နဲ့ မှတ်တာမို့ file ကို seconds အရင်က သုံးခဲ့သလို လုပ်မယ်"""
+    stat = os.stat(path)
+    os.utime(path, (time.time() - seconds, stat.st_mtime))
+
+
+def test_cache_hit_does_not_download_again(tmp_path):
+    downloader = StubDownloader({'a': b'x' * 10})
+    cache = MediaCache(str(tmp_path), downloader, max_bytes=1000)
+
+    assert cache.get('a') == cache.get('a')
+    assert downloader.fetched == ['a']
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_evicts_least_recently_used_below_max_bytes(tmp_path):
+    downloader = StubDownloader({name: b'x' * 40 for name in 'abc'})
+    cache = MediaCache(str(tmp_path), downloader, max_bytes=100)
+    a, b = cache.get('a'), cache.get('b')
+    age(a, 300)
+    age(b, 600)
+
+    cache.get('c')
+
+    # 120 bytes > 100 → 90 bytes အောက်ရောက်တဲ့အထိ atime အဟောင်းဆုံး (b) ကနေ ဖျက်မယ်
+    assert os.path.exists(a) and not os.path.exists(b)
+    assert cache.get_stats()['bytes'] == 80
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_download_larger_than_limit_is_rejected():
+    with pytest.raises(ValueError):
+        copy_limited(io.BytesIO(b'x' * 11), io.BytesIO(), max_bytes=10)
+    assert copy_limited(io.BytesIO(b'x' * 10), io.BytesIO(), max_bytes=10) == 10
+
+
+def test_files_over_bot_api_limit_get_no_media_url():
+    """Bot API က 20MB ကျော် files တွေကို download မပေးလို့ media_url မပို့ဘူး"""
+    small = extract_media({'video': {'file_id': 'small', 'file_size': 1024}})
+    big = extract_media({'video': {'file_id': 'big', 'file_size': 21 * 1024 * 1024}})
+
+    assert small['media_url'] == '/media/small'
+    assert big['file_id'] == 'big' and big['media_url'] is None
+
+
+def test_disallowed_file_id_is_not_downloaded(tmp_path):
+    downloader = StubDownloader({'a': b'x'})
+    cache = MediaCache(str(tmp_path), downloader, max_bytes=100, is_allowed=lambda file_id: False)
+
+    with pytest.raises(MediaNotFound):
+        cache.get('a')
+    assert downloader.fetched == []
+
+
+def test_thumbnail_is_generated_once_and_bounded(tmp_path):
+    Image = pytest.importorskip('PIL.Image')
+    original = io.BytesIO()
+    Image.new('RGB', (1000, 500), 'red').save(original, 'PNG')
+    downloader = StubDownloader({'photo': original.getvalue()})
+    cache = MediaCache(str(tmp_path), downloader, max_bytes=10 ** 7, thumb_size=100)
+
+    path = cache.thumbnail('photo')
+
+    assert path != cache.get('photo') and cache.thumbnail('photo') == path
+    with Image.open(path) as thumb:
+        assert thumb.format == 'JPEG' and thumb.size == (100, 50)
+    assert downloader.fetched == ['photo']
+
+
+def test_thumbnail_falls_back_to_original(tmp_path, monkeypatch):
+    downloader = StubDownloader({'video': b'\x00\x00\x00\x18ftypmp42'})
+    cache = MediaCache(str(tmp_path), downloader, max_bytes=1000)
+
+    # Image မဟုတ်တဲ့ file
+    if cache.supports_thumbnails:
+        assert cache.thumbnail('video') == cache.get('video')
+
+    # Pillow မရှိရင် original ပြန်ပေးပြီး API က thumbnail_url မပို့ဘူး
+    monkeypatch.setattr(media_cache, 'Image', None)
+    assert cache.thumbnail('video') == cache.get('video')
+    assert not cache.supports_thumbnails
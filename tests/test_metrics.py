@@ -0,0 +1,62 @@
+# tests/test_metrics.py
+import json
+import os
+import runpy
+import subprocess
+import sys
+
+from metrics import Metrics
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+def write_worker_snapshot(directory, pid, requests):
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"metrics-{pid}.json"), 'w') as f:
+        json.dump({'pid': pid, 'counters': [['http_requests_total', [], requests]],
+                   'histograms': [], 'gauges': [['ingest_queue_depth', [], 1]]}, f)
+
+
+def test_render_sums_live_workers_only_and_removes_dead_snapshots(tmp_path):
+    directory = str(tmp_path)
+    metrics = Metrics(directory)
+    metrics.inc('http_requests_total', 2)
+    write_worker_snapshot(directory, os.getppid(), 3)
+    pid = dead_pid()
+    write_worker_snapshot(directory, pid, 100)
+
+    text = metrics.render()
+
+    assert 'http_requests_total 5\n' in text
+    assert 'ingest_queue_depth 1\n' in text
+    assert not os.path.exists(os.path.join(directory, f"metrics-{pid}.json"))
+
+
+def test_exiting_worker_removes_its_snapshot(tmp_path):
+    directory = str(tmp_path)
+    metrics = Metrics(directory)
+    metrics.inc('http_requests_total')
+    metrics.write_snapshot()
+    path = os.path.join(directory, f"metrics-{os.getpid()}.json")
+    assert os.path.exists(path)
+
+    metrics.close()
+    metrics.write_snapshot()
+
+    assert not os.path.exists(path)
+
+
+def test_child_exit_hook_marks_worker_dead(tmp_path, monkeypatch):
+    import metrics as metrics_module
+
+    hooks = runpy.run_path(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'gunicorn.conf.py'))
+    monkeypatch.setattr(metrics_module.metrics, 'directory', str(tmp_path))
+    write_worker_snapshot(str(tmp_path), 4242, 1)
+
+    hooks['child_exit'](None, type('Worker', (), {'pid': 4242}))
+
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,86 @@
+# tests/test_pagination.py
+from datetime import datetime
+
+import pytest
+
+from pagination import InvalidCursor, decode_cursor, encode_cursor, paginate
+from post_store import PostStore
+
+
+def post(message_id, content, date=1700000000):
+    return {'message_id': message_id, 'channel_id': -100, 'message_type': 'text',
+            'content': content, 'date': date, 'edit_date': None}
+
+
+def walk(store, limit, tag=None):
+    """Cursor တွေ လိုက်ပြီး pages အားလုံးက post_ids တွေ ယူမယ်"""
+    seen, cursor = [], None
+    while True:
+        rows, next_cursor = paginate(store.get_posts(limit + 1, cursor and decode_cursor(cursor), tag), limit)
+        seen.extend(row['post_id'] for row in rows)
+        if next_cursor is None:
+            return seen
+        cursor = next_cursor
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(datetime(2024, 1, 2, 3, 4, 5), 42)
+
+    assert decode_cursor(cursor) == ('2024-01-02T03:04:05', 42)
+    assert '=' not in cursor
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', encode_cursor(5, 1), encode_cursor('2024-01-01', '1'), '@@'])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+
+def test_paginate_returns_cursor_only_when_more_rows_exist():
+    rows = [{'date': '2024-01-03', 'id': 3}, {'date': '2024-01-02', 'id': 2}, {'date': '2024-01-01', 'id': 1}]
+
+    assert paginate(rows, 3) == (rows, None)
+    page, cursor = paginate(rows, 2)
+    assert page == rows[:2]
+    assert decode_cursor(cursor) == ('2024-01-02', 2)
+
+
+def test_keyset_walk_has_no_gaps_or_duplicates_with_equal_dates(tmp_path):
+    """Date တူတဲ့ posts တွေ page boundary မှာ ကျလည်း id နဲ့ ခွဲပြီး တစ်ခါစီပဲ ပြမယ်"""
+    store = PostStore(str(tmp_path / 'posts.db'))
+    store.save_posts([post(message_id, f'post {message_id}', 1700000000 + message_id // 3)
+                      for message_id in range(1, 11)])
+
+    seen = walk(store, 4)
+
+    assert sorted(seen) == list(range(1, 11))
+    assert len(seen) == len(set(seen))
+
+
+def test_new_posts_do_not_shift_later_pages(tmp_path):
+    """Page တွေကြား post အသစ်ရောက်လာလည်း offset လို rows ရွှေ့မသွားဘူး"""
+    store = PostStore(str(tmp_path / 'posts.db'))
+    store.save_posts([post(message_id, f'post {message_id}', 1700000000 + message_id) for message_id in range(1, 7)])
+
+    rows, cursor = paginate(store.get_posts(4, None), 3)
+    store.save_posts([post(100, 'newest', 1700001000)])
+    rest, _ = paginate(store.get_posts(4, decode_cursor(cursor)), 3)
+
+    assert [row['post_id'] for row in rows] == [6, 5, 4]
+    assert [row['post_id'] for row in rest] == [3, 2, 1]
+
+
+def test_tag_pages_follow_the_tag_index(tmp_path):
+    store = PostStore(str(tmp_path / 'posts.db'))
+    store.save_posts([post(message_id, f'post {message_id}' + (' #even' if message_id % 2 == 0 else ''),
+                           1700000000 + message_id) for message_id in range(1, 11)])
+
+    assert walk(store, 2, 'even') == [10, 8, 6, 4, 2]
+
+
+def test_api_rejects_invalid_cursor():
+    from app import app
+
+    response = app.test_client().get('/api/posts?cursor=garbage')
+
+    assert response.status_code == 400
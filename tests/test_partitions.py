@@ -0,0 +1,184 @@
+# tests/test_partitions.py
+"""channel_posts partition archive - Postgres မလိုဘဲ scripted fake connection နဲ့ စစ်မယ်"""
+import gzip
+import json
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pytest
+
+import database
+from database import Database, add_months, month_start, partition_name
+from import_posts import iter_jsonl
+
+
+def archived_row(row_id, post_id, message_type='text'):
+    return {'id': row_id, 'post_id': post_id, 'channel_id': -100, 'message_type': message_type,
+            'content': f'post {post_id}', 'caption': '', 'media_url': None, 'file_id': None,
+            'file_size': None, 'width': None, 'height': None, 'views': 0,
+            'date': datetime(2024, 1, post_id), 'created_at': None, 'updated_at': None, 'edit_date': None}
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.itersize = None
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        text = query if isinstance(query, str) else query.as_string(None)
+        self.conn.executed.append(' '.join(text.split()))
+        self._rows = next((rows for pattern, rows in self.conn.responses if pattern in text), [])
+
+    def executemany(self, query, params):
+        self.conn.executed.append(' '.join(query.split()))
+        self.conn.params.append(list(params))
+
+    def fetchone(self):
+        return self._rows[0]
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class FakeConnection:
+    """SQL text ထဲမှာ pattern ပါရင် သတ်မှတ်ထားတဲ့ rows ပြန်ပေးမယ် - executed statements တွေ မှတ်ထားမယ်"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.executed = []
+        self.params = []
+
+    def cursor(self, name=None, row_factory=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def ran(self, fragment):
+        return [statement for statement in self.executed if fragment in statement]
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @contextmanager
+    def connection(self):
+        yield self.conn
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = Database()
+    monkeypatch.setattr(Database, '_ensure_partitions', lambda self, months, pool=None: None)
+    return db
+
+
+def use_connection(monkeypatch, conn):
+    monkeypatch.setattr(Database, 'pool', property(lambda self: FakePool(conn)))
+
+
+def partition_responses(rows, is_partition=True):
+    return [
+        ('relispartition', [(is_partition,)]),
+        ('MIN(id)', [(rows[0]['id'], rows[-1]['id'])]),
+        ('COUNT(*)', [('text', date(2024, 1, 1), len(rows))]),
+        ('SELECT * FROM', rows),
+    ]
+
+
+def test_month_helpers_cross_year_boundaries():
+    assert month_start(datetime(2024, 3, 17, 12, 30)) == datetime(2024, 3, 1)
+    assert add_months(datetime(2024, 11, 1), 3) == datetime(2025, 2, 1)
+    assert add_months(datetime(2024, 1, 1), -1) == datetime(2023, 12, 1)
+    assert partition_name(datetime(2026, 1, 1)) == 'channel_posts_p202601'
+
+
+def test_only_partitions_ending_before_cutoff_are_archivable(db):
+    conn = FakeConnection([('pg_class', [('channel_posts_p202312',), ('channel_posts_p202401',),
+                                         ('channel_posts_p202402',)])])
+
+    names = db._archivable_partitions(conn, datetime(2024, 2, 1))
+
+    assert names == ['channel_posts_p202312', 'channel_posts_p202401']
+
+
+def test_archive_detaches_exports_then_drops(db, tmp_path):
+    """Detach → jsonl.gz (import_posts နဲ့ ပြန်ဖတ်လို့ရ) → counters နုတ် → drop အစဉ်အတိုင်း"""
+    rows = [archived_row(11, 1), archived_row(12, 2)]
+    conn = FakeConnection(partition_responses(rows))
+
+    result = db._archive_partition(conn, 'channel_posts_p202401', str(tmp_path))
+
+    path = tmp_path / 'channel_posts_p202401-11-12.jsonl.gz'
+    assert result == {'partition': 'channel_posts_p202401', 'posts': 2, 'path': str(path)}
+    assert not (tmp_path / 'channel_posts_p202401-11-12.jsonl.gz.tmp').exists()
+    with gzip.open(path, 'rt') as f:
+        records = [json.loads(line) for line in f]
+    assert [record['message_id'] for record in records] == [1, 2]
+    assert [post['content'] for _, post in iter_jsonl(str(path))] == ['post 1', 'post 2']
+
+    detach = conn.executed.index(conn.ran('DETACH PARTITION')[0])
+    drop = conn.executed.index(conn.ran('DROP TABLE "channel_posts_p202401"')[0])
+    assert detach < drop
+    assert conn.ran('UPDATE post_stats SET total_posts = total_posts - %s')
+    assert conn.params[0] == [('text', -2)]
+
+
+def test_existing_archive_file_is_not_exported_again(db, tmp_path):
+    """Drop မတိုင်ခင် crash ဖြစ်ခဲ့ရင် နောက် run က export ထပ်မလုပ်ဘဲ drop ပဲ ဆက်လုပ်မယ်"""
+    rows = [archived_row(11, 1)]
+    conn = FakeConnection(partition_responses(rows, is_partition=False))
+    existing = tmp_path / 'channel_posts_p202401-11-11.jsonl.gz'
+    existing.write_bytes(b'already exported')
+
+    db._archive_partition(conn, 'channel_posts_p202401', str(tmp_path))
+
+    assert existing.read_bytes() == b'already exported'
+    assert not conn.ran('DETACH PARTITION')
+    assert not conn.ran('ORDER BY date, id')
+    assert conn.ran('DROP TABLE')
+
+
+def test_maintenance_skips_archive_without_the_lock(db, monkeypatch, tmp_path):
+    conn = FakeConnection([('pg_try_advisory_lock', [(False,)])])
+    use_connection(monkeypatch, conn)
+
+    assert db.maintain_partitions(archive_after_months=3, archive_dir=str(tmp_path)) == []
+    assert not conn.ran('pg_class')
+    assert not conn.ran('pg_advisory_unlock')
+
+
+def test_maintenance_archives_old_partitions_and_releases_the_lock(db, monkeypatch, tmp_path):
+    archived = []
+    conn = FakeConnection([('pg_try_advisory_lock', [(True,)])])
+    use_connection(monkeypatch, conn)
+    monkeypatch.setattr(Database, '_archivable_partitions', lambda self, conn, cutoff: ['channel_posts_p202401'])
+    monkeypatch.setattr(Database, '_archive_partition',
+                        lambda self, conn, name, archive_dir: archived.append(name) or {'partition': name})
+
+    result = db.maintain_partitions(archive_after_months=3, archive_dir=str(tmp_path))
+
+    assert result == [{'partition': 'channel_posts_p202401'}]
+    assert archived == ['channel_posts_p202401']
+    assert conn.ran('pg_advisory_unlock')
+
+
+def test_archive_is_disabled_by_default(db, monkeypatch):
+    monkeypatch.setattr(database.config, 'DB_ARCHIVE_AFTER_MONTHS', 0)
+    use_connection(monkeypatch, FakeConnection([]))
+
+    assert db.maintain_partitions() == []
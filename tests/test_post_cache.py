@@ -0,0 +1,42 @@
+# tests/test_post_cache.py
+import pytest
+
+from app import app, config, parse_post_key, post_store
+from ingest import write_batch
+
+
+def post(channel_id, content, edit_date=None):
+    return {'message_id': 601, 'channel_id': channel_id, 'message_type': 'text', 'content': content,
+            'date': 1700000601, 'edit_date': edit_date}
+
+
+@pytest.fixture
+def client():
+    write_batch([post(-100, 'channel a'), post(-200, 'channel b')])
+    return app.test_client()
+
+
+def test_parse_post_key(monkeypatch):
+    monkeypatch.setattr(config, 'CHANNEL_ID', '-100')
+    assert parse_post_key('-200:601') == (-200, 601)
+    assert parse_post_key('601') == (-100, 601)
+    assert parse_post_key('abc') is None
+
+
+def test_single_post_is_keyed_by_channel_and_message_id(client, monkeypatch):
+    monkeypatch.setattr(config, 'CHANNEL_ID', '-100')
+
+    assert client.get('/api/posts/-200:601').get_json()['post_description'] == 'channel b'
+    assert client.get('/api/posts/-100:601').get_json()['post_description'] == 'channel a'
+    assert client.get('/api/posts/601').get_json()['id'] == '-100:601'
+    assert client.get('/api/posts/-300:601').status_code == 404
+
+
+def test_edit_invalidates_only_its_own_channel(client):
+    assert client.get('/api/posts/-200:601').get_json()['post_description'] == 'channel b'
+    assert client.get('/api/posts/-100:601').get_json()['post_description'] == 'channel a'
+
+    write_batch([post(-200, 'channel b edited', edit_date=1700009999)])
+
+    assert client.get('/api/posts/-200:601').get_json()['post_description'] == 'channel b edited'
+    assert post_store.get_post(-100, 601)['content'] == 'channel a'
@@ -0,0 +1,44 @@
+# tests/test_post_store.py
+from post_store import PostStore
+
+
+def post(message_id, content, edit_date=None):
+    return {'message_id': message_id, 'channel_id': -100, 'message_type': 'text',
+            'content': content, 'date': 1700000000 + message_id, 'edit_date': edit_date}
+
+
+def test_insert_and_edit_in_one_batch_keeps_only_new_tags(tmp_path):
+    """Batch တစ်ခုထဲ insert ပြီး edit ရင် tag အဟောင်းနဲ့ မချိတ်ရဘူး"""
+    store = PostStore(str(tmp_path / 'posts.db'))
+    store.save_posts([post(2, 'a #news')])
+    store.save_posts([post(1, 'b #old #news'), post(1, 'b #Fresh', edit_date=1700001000)])
+
+    assert store.get_posts(10, None, 'old') == []
+    assert [row['post_id'] for row in store.get_posts(10, None, 'fresh')] == [1]
+    assert {tag['name']: tag['count'] for tag in store.get_tags()} == {'news': 1, 'fresh': 1}
+
+
+def test_search_index_drops_rows_deleted_by_retention(tmp_path):
+    """Retention က ဖျက်တဲ့ posts တွေ index ထဲ မကျန်ရဘူး"""
+    from search_index import InvertedIndex
+
+    store = PostStore(str(tmp_path / 'posts.db'), max_posts=3)
+    index = InvertedIndex(store)
+    store.save_posts([post(message_id, f'hello {message_id}') for message_id in range(1, 4)])
+    assert index.search('hello')[1] == 3
+
+    store.save_posts([post(message_id, f'hello {message_id}') for message_id in range(4, 8)])
+    rows, total = index.search('hello')
+    assert total == 3
+    assert sorted(row['post_id'] for row in rows) == [5, 6, 7]
+    assert len(index._doc_keys) == 3
+
+
+def test_get_post_is_scoped_to_its_channel(tmp_path):
+    """Channel နှစ်ခုမှာ message_id တူရင် တစ်ခုနဲ့တစ်ခု မမှားရဘူး"""
+    store = PostStore(str(tmp_path / 'posts.db'))
+    store.save_posts([post(1, 'first channel'), {**post(1, 'second channel'), 'channel_id': -200}])
+
+    assert store.get_post(-100, 1)['content'] == 'first channel'
+    assert store.get_post(-200, 1)['content'] == 'second channel'
+    assert store.get_post(-300, 1) is None
@@ -0,0 +1,136 @@
+# tests/test_read_cache.py
+import threading
+import time
+
+from read_cache import ReadThroughCache
+
+
+class SlowLoader:
+    """release() မခေါ်မချင်း ပိတ်ဆို့နေမယ့် loader - ခေါ်တဲ့ keys တွေ မှတ်ထားမယ်"""
+
+    def __init__(self, value='value', error=None):
+        self.calls = []
+        self.value = value
+        self.error = error
+        self.started = threading.Event()
+        self._release = threading.Event()
+
+    def __call__(self, key):
+        self.calls.append(key)
+        self.started.set()
+        self._release.wait(5)
+        if self.error:
+            raise self.error
+        return f"{self.value}:{key}"
+
+    def release(self):
+        self._release.set()
+
+
+def load_concurrently(cache, key, count):
+    results = [None] * count
+
+    def worker(index):
+        try:
+            results[index] = cache.get(key)
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def wait_for_waiters(cache, count):
+    deadline = time.monotonic() + 5
+    while cache.get_stats()['coalesced'] < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_concurrent_misses_call_loader_once():
+    """Key တူ requests တပြိုင်နက် ရောက်ရင် loader ကို တစ်ခါပဲ ခေါ်မယ်"""
+    loader = SlowLoader()
+    cache = ReadThroughCache(loader, max_entries=10, ttl=60, negative_ttl=60)
+
+    threads, results = load_concurrently(cache, 'k', 8)
+    wait_for_waiters(cache, 7)
+    loader.release()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == ['k']
+    assert results == ['value:k'] * 8
+    assert cache.get('k') == 'value:k'
+    stats = cache.get_stats()
+    assert (stats['misses'], stats['coalesced'], stats['hits']) == (1, 7, 1)
+
+
+def test_loader_error_reaches_waiters_and_is_not_cached():
+    loader = SlowLoader(error=RuntimeError('database is down'))
+    cache = ReadThroughCache(loader, max_entries=10, ttl=60, negative_ttl=60)
+
+    threads, results = load_concurrently(cache, 'k', 3)
+    wait_for_waiters(cache, 2)
+    loader.release()
+    for thread in threads:
+        thread.join()
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_invalidate_during_load_drops_stale_value():
+    """Write က load လုပ်နေတုန်း ရောက်လာရင် value ဟောင်းကို caller ပဲ ရမယ်၊ cache ထဲ မသိမ်းဘူး"""
+    loader = SlowLoader()
+    cache = ReadThroughCache(loader, max_entries=10, ttl=60, negative_ttl=60)
+
+    threads, results = load_concurrently(cache, 'k', 1)
+    assert loader.started.wait(5)
+    cache.invalidate(['k'])
+    loader.release()
+    threads[0].join()
+
+    assert results == ['value:k']
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_missing_keys_are_cached_negatively():
+    calls = []
+    cache = ReadThroughCache(lambda key: calls.append(key), max_entries=10, ttl=60, negative_ttl=60)
+
+    assert cache.get('missing') is None
+    assert cache.get('missing') is None
+
+    assert calls == ['missing']
+    assert cache.get_stats()['negative_hits'] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    calls = []
+
+    def loader(key):
+        calls.append(key)
+        return key
+
+    cache = ReadThroughCache(loader, max_entries=2, ttl=60, negative_ttl=60)
+    cache.get('a')
+    cache.get('b')
+    cache.get('a')
+    cache.get('c')
+
+    cache.get('a')
+    cache.get('b')
+
+    assert calls == ['a', 'b', 'c', 'b']
+    assert cache.get_stats()['evictions'] == 2
+
+
+def test_zero_ttl_disables_caching():
+    calls = []
+    cache = ReadThroughCache(lambda key: calls.append(key) or key, max_entries=10, ttl=0, negative_ttl=0)
+
+    cache.get('a')
+    cache.get('a')
+
+    assert calls == ['a', 'a']
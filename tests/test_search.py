@@ -0,0 +1,37 @@
+# tests/test_search.py
+from datetime import datetime
+
+import pytest
+
+import app as app_module
+from app import app, post_store
+
+
+@pytest.fixture
+def client():
+    post_store.save_posts([{'message_id': 501, 'channel_id': -100, 'message_type': 'text',
+                            'content': 'zebra crossing', 'date': 1700000501}])
+    return app.test_client()
+
+
+def test_fallback_search_uses_stable_post_ids(client):
+    body = client.get('/api/search?q=zebra').get_json()
+
+    assert body['total'] == 1
+    assert [post['id'] for post in body['posts']] == ['-100:501']
+    assert body['posts'][0]['telegram_message_id'] == 501
+
+
+def test_postgres_search_returns_the_same_ids_as_the_store(client, monkeypatch):
+    """Postgres row id နဲ့ store row id ကွဲလည်း frontend ကို ပို့တဲ့ id တူရမယ်"""
+    row = {'id': 987654, 'post_id': 501, 'channel_id': -100, 'message_type': 'text',
+           'content': 'zebra crossing', 'date': datetime.fromtimestamp(1700000501),
+           'created_at': datetime.now()}
+    monkeypatch.setattr(app_module.config, 'DATABASE_URL', 'postgresql://unused')
+    monkeypatch.setattr(app_module.db, 'search_channel_posts', lambda query, limit, offset: ([row], 1))
+
+    searched = client.get('/api/search?q=zebra').get_json()['posts']
+    listed = [post for post in client.get('/api/posts').get_json()['posts'] if post['id'] == '-100:501']
+
+    assert [post['id'] for post in searched] == [post['id'] for post in listed] == ['-100:501']
+    assert searched[0]['date'] == listed[0]['date']
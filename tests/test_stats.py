@@ -0,0 +1,29 @@
+# tests/test_stats.py
+from datetime import datetime
+
+import app as app_module
+from app import app
+
+
+def test_stats_read_postgres_totals_when_configured(monkeypatch):
+    """Post store ရဲ့ retention cap နဲ့ မဆိုင်ဘဲ Postgres lifetime totals ကို ပြရမယ်"""
+    monkeypatch.setattr(app_module.config, 'DATABASE_URL', 'postgresql://unused')
+    monkeypatch.setattr(app_module.db, 'get_stats', lambda: {
+        'total_posts': 25000, 'type_counts': {'photo': 20000, 'text': 5000},
+        'latest_post': datetime(2026, 10, 1, 12, 30), 'today_posts': 3
+    })
+
+    stats = app.test_client().get('/api/stats').get_json()
+
+    assert stats['total_posts'] == 25000
+    assert stats['type_counts'] == {'photo': 20000, 'text': 5000}
+    assert stats['latest_post'] == '2026-10-01T12:30:00'
+    assert stats['today_posts'] == 3
+
+
+def test_stats_read_post_store_without_postgres(monkeypatch):
+    monkeypatch.setattr(app_module.db, 'get_stats', lambda: 1 / 0)
+
+    stats = app.test_client().get('/api/stats').get_json()
+
+    assert stats['total_posts'] == app_module.post_store.count()
@@ -0,0 +1,67 @@
+# tests/test_user_cache.py
+import time
+
+from user_cache import UserUpsertCache
+
+
+def make_cache(saved, **kwargs):
+    def flush(rows):
+        saved.extend(rows)
+        return True
+    return UserUpsertCache(flush, ttl=60, max_size=100, batch_size=10, flush_interval=0.01, **kwargs)
+
+
+def wait_for(saved, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while len(saved) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_unchanged_profile_is_upserted_once():
+    saved = []
+    cache = make_cache(saved)
+
+    assert cache.touch(1, 'alice', 'Alice', None) is True
+    assert cache.touch(1, 'alice', 'Alice', None) is False
+    cache.close()
+
+    assert saved == [(1, 'alice', 'Alice', None)]
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_changed_profile_is_upserted_again():
+    saved = []
+    cache = make_cache(saved)
+
+    cache.touch(1, 'alice', 'Alice', None)
+    wait_for(saved, 1)
+    assert cache.touch(1, 'alice', 'Alice', 'Smith') is True
+    cache.close()
+
+    assert saved == [(1, 'alice', 'Alice', None), (1, 'alice', 'Alice', 'Smith')]
+
+
+def test_equal_hashes_do_not_hide_a_profile_change():
+    """Hash တူလည်း profile မတူရင် upsert လုပ်ရမယ်"""
+    class SameHash(str):
+        def __hash__(self):
+            return 0
+
+    saved = []
+    cache = make_cache(saved)
+    cache.touch(1, SameHash('alice'), 'Alice', None)
+    wait_for(saved, 1)
+
+    assert cache.touch(1, SameHash('alice2'), 'Alice', None) is True
+    cache.close()
+    assert [row[1] for row in saved] == ['alice', 'alice2']
+
+
+def test_failed_upsert_forgets_the_user():
+    cache = UserUpsertCache(lambda rows: False, ttl=60, max_size=100, batch_size=10, flush_interval=0.01)
+    cache.writer.max_retries = 1
+
+    cache.touch(1, 'alice', 'Alice', None)
+    cache.close()
+
+    assert cache.touch(1, 'alice', 'Alice', None) is True
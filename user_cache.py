@@ -0,0 +1,78 @@
+# user_cache.py
+import threading
+import time
+from collections import OrderedDict
+
+from batching import BatchWriter, QueueFull
+from config import config
+
+
+class UserUpsertCache:
+    """မကြာခင်က တွေ့ခဲ့တဲ့ users (user_id → profile) ကို မှတ်ထားပြီး ပြောင်းသွားတဲ့ users ကိုပဲ batch လိုက် upsert လုပ်မယ်
+
+    Profile မပြောင်းတဲ့ user က TTL အတွင်း message ထပ်ပို့ရင် database ကို မထိဘူး။
+    """
+
+    def __init__(self, flush_fn, ttl=None, max_size=None, batch_size=None, flush_interval=None):
+        self.flush_fn = flush_fn
+        self.ttl = ttl or config.USER_CACHE_TTL
+        self.max_size = max_size or config.USER_CACHE_MAX_SIZE
+        self._entries = OrderedDict()  # user_id → (profile, expires_at)
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self.writer = BatchWriter(
+            self._flush,
+            name='user-upsert',
+            batch_size=batch_size or config.USER_UPSERT_BATCH_SIZE,
+            flush_interval=flush_interval or config.USER_UPSERT_FLUSH_INTERVAL,
+            max_queue=self.max_size
+        )
+
+    def touch(self, user_id, username, first_name, last_name):
+        """User ကို မှတ်မယ် - အသစ်/ပြောင်းသွားရင် upsert queue ထဲ ထည့်ပြီး True ပြန်မယ်"""
+        # Tuple ကိုယ်တိုင် သိမ်းပြီး နှိုင်းယှဉ်မယ် (hash collision ကြောင့် profile ပြောင်းတာ မလွတ်အောင်)
+        profile = (username, first_name, last_name)
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached is not None and cached[0] == profile and cached[1] > now:
+                self._entries.move_to_end(user_id)
+                self._stats['hits'] += 1
+                return False
+
+            self._stats['misses'] += 1
+            self._entries[user_id] = (profile, now + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+        try:
+            self.writer.put((user_id, *profile), timeout=0)
+        except QueueFull:
+            # နောက် message မှာ ပြန်ကြိုးစားနိုင်အောင် cache ထဲက ဖယ်မယ်
+            self._forget([user_id])
+        return True
+
+    def _flush(self, rows):
+        """Batch ထဲက user တစ်ယောက်ချင်းစီရဲ့ နောက်ဆုံး profile ကိုပဲ upsert လုပ်မယ်"""
+        latest = {row[0]: row for row in rows}
+        if not self.flush_fn(list(latest.values())):
+            # မရေးနိုင်ခဲ့ရင် cache ကနေ ဖယ်ထားမယ် (နောက် message မှာ ပြန်ထည့်မယ်)
+            self._forget(latest)
+            raise RuntimeError(f"Failed to upsert {len(latest)} users")
+
+    def _forget(self, user_ids):
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def close(self):
+        """Queue ထဲ ကျန်နေတဲ့ upserts တွေ flush လုပ်မယ်"""
+        self.writer.close()
+
+    def get_stats(self):
+        """Cache hit/miss counters နဲ့ upsert writer stats"""
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries), 'writer': self.writer.get_stats()}